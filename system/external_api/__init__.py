@@ -1,13 +1,58 @@
 import os
+from typing import Dict, List, Optional
 
 from external_api.data_sources import *
-from external_api.function_utils import MCP_FUNCTION_LIST_JSON_FILE, ToolResult, load_function_proxys
+from external_api.function_utils import (
+    ENV_FUNC_LIST_WATCH_INTERVAL,
+    MCP_FUNCTION_LIST_JSON_FILE,
+    FunctionCall,
+    FunctionListWatcher,
+    FunctionProxy,
+    ToolResult,
+    ToolResultChunk,
+    execute_batch,
+    load_function_proxys,
+)
+
+_FUNCTION_LIST_FILE = os.path.join(os.path.dirname(__file__), MCP_FUNCTION_LIST_JSON_FILE)
+_EXPORTS = ["ToolResult", "ToolResultChunk", "FunctionCall", "execute_batch", "watch_function_list"]
 
 proxies = {}
-_, proxies = load_function_proxys(os.path.join(os.path.dirname(__file__), MCP_FUNCTION_LIST_JSON_FILE))
+_, proxies = load_function_proxys(_FUNCTION_LIST_FILE)
 globals().update(proxies)
 
-__all__ = ["ToolResult"] + list(proxies.keys())
+__all__ = _EXPORTS + list(proxies.keys())
+
+_watcher: Optional[FunctionListWatcher] = None
+
+
+def _apply_function_list_change(changed: Dict[str, FunctionProxy], removed: List[str]) -> None:
+    global __all__
+    for name in removed:
+        # 只移除作为 FunctionProxy 安装的名字，同名的模块属性（如导出的函数）保留
+        if proxies.pop(name, None) is not None and isinstance(globals().get(name), FunctionProxy):
+            globals().pop(name)
+    proxies.update(changed)
+    globals().update(changed)
+    __all__ = _EXPORTS + list(proxies.keys())
+
+
+def watch_function_list(interval: float = 2.0) -> FunctionListWatcher:
+    """
+    开始轮询 mcp_function_list.json，新增或改变的函数热加载到本模块，被删除的函数从本模块移除；
+    设置环境变量 FUNC_LIST_WATCH_INTERVAL（秒）时导入即开始。已经开始时返回原来的 watcher
+
+    Args:
+        interval: 轮询间隔（秒）
+    """
+    global _watcher
+    if _watcher is None:
+        _watcher = FunctionListWatcher(_FUNCTION_LIST_FILE, _apply_function_list_change, interval).start()
+    return _watcher
+
+
+if os.environ.get(ENV_FUNC_LIST_WATCH_INTERVAL):
+    watch_function_list(float(os.environ[ENV_FUNC_LIST_WATCH_INTERVAL]))
 
 if __name__ == "__main__":
     print(__all__)
@@ -0,0 +1,6 @@
+"""
+external_api 的性能基准脚本
+
+在 system 目录下运行，例如:
+    python -m external_api.benchmarks.transport_bench
+"""
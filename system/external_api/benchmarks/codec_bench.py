@@ -0,0 +1,122 @@
+"""
+JSON 编解码基准
+
+对各个 JSON 后端（json / orjson / msgspec，未安装的跳过）测量大响应的解码与请求体的编码耗时。
+响应取自 payloads.py 的预置响应并放大到真实规模:
+- yahoo_fundamentals: get_financial_data / get_stock_info 使用的 get-fundamentals 响应，模块字段放大到 --modules 个
+- yahoo_chart: get_stock_price 的 K 线响应，--bars 根
+- booking_hotels: search_hotels_by_dest_name 的酒店列表，--hotels 家
+- function_request: FunctionProxy 发往 function server 的请求体（编码）
+
+运行:
+    cd system && python -m external_api.benchmarks.codec_bench
+    cd system && python -m external_api.benchmarks.codec_bench --hotels 2000 --bars 20000
+"""
+
+import argparse
+import copy
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from external_api.benchmarks.payloads import BOOKING_HOST, CANNED_RESPONSES, YAHOO_HOST
+from external_api.data_sources.codec import CODEC_JSON, CODEC_MSGSPEC, CODEC_NAME, CODEC_ORJSON, get_codec
+
+
+def _canned(host: str, path: str) -> Any:
+    for pattern, body in CANNED_RESPONSES[host]:
+        if pattern.rstrip("$").endswith(path):
+            return copy.deepcopy(body)
+    raise KeyError(f"{host}{path}")
+
+
+def build_payloads(modules: int, bars: int, hotels: int) -> Dict[str, Any]:
+    fundamentals = _canned(YAHOO_HOST, "/stock/get-fundamentals")
+    result = fundamentals["quoteSummary"]["result"][0]
+    for i in range(modules):
+        result[f"module{i}"] = {f"field{j}": {"raw": j * 1.5, "fmt": f"{j * 1.5:.2f}", "longFmt": f"{j * 1.5:,.4f}"} for j in range(40)}
+
+    chart = _canned(YAHOO_HOST, "/stock/v3/get-chart")
+    chart_result = chart["chart"]["result"][0]
+    chart_result["timestamp"] = [1704153600 + 86400 * i for i in range(bars)]
+    chart_result["indicators"]["quote"][0] = {
+        name: [180.0 + i * 0.01 for i in range(bars)] for name in ("open", "high", "low", "close")
+    }
+    chart_result["indicators"]["quote"][0]["volume"] = [50000000 + i for i in range(bars)]
+
+    booking = _canned(BOOKING_HOST, "/api/v1/hotels/searchHotels")
+    hotel = booking["data"]["hotels"][0]
+    booking["data"]["hotels"] = [{**copy.deepcopy(hotel), "hotel_id": hotel["hotel_id"] + i} for i in range(hotels)]
+
+    function_request = {
+        "request_id": "0b7f9a8e-6a44-4ad4-9a53-2f0e5a1d6b1c",
+        "function_name": "write_file",
+        "function_kind": "basic",
+        "caller_name": "planner",
+        "parameters": {"path": "/tmp/report.md", "content": "数据分析报告\n" * 2000},
+    }
+    return {
+        "yahoo_fundamentals": fundamentals,
+        "yahoo_chart": chart,
+        "booking_hotels": booking,
+        "function_request": function_request,
+    }
+
+
+def _time_per_call(fn: Callable[[], Any], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(payloads: Dict[str, Any], repeat: int) -> Tuple[List[str], Dict[str, Dict[str, Dict[str, float]]]]:
+    """
+    Returns:
+        Tuple[List[str], Dict]: (可用后端, {payload: {backend: {"bytes", "decode_us", "encode_us"}}})
+    """
+    codecs = {}
+    for name in (CODEC_JSON, CODEC_ORJSON, CODEC_MSGSPEC):
+        try:
+            codecs[name] = get_codec(name)
+        except ImportError:
+            continue
+
+    _, json_dumps = codecs[CODEC_JSON]
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for payload_name, payload in payloads.items():
+        raw = json_dumps(payload)
+        results[payload_name] = {}
+        for codec_name, (loads, dumps) in codecs.items():
+            assert loads(raw) == payload, f"{codec_name} does not round-trip {payload_name}"
+            results[payload_name][codec_name] = {
+                "bytes": len(raw),
+                "decode_us": _time_per_call(lambda: loads(raw), repeat) * 1e6,
+                "encode_us": _time_per_call(lambda: dumps(payload), repeat) * 1e6,
+            }
+    return list(codecs), results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="JSON codec benchmark on large data source payloads")
+    parser.add_argument("--modules", type=int, default=30, help="extra quoteSummary modules in the fundamentals payload")
+    parser.add_argument("--bars", type=int, default=5000, help="bars in the chart payload")
+    parser.add_argument("--hotels", type=int, default=500, help="hotels in the booking payload")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions, the fastest is reported")
+    args = parser.parse_args(argv)
+
+    backends, results = run(build_payloads(args.modules, args.bars, args.hotels), args.repeat)
+    print(f"backends: {', '.join(backends)} (active: {CODEC_NAME})")
+    print(f"{'payload':<20} {'size':>10} {'backend':<8} {'decode':>12} {'MB/s':>8} {'encode':>12} {'speedup (dec/enc)':>18}")
+    for payload_name, per_codec in results.items():
+        baseline = per_codec[CODEC_JSON]
+        for codec_name, r in per_codec.items():
+            mb_per_s = r["bytes"] / r["decode_us"] if r["decode_us"] else 0.0
+            print(
+                f"{payload_name:<20} {r['bytes'] / 1024:>7.1f} KB {codec_name:<8} {r['decode_us']:>9.1f} us {mb_per_s:>8.1f} "
+                f"{r['encode_us']:>9.1f} us {baseline['decode_us'] / r['decode_us']:>8.1f}x / {baseline['encode_us'] / r['encode_us']:.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
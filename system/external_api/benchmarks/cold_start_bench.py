@@ -0,0 +1,234 @@
+"""
+external_api 导入与冷启动基准
+
+每个场景在新的 Python 进程中运行多次，取中位数:
+- import: import external_api（包括解析 mcp_function_list.json 并创建 FunctionProxy）
+- get_client: 导入后 get_client()
+- first_call: 导入后 get_client() 并完成第一次数据源调用（请求发往本地代理替身）
+- load_function_proxys: 导入后加载包含 N 个函数的 function list
+
+同时记录进程 RSS，并用 -X importtime 统计各顶层包的导入耗时。
+指定 --check 时与基线比较，任一指标超过 基线 * (1 + tolerance) + slack 即以非零状态退出。
+基线与机器相关，更换 CI 机器后需要用 --write-baseline 重新录制
+
+运行:
+    cd system && python -m external_api.benchmarks.cold_start_bench --runs 7
+    cd system && python -m external_api.benchmarks.cold_start_bench --check external_api/benchmarks/cold_start_baseline.json
+    cd system && python -m external_api.benchmarks.cold_start_bench --write-baseline external_api/benchmarks/cold_start_baseline.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from external_api.benchmarks.mock_proxy import MockProxy
+
+DEFAULT_TOLERANCE = 0.3
+# 绝对余量，避免只有几毫秒的指标因为抖动误报
+DEFAULT_SLACK = 5.0
+
+# 子进程公共代码: 汇报耗时与 RSS
+CHILD_PRELUDE = """
+import json, os, resource, sys, time
+
+def report(start):
+    elapsed = time.perf_counter() - start
+    with open("/proc/self/statm") as f:
+        rss_pages = int(f.read().split()[1])
+    print(json.dumps({
+        "ms": elapsed * 1000,
+        "rss_mb": rss_pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+"""
+
+SCENARIOS: Dict[str, str] = {
+    "import": """
+start = time.perf_counter()
+import external_api
+report(start)
+""",
+    "get_client": """
+import external_api
+from external_api.data_sources.client import get_client
+start = time.perf_counter()
+get_client()
+report(start)
+""",
+    "first_call": """
+import asyncio
+import external_api
+from external_api.data_sources.client import get_client
+start = time.perf_counter()
+client = get_client()
+async def first_call():
+    await client.commodities.get_supported_commodities()
+    await client.close()
+asyncio.run(first_call())
+report(start)
+""",
+    "load_function_proxys": """
+import external_api
+from external_api.function_utils import load_function_proxys
+start = time.perf_counter()
+load_function_proxys(os.environ["BENCH_FUNCTION_LIST"])
+report(start)
+""",
+}
+
+
+def _child_env(extra: Dict[str, str]) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    env.update(extra)
+    return env
+
+
+def run_scenario(name: str, runs: int, env: Dict[str, str]) -> Dict[str, float]:
+    """
+    在新进程中运行场景 runs 次
+
+    Returns:
+        Dict[str, float]: 各指标的中位数，process_ms 为包括解释器启动在内的进程总耗时
+    """
+    samples: List[Dict[str, float]] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD_PRELUDE + SCENARIOS[name]],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        sample["process_ms"] = (time.perf_counter() - start) * 1000
+        samples.append(sample)
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def import_breakdown(env: Dict[str, str], top: int) -> List[Tuple[str, float]]:
+    """
+    使用 -X importtime 统计导入 external_api 并 get_client() 时各顶层包的导入耗时（self 时间之和）
+
+    Returns:
+        List[Tuple[str, float]]: [(顶层包, 毫秒)]，按耗时降序
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import external_api; from external_api.data_sources.client import get_client; get_client()"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stderr
+    totals: Dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        parts = name.strip().split(".")
+        # external_api 细分到子模块
+        package = ".".join(parts[:3]) if parts[0] == "external_api" else parts[0]
+        totals[package] += int(self_us) / 1000
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def write_function_list(count: int) -> str:
+    functions = [
+        {
+            "name": f"bench_function_{i}",
+            "parameters": [{"name": "query", "type": "string"}, {"name": "limit", "type": "integer"}],
+            "kind": "basic",
+        }
+        for i in range(count)
+    ]
+    fd, path = tempfile.mkstemp(prefix="function_list_", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(functions, f)
+    return path
+
+
+def flatten(results: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    return {f"{scenario}.{metric}": value for scenario, metrics in results.items() for metric, value in metrics.items()}
+
+
+def check_thresholds(metrics: Dict[str, float], baseline_file: str) -> List[str]:
+    """
+    与基线比较
+
+    Returns:
+        List[str]: 超出阈值的指标说明，为空表示通过
+    """
+    with open(baseline_file, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+    slack = baseline.get("slack", DEFAULT_SLACK)
+    failures = []
+    for key, limit in baseline["metrics"].items():
+        value = metrics.get(key)
+        if value is not None and value > limit * (1 + tolerance) + slack:
+            failures.append(f"{key}: {value:.1f} > {limit:.1f} * (1 + {tolerance}) + {slack}")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time and cold-start benchmark for external_api")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--functions", type=int, default=200, help="number of functions in the synthetic function list")
+    parser.add_argument("--top", type=int, default=15, help="number of packages shown in the import breakdown")
+    parser.add_argument("--check", default="", help="baseline JSON file, exit with status 1 on regressions")
+    parser.add_argument("--write-baseline", default="", help="write the measured medians as a new baseline")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    # 代理替身运行在后台线程中，供 first_call 场景的子进程访问
+    proxy_url, _ = MockProxy().start_in_thread()
+    function_list = write_function_list(args.functions)
+    env = _child_env({"LLM_GATEWAY_BASE_URL": proxy_url, "BENCH_FUNCTION_LIST": function_list})
+    try:
+        results = {name: run_scenario(name, args.runs, env) for name in SCENARIOS}
+        breakdown = import_breakdown(env, args.top)
+    finally:
+        os.remove(function_list)
+    metrics = flatten(results)
+
+    if args.json:
+        print(json.dumps({"metrics": metrics, "import_breakdown_ms": dict(breakdown)}, indent=2))
+    else:
+        print(f"runs={args.runs} functions={args.functions} (medians)")
+        print(f"{'scenario':<22} {'in-process':>12} {'process':>12} {'RSS':>10} {'max RSS':>10}")
+        for name, r in results.items():
+            print(f"{name:<22} {r['ms']:>9.1f} ms {r['process_ms']:>9.1f} ms {r['rss_mb']:>7.1f} MB {r['max_rss_mb']:>7.1f} MB")
+        print("\nimport time by package (self time, import external_api + get_client())")
+        for package, ms in breakdown:
+            print(f"  {package:<40} {ms:>8.1f} ms")
+
+    if args.write_baseline:
+        baseline = {
+            "tolerance": DEFAULT_TOLERANCE,
+            "slack": DEFAULT_SLACK,
+            "metrics": {key: round(value, 1) for key, value in metrics.items() if key.endswith((".ms", "rss_mb"))},
+        }
+        with open(args.write_baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"\nbaseline written to {args.write_baseline}")
+
+    if args.check:
+        failures = check_thresholds(metrics, args.check)
+        if failures:
+            print("\nREGRESSION:\n  " + "\n  ".join(failures))
+            return 1
+        print(f"\nall metrics within thresholds of {args.check}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+FunctionProxy 批量调用基准
+
+对本地 function server 替身比较同一组工具调用的三种执行方式:
+- sequential: 逐个 await proxy(...)，即 agent 依次发出工具调用
+- concurrent: asyncio.gather 并发逐个调用，每个调用一个 POST /execute
+- batch: execute_batch，一个 POST /execute_batch
+替身对每个 HTTP 请求固定等待 --latency 秒（模拟 function server 的请求处理与调度开销），
+工具本身的执行耗时为 --work 秒，批量请求中的工具并发执行。
+每轮调用 --calls 个工具，报告每轮耗时与平均每个调用的耗时；--socket 时经 Unix domain socket 访问
+
+运行:
+    cd system && python -m external_api.benchmarks.function_batch_bench
+    cd system && python -m external_api.benchmarks.function_batch_bench --calls 20 --latency 0.005 --socket
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from external_api.function_utils import FunctionCall, FunctionProxy, close_function_session_pools, execute_batch
+
+FUNCTION_INFO: Dict[str, Any] = {"name": "read_file", "parameters": [{"name": "path"}]}
+
+
+class MockFunctionServer:
+    """
+    function server 替身，/execute 与 /execute_batch 把参数原样作为 message 返回
+    """
+
+    def __init__(self, latency: float = 0.0, work: float = 0.0):
+        self.latency = latency
+        self.work = work
+        self.request_count = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _run_function(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if self.work > 0:
+            await asyncio.sleep(self.work)
+        return {"is_error": False, "message": json.dumps(request["parameters"], ensure_ascii=False)}
+
+    async def _handle_execute(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        body = await request.json()
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return web.json_response(await self._run_function(body))
+
+    async def _handle_execute_batch(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        body = await request.json()
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        results = await asyncio.gather(*(self._run_function(r) for r in body["requests"]))
+        return web.json_response({"results": results})
+
+    async def start(self, socket_path: str = "") -> int:
+        """
+        Returns:
+            int: TCP 端口，使用 Unix domain socket 时为 0
+        """
+        app = web.Application()
+        app.router.add_post("/execute", self._handle_execute)
+        app.router.add_post("/execute_batch", self._handle_execute_batch)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        if socket_path:
+            await web.UnixSite(self._runner, socket_path).start()
+            return 0
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        return self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def _sequential(proxy: FunctionProxy, calls: int) -> None:
+    for i in range(calls):
+        result = await proxy(f"/tmp/file{i}.txt")
+        assert not result.is_error, result.message
+
+
+async def _concurrent(proxy: FunctionProxy, calls: int) -> None:
+    results = await asyncio.gather(*(proxy(f"/tmp/file{i}.txt") for i in range(calls)))
+    assert not any(r.is_error for r in results), results
+
+
+async def _batch(proxy: FunctionProxy, calls: int) -> None:
+    results = await execute_batch([FunctionCall(proxy, (f"/tmp/file{i}.txt",)) for i in range(calls)])
+    assert [r.message for r in results] == [json.dumps({"path": f"/tmp/file{i}.txt"}) for i in range(calls)], results
+
+
+MODES = {"sequential": _sequential, "concurrent": _concurrent, "batch": _batch}
+
+
+async def run(calls: int, rounds: int, latency: float, work: float, use_socket: bool) -> Dict[str, Dict[str, float]]:
+    """
+    Returns:
+        Dict[str, Dict[str, float]]: {mode: {"round_ms", "per_call_ms", "requests_per_round"}}
+    """
+    socket_path = os.path.join(tempfile.mkdtemp(), "function.sock") if use_socket else ""
+    server = MockFunctionServer(latency=latency, work=work)
+    port = await server.start(socket_path)
+    proxy = FunctionProxy(FUNCTION_INFO)
+    proxy.socket_path = socket_path
+    proxy.server_port = port or proxy.server_port
+
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for mode, fn in MODES.items():
+            await fn(proxy, calls)  # 预热连接
+            server.request_count = 0
+            durations = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                await fn(proxy, calls)
+                durations.append(time.perf_counter() - start)
+            round_ms = statistics.median(durations) * 1000
+            results[mode] = {
+                "round_ms": round_ms,
+                "per_call_ms": round_ms / calls,
+                "requests_per_round": server.request_count / rounds,
+            }
+    finally:
+        await close_function_session_pools()
+        await server.stop()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="FunctionProxy batched execution benchmark against a local function server")
+    parser.add_argument("--calls", type=int, default=10, help="tool calls per round")
+    parser.add_argument("--rounds", type=int, default=20, help="rounds per mode, the median is reported")
+    parser.add_argument("--latency", type=float, default=0.002, help="server-side overhead per HTTP request (seconds)")
+    parser.add_argument("--work", type=float, default=0.0, help="execution time of each tool (seconds)")
+    parser.add_argument("--socket", action="store_true", help="connect through a Unix domain socket instead of TCP")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args.calls, args.rounds, args.latency, args.work, args.socket))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    transport = "unix socket" if args.socket else "tcp"
+    print(f"calls={args.calls} rounds={args.rounds} latency={args.latency}s work={args.work}s transport={transport}")
+    print(f"{'mode':<12} {'requests':>9} {'round':>11} {'per call':>11} {'vs sequential':>14}")
+    baseline = results["sequential"]["round_ms"]
+    for mode, r in results.items():
+        print(
+            f"{mode:<12} {r['requests_per_round']:>9.0f} {r['round_ms']:>8.2f} ms {r['per_call_ms']:>8.3f} ms "
+            f"{baseline / r['round_ms']:>13.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+数据源负载测试
+
+在后台线程中启动代理替身（MockProxy，按 X-Original-Host 返回 payloads.py 中的预置响应），将 ApiClient 指向它，
+对每个数据源的每个公开方法以固定并发发起 N 次调用，统计:
+- 吞吐（次/秒）与单次调用（请求 + 解析）的 p50 / p99 延迟
+- 失败次数: 抛出异常或返回 success=False
+- 内存: 每个方法另跑一轮并开启 tracemalloc，记录 Python 分配峰值；以及整个测试前后的进程 RSS
+
+测试期间关闭响应缓存与 singleflight，保证每次调用都到达代理。异步迭代器方法（如 iter_tweets）按完整消费一次计为一次调用
+
+运行:
+    cd system && python -m external_api.benchmarks.load_test --requests 200 --concurrency 20
+    cd system && python -m external_api.benchmarks.load_test --source yahoo_finance --latency 0.05 --jitter 0.02 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from external_api.benchmarks.mock_proxy import Fault, MockProxy
+from external_api.data_sources.ratelimit import RateLimit
+
+# 各方法的示例参数，键为 "source_name.method_name"，新增公开方法时需要在这里补充
+SAMPLE_CALLS: Dict[str, Dict[str, Any]] = {
+    "booking.search_flights": {"from_code": "BOM.AIRPORT", "to_code": "DEL.AIRPORT", "depart_date": "2025-06-01"},
+    "booking.search_hotel_details": {"hotel_id": "1377073", "arrival_date": "2025-06-01", "departure_date": "2025-06-03"},
+    "booking.search_hotels_by_dest_name": {"dest_name": "Paris", "arrival_date": "2025-06-01", "departure_date": "2025-06-03"},
+    "commodities.get_commodities_price": {"commodity_code": "XAU", "currency_code": "USD"},
+    "commodities.get_supported_commodities": {},
+    "metal.get_metal_price": {"currency_code": "USD"},
+    "patent.search_patents": {"query": "solid state battery"},
+    "pinterest.get_user_info": {"username": "interiors"},
+    "pinterest.search_pins": {"keyword": "living room"},
+    "scholar.iter_scholar": {"query": "large language models", "num_results": 20},
+    "scholar.search_scholar": {"query": "large language models", "num_results": 20},
+    "tripadvisor.get_location_details": {"locationId": 60763},
+    "tripadvisor.get_location_photos": {"locationId": 60763},
+    "tripadvisor.get_location_reviews": {"locationId": 60763},
+    "tripadvisor.search_locations": {"searchQuery": "New York"},
+    "tripadvisor.search_nearby_locations": {"latitude": 40.7128, "longitude": -74.006},
+    "twitter.get_user_info": {"username": "elonmusk"},
+    "twitter.get_user_tweets": {"username": "elonmusk"},
+    "twitter.iter_tweets": {"query": "AI", "max_items": 40},
+    "twitter.search_tweets": {"query": "AI", "limit": 20},
+    "yahoo_finance.get_financial_data": {"symbol": "AAPL"},
+    "yahoo_finance.get_multiple_stocks_price": {
+        "symbols": ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA"],
+        "start_date": "2024-01-01",
+        "end_date": "2024-02-01",
+    },
+    "yahoo_finance.get_stock_info": {"symbol": "AAPL"},
+    "yahoo_finance.get_stock_insights": {"symbol": "AAPL"},
+    "yahoo_finance.get_stock_news": {"symbol": "AAPL"},
+    "yahoo_finance.get_stock_price": {"symbol": "AAPL", "start_date": "2024-01-01", "end_date": "2024-02-01"},
+    "yahoo_finance.get_stock_statistics": {"symbol": "AAPL"},
+}
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        rss_pages = int(f.read().split()[1])
+    return rss_pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def _call_once(call: Callable[[], Any]) -> bool:
+    """
+    调用一次方法，返回是否成功
+    """
+    try:
+        result = call()
+        if inspect.isasyncgen(result):
+            async for _ in result:
+                pass
+            return True
+        result = await result
+    except Exception:
+        return False
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+async def _drive(call: Callable[[], Any], requests: int, concurrency: int) -> Dict[str, Any]:
+    """
+    以 concurrency 个并发 worker 调用 requests 次
+
+    Returns:
+        Dict[str, Any]: elapsed（秒）、latencies（秒，升序）与 errors
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            ok = await _call_once(call)
+            latencies.append(time.perf_counter() - start)
+            if not ok:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter() - start
+    return {"elapsed": elapsed, "latencies": sorted(latencies), "errors": errors}
+
+
+async def run_method(
+    call: Callable[[], Any], requests: int, concurrency: int, warmup: int, memory_requests: int
+) -> Dict[str, float]:
+    """
+    压测一个方法
+
+    Returns:
+        Dict[str, float]: requests / errors / rps / p50_ms / p99_ms / peak_kb
+    """
+    if warmup > 0:
+        await _drive(call, warmup, concurrency)
+
+    run = await _drive(call, requests, concurrency)
+    latencies = run["latencies"]
+
+    peak_kb = 0.0
+    if memory_requests > 0:
+        tracemalloc.start()
+        try:
+            await _drive(call, memory_requests, concurrency)
+            peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "requests": requests,
+        "errors": run["errors"],
+        "rps": requests / run["elapsed"] if run["elapsed"] > 0 else 0.0,
+        "p50_ms": _percentile(latencies, 0.5) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "peak_kb": peak_kb,
+    }
+
+
+def _select_methods(client: Any, sources: List[str], methods: List[str]) -> List[str]:
+    selected = []
+    for source_name in client._get_source_names():
+        if sources and source_name not in sources:
+            continue
+        source = client._get_source(source_name)
+        for entry in type(source)._get_capability_index():
+            key = f"{source_name}.{entry.name}"
+            if methods and entry.name not in methods and key not in methods:
+                continue
+            selected.append(key)
+    return selected
+
+
+async def run_load_test(client: Any, keys: List[str], args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for key in keys:
+            if key not in SAMPLE_CALLS:
+                continue
+            source_name, method_name = key.split(".", 1)
+            method = getattr(getattr(client, source_name), method_name)
+            kwargs = SAMPLE_CALLS[key]
+            results[key] = await run_method(
+                lambda: method(**kwargs),
+                args.requests,
+                args.concurrency,
+                args.warmup,
+                min(args.requests, args.memory_requests),
+            )
+    finally:
+        await client.close()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline load test for every public data source method")
+    parser.add_argument("--requests", type=int, default=200, help="calls per method")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=5, help="untimed calls per method before measuring")
+    parser.add_argument("--memory-requests", type=int, default=50, help="calls per method in the tracemalloc pass, 0 to skip")
+    parser.add_argument("--source", action="append", default=[], help="only test this source (repeatable)")
+    parser.add_argument("--method", action="append", default=[], help="only test this method or source.method (repeatable)")
+    parser.add_argument("--latency", type=float, default=0.0, help="injected fixed latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="injected random extra latency in seconds")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="fraction of requests delayed by an extra --tail-latency")
+    parser.add_argument("--tail-latency", type=float, default=0.0)
+    parser.add_argument("--hedge", action="store_true", help="enable hedged requests")
+    parser.add_argument("--no-call-metrics", action="store_true", help="disable per-call metrics, to measure their overhead")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of an injected error response")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After seconds sent with injected errors")
+    parser.add_argument("--fault-host", action="append", default=[], help="only inject faults for this X-Original-Host (repeatable)")
+    parser.add_argument("--rate-limit", default="", help="per-host rate limit as RATE[:BURST] requests per second, default: unlimited")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--log-level", default="CRITICAL", help="log level of the data sources, injected errors are logged at ERROR")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level)
+    fault = Fault(args.latency, args.jitter, args.error_rate, args.error_status, args.retry_after, args.tail_rate, args.tail_latency)
+    if args.fault_host:
+        proxy = MockProxy(faults={host: fault for host in args.fault_host}, seed=args.seed)
+    else:
+        proxy = MockProxy(default_fault=fault, seed=args.seed)
+    proxy_url, proxy_loop = proxy.start_in_thread()
+
+    from external_api.data_sources import client as client_module
+
+    client_module.config["external_api_proxy_url"] = f"{proxy_url}/llm/external-api"
+    client_module.config["response_cache_maxsize"] = 0
+    client_module.config["singleflight_enabled"] = False
+    client_module.config["hedging_enabled"] = args.hedge
+    client_module.config["call_metrics_enabled"] = not args.no_call_metrics
+    if args.rate_limit:
+        client_module.config["rate_limit_default"] = RateLimit(*(float(value) for value in args.rate_limit.split(":")))
+    client = client_module.get_client()
+
+    keys = _select_methods(client, args.source, args.method)
+    skipped = [key for key in keys if key not in SAMPLE_CALLS]
+    rss_before = _rss_mb()
+    try:
+        results = asyncio.run(run_load_test(client, keys, args))
+    finally:
+        asyncio.run_coroutine_threadsafe(proxy.stop(), proxy_loop).result()
+        proxy_loop.call_soon_threadsafe(proxy_loop.stop)
+    rss_after = _rss_mb()
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "methods": results,
+                    "skipped": skipped,
+                    "rss_mb": {"before": rss_before, "after": rss_after},
+                    "rate_limits": client.get_rate_limit_stats(),
+                    "circuit_breakers": client.get_circuit_breaker_stats(),
+                    "hedging": client.get_hedge_stats(),
+                    "calls": client.get_call_metrics(),
+                    "proxy": {"requests": proxy.request_count, "injected_errors": proxy.error_count, "by_host": dict(proxy.requests_by_host)},
+                },
+                indent=2,
+            )
+        )
+        return 0
+
+    print(f"requests={args.requests} concurrency={args.concurrency} fault={fault}")
+    print(f"{'method':<44} {'errors':>7} {'req/s':>9} {'p50':>10} {'p99':>10} {'peak mem':>11}")
+    for key, r in results.items():
+        print(
+            f"{key:<44} {r['errors']:>7.0f} {r['rps']:>9.1f} {r['p50_ms']:>7.2f} ms {r['p99_ms']:>7.2f} ms {r['peak_kb']:>8.1f} KB"
+        )
+    if skipped:
+        print(f"\nskipped (no sample arguments in SAMPLE_CALLS): {', '.join(skipped)}")
+    print(f"\nRSS {rss_before:.1f} MB -> {rss_after:.1f} MB")
+    print(f"proxy: {proxy.request_count} requests, {proxy.error_count} injected errors")
+    for host, count in proxy.requests_by_host.most_common():
+        print(f"  {host or '(no X-Original-Host)':<44} {count:>8}")
+    for key, stats in client.get_hedge_stats().items():
+        print(f"hedging {key}: {stats['hedged']}/{stats['requests']} hedged, {stats['hedge_wins']} won, {stats['skipped']} over budget")
+    call_metrics = client.get_call_metrics()
+    if call_metrics:
+        print(f"\n{'call metrics':<44} {'calls':>7} {'errors':>7} {'upstream':>9} {'avg':>10} {'out/call':>10} {'in/call':>10}")
+        for key, stats in call_metrics.items():
+            calls = stats["calls"]
+            print(
+                f"{key:<44} {calls:>7} {stats['errors']:>7} {stats['requests']:>9} {stats['latency']['avg'] * 1000:>7.2f} ms "
+                f"{stats['bytes_out'] / calls:>7.0f} B {stats['bytes_in'] / calls / 1024:>7.1f} KB"
+            )
+    rate_limits = client.get_rate_limit_stats()
+    if rate_limits:
+        print("rate limiter waits:")
+        for host, stats in rate_limits.items():
+            print(f"  {host:<44} {stats['waited']:>8} waited, avg {stats['avg_wait'] * 1000:.1f} ms, max {stats['max_wait'] * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
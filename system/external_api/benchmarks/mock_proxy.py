@@ -0,0 +1,263 @@
+"""
+本地 external-api 代理替身
+
+- MockProxy: 基于 aiohttp.web 的 HTTP/1.1 代理替身，可选 TLS。按 X-Original-Host 与路径返回 payloads.py 中的预置响应，
+  可以按 host 注入延迟、抖动与错误响应
+- H2MockProxy: 基于 h2 的 HTTP/2 (TLS + ALPN) 代理替身，对任意路径返回同一个 JSON 响应
+
+两者都统计请求数与建立的连接数
+"""
+
+import asyncio
+import json
+import os
+import random
+import re
+import ssl
+import subprocess
+import tempfile
+import threading
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+from aiohttp import web
+
+from external_api.benchmarks.payloads import CANNED_RESPONSES
+
+DEFAULT_PAYLOAD: Dict[str, Any] = {"success": True, "data": {"message": "ok"}}
+
+
+class Fault(NamedTuple):
+    """
+    注入到代理替身响应中的故障
+    """
+
+    latency: float = 0.0  # 固定延迟（秒）
+    jitter: float = 0.0  # 在固定延迟之上增加 [0, jitter) 的随机延迟（秒）
+    error_rate: float = 0.0  # 返回错误响应的概率
+    error_status: int = 503  # 错误响应的状态码
+    retry_after: Optional[float] = None  # 错误响应携带的 Retry-After（秒）
+    tail_rate: float = 0.0  # 额外增加 tail_latency 延迟的请求比例，模拟延迟长尾
+    tail_latency: float = 0.0
+
+
+def create_self_signed_cert(directory: Optional[str] = None) -> Tuple[str, str]:
+    """
+    使用 openssl 生成 localhost 的自签名证书
+
+    Args:
+        directory: 证书输出目录，为空时使用临时目录
+
+    Returns:
+        Tuple[str, str]: (证书路径, 私钥路径)
+    """
+    directory = directory or tempfile.mkdtemp(prefix="mock_proxy_")
+    cert_file = os.path.join(directory, "cert.pem")
+    key_file = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key_file, "-out", cert_file, "-days", "1",
+            "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert_file, key_file
+
+
+def create_server_ssl_context(cert_file: str, key_file: str, alpn: str) -> ssl.SSLContext:
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    context.set_alpn_protocols([alpn])
+    return context
+
+
+class MockProxy:
+    """
+    HTTP/1.1 代理替身
+
+    指定 payload 时对任意请求都返回 payload；否则按 X-Original-Host 与路径查找 routes（默认为 CANNED_RESPONSES），
+    未匹配的请求返回 DEFAULT_PAYLOAD
+
+    Args:
+        latency: 所有请求的固定延迟（秒），等价于 default_fault=Fault(latency=latency)
+        payload: 固定返回的 JSON 响应
+        routes: {host: [(路径正则, 响应)]}
+        faults: {host: Fault}，按 X-Original-Host 注入故障
+        default_fault: 未在 faults 中指定的 host 使用的故障
+        seed: 随机数种子，用于复现抖动与错误注入
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        payload: Optional[Dict[str, Any]] = None,
+        routes: Optional[Dict[str, List[Tuple[str, Any]]]] = None,
+        faults: Optional[Dict[str, Fault]] = None,
+        default_fault: Optional[Fault] = None,
+        seed: Optional[int] = None,
+    ):
+        self.payload = payload
+        self.faults = faults or {}
+        self.default_fault = default_fault or Fault(latency=latency)
+        self.request_count = 0
+        self.error_count = 0
+        self.requests_by_host: Counter = Counter()
+        self._routes: Dict[str, List[Tuple[Pattern[str], bytes]]] = {
+            host: [(re.compile(pattern), json.dumps(body).encode()) for pattern, body in host_routes]
+            for host, host_routes in (CANNED_RESPONSES if routes is None else routes).items()
+        }
+        self._default_body = json.dumps(payload or DEFAULT_PAYLOAD).encode()
+        self._random = random.Random(seed)
+        self._connections: set = set()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def latency(self) -> float:
+        return self.default_fault.latency
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._connections)
+
+    def _match(self, host: str, path: str) -> bytes:
+        if self.payload is None:
+            for pattern, body in self._routes.get(host, ()):
+                if pattern.search(path):
+                    return body
+        return self._default_body
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        self._connections.add(id(request.transport))
+        host = request.headers.get("X-Original-Host", "")
+        self.requests_by_host[host] += 1
+        fault = self.faults.get(host, self.default_fault)
+
+        delay = fault.latency + (self._random.random() * fault.jitter if fault.jitter > 0 else 0.0)
+        if fault.tail_rate > 0 and self._random.random() < fault.tail_rate:
+            delay += fault.tail_latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if fault.error_rate > 0 and self._random.random() < fault.error_rate:
+            self.error_count += 1
+            headers = {"Retry-After": f"{fault.retry_after:g}"} if fault.retry_after is not None else None
+            return web.json_response({"message": "injected error"}, status=fault.error_status, headers=headers)
+        return web.Response(body=self._match(host, request.path), content_type="application/json")
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, ssl_context: Optional[ssl.SSLContext] = None) -> str:
+        """
+        启动代理替身
+
+        Returns:
+            str: 代理地址，可直接作为 external_api_proxy_url 使用
+        """
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port, ssl_context=ssl_context)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        scheme = "https" if ssl_context else "http"
+        server_host = "localhost" if ssl_context else host
+        return f"{scheme}://{server_host}:{bound_port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, asyncio.AbstractEventLoop]:
+        """
+        在后台线程的事件循环中启动代理替身，避免与被测客户端争用同一个事件循环
+
+        Returns:
+            Tuple[str, asyncio.AbstractEventLoop]: (代理地址, 代理所在的事件循环)
+        """
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+        result: Dict[str, str] = {}
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            result["url"] = loop.run_until_complete(self.start(host, port))
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        started.wait()
+        return result["url"], loop
+
+
+class _H2Protocol(asyncio.Protocol):
+    def __init__(self, server: "H2MockProxy"):
+        import h2.config
+        import h2.connection
+
+        self.server = server
+        self.conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.transport: Optional[asyncio.Transport] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore
+        self.server.connection_count += 1
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())  # type: ignore
+
+    def data_received(self, data: bytes) -> None:
+        import h2.events
+
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.ensure_future(self._respond(event.stream_id))
+            elif isinstance(event, h2.events.ConnectionTerminated) and self.transport is not None:
+                self.transport.close()
+        if self.transport is not None:
+            self.transport.write(self.conn.data_to_send())
+
+    async def _respond(self, stream_id: int) -> None:
+        self.server.request_count += 1
+        if self.server.latency > 0:
+            await asyncio.sleep(self.server.latency)
+        if self.transport is None or self.transport.is_closing():
+            return
+        body = self.server.body
+        self.conn.send_headers(
+            stream_id,
+            [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))],
+        )
+        self.conn.send_data(stream_id, body, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.transport = None
+
+
+class H2MockProxy:
+    """
+    HTTP/2 代理替身，仅支持 TLS + ALPN h2，需要安装 h2
+    """
+
+    def __init__(self, latency: float = 0.0, payload: Optional[Dict[str, Any]] = None):
+        self.latency = latency
+        self.body = json.dumps(payload or DEFAULT_PAYLOAD).encode()
+        self.request_count = 0
+        self.connection_count = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, ssl_context: ssl.SSLContext, host: str = "127.0.0.1", port: int = 0) -> str:
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _H2Protocol(self), host, port, ssl=ssl_context)
+        bound_port = self._server.sockets[0].getsockname()[1]
+        return f"https://localhost:{bound_port}"
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -0,0 +1,287 @@
+"""
+解析结果模型（models.py）与 dict（records）的内存、速度对比
+
+对每类结果，从 JSON 解码得到的上游数据（与真实请求一样，每条数据都是独立的对象）解析出 --count 条结果，测量:
+- 内存: 保留全部解析结果时的内存占用（tracemalloc，不含上游数据本身），models 与 records 两种格式
+- 速度: 每条结果的解析耗时，models 为直接构造模型，records 为构造模型后 to_dict()（即数据源默认的返回格式）；
+  以及单独 to_dict() 的耗时
+同时校验 to_dict() 的结果与 records 格式完全一致
+
+结果种类:
+- tweets: TwitterSource._parse_tweet_with_ref，普通 / 回复 / 转推（带引用）/ 引用推文混合
+- pins: PinterestSource._parse_pins，一半带视频
+- hotels: BookingSource._parse_hotel_detail，每家酒店 --rooms 间房型
+- papers: ScholarSource._parse_papers
+
+运行:
+    cd system && python -m external_api.benchmarks.models_bench
+    cd system && python -m external_api.benchmarks.models_bench --count 20000 --rooms 20
+"""
+
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from external_api.data_sources import codec
+from external_api.data_sources.client import get_client
+
+
+def _twitter_user(index: int) -> Dict[str, Any]:
+    return {
+        "user_id": str(44196397 + index),
+        "username": f"user{index}",
+        "name": f"User {index}",
+        "creation_date": "Tue Jun 02 20:12:29 +0000 2009",
+        "description": f"Bio of user {index}",
+        "location": "Austin, TX",
+        "external_url": None,
+        "profile_pic_url": f"https://pbs.twimg.com/profile_images/{index}.jpg",
+        "profile_banner_url": f"https://pbs.twimg.com/profile_banners/{index}.jpg",
+        "follower_count": 1000 + index,
+        "following_count": 700,
+        "number_of_tweets": 40000,
+        "listed_count": 150,
+        "favourites_count": 50000,
+        "is_verified": False,
+        "is_blue_verified": index % 2 == 0,
+        "is_private": False,
+        "bot": False,
+    }
+
+
+def _tweet(index: int) -> Dict[str, Any]:
+    return {
+        "tweet_id": str(1800000000000000000 + index),
+        "creation_date": "Thu Mar 13 18:08:35 +0000 2025",
+        "text": f"Sample tweet {index} about AI and the future of autonomous agents",
+        "language": "en",
+        "media_url": [f"https://pbs.twimg.com/media/{index}.jpg"] if index % 3 == 0 else None,
+        "video_url": None,
+        "retweet_count": 10 * index,
+        "reply_count": index,
+        "favorite_count": 100 * index,
+        "quote_count": index % 7,
+        "views": 1000 * index,
+        "bookmark_count": index % 5,
+        "user": _twitter_user(index % 500),
+    }
+
+
+def build_tweets(count: int) -> List[Dict[str, Any]]:
+    tweets = []
+    for i in range(count):
+        tweet = _tweet(i)
+        kind = i % 4
+        if kind == 1:
+            tweet["in_reply_to_status_id"] = str(1700000000000000000 + i)
+        elif kind == 2:
+            tweet["retweet_tweet_id"] = str(1600000000000000000 + i)
+            tweet["retweet_status"] = {**_tweet(count + i), "quoted_status": _tweet(2 * count + i)}
+        elif kind == 3:
+            tweet["quoted_status_id"] = str(1500000000000000000 + i)
+            tweet["quoted_status"] = _tweet(3 * count + i)
+        tweets.append(tweet)
+    return tweets
+
+
+def build_pins(count: int) -> List[Dict[str, Any]]:
+    pins = []
+    for i in range(count):
+        pin = {
+            "id": str(1044483101891823678 + i),
+            "title": f"Modern living room {i}",
+            "description": "Minimal interior design with natural light",
+            "alt_text": "",
+            "auto_alt_text": "a living room with a sofa",
+            "images": {"orig": {"url": f"https://i.pinimg.com/originals/{i}.jpg"}},
+            "reaction_counts": {"1": i % 100},
+            "pinner": {
+                "id": str(1044483239327345678 + i % 200),
+                "image_large_url": f"https://i.pinimg.com/140x140/{i % 200}.jpg",
+                "follower_count": 1200,
+                "username": f"interiors{i % 200}",
+                "full_name": "Interiors",
+            },
+        }
+        if i % 2 == 0:
+            pin["videos"] = {
+                "video_list": {
+                    "V_HLSV4": {"url": f"https://v.pinimg.com/{i}.m3u8", "duration": 15000},
+                    "V_720P": {"url": f"https://v.pinimg.com/{i}.mp4", "duration": 15000},
+                }
+            }
+        pins.append(pin)
+    return pins
+
+
+def build_hotels(count: int, rooms: int) -> List[Dict[str, Any]]:
+    hotels = []
+    for i in range(count):
+        hotels.append(
+            {
+                "hotel_id": 1377073 + i,
+                "hotel_name": f"Hotel Sample {i}",
+                "url": f"https://www.booking.com/hotel/fr/sample-{i}.html",
+                "review_nr": 1532,
+                "raw_data": {"reviewScore": 8.6},
+                "arrival_date": "2025-04-26",
+                "departure_date": "2025-04-27",
+                "latitude": 48.8566,
+                "longitude": 2.3522,
+                "address": f"{i} Rue de Rivoli",
+                "city": "Paris",
+                "district": "1st arr.",
+                "countrycode": "fr",
+                "country_trans": "France",
+                "currency_code": "EUR",
+                "zip": "75001",
+                "timezone": "Europe/Paris",
+                "soldout": 0,
+                "available_rooms": 7,
+                "max_rooms_in_reservation": 7,
+                "average_room_size_for_ufi_m2": "14.07",
+                "is_family_friendly": 1,
+                "is_closed": 0,
+                "is_cash_accepted_check_enabled": 1,
+                "hotel_include_breakfast": 1,
+                "family_facilities": ["Family rooms"],
+                "facilities_block": {"facilities": [{"name": name} for name in ("Free WiFi", "Parking", "Bar", "Lift", "Non-smoking rooms")]},
+                "spoken_languages": ["en-gb", "fr"],
+                "hotel_important_information_with_codes": [{"phrase": "Check-in from 15:00"}, {"phrase": "Pets are not allowed"}],
+                "rooms": {
+                    str(137707301 + i * 100 + r): {
+                        "photos": [{"url_max1280": f"https://cf.bstatic.com/{i}/{r}/{p}.jpg"} for p in range(3)],
+                        "children_and_beds_text": {
+                            "allow_children": 1,
+                            "cribs_and_extra_beds": [{"text": "Cribs are available on request"}],
+                        },
+                        "description": "Double room with city view",
+                        "bed_configurations": [
+                            {"bed_types": [{"name_with_count": "1 large double bed", "description": "151-180 cm wide"}]}
+                        ],
+                    }
+                    for r in range(rooms)
+                },
+            }
+        )
+    return hotels
+
+
+def build_papers(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "title": f"Result {i}: a study of large language models",
+            "link": f"https://example.org/{i}",
+            "snippet": "Sample snippet describing the contribution of the paper",
+            "publicationInfo": "A Author, B Author - Journal of Examples, 2024",
+            "year": 2024,
+            "citedBy": i,
+            "pdfUrl": f"https://example.org/{i}.pdf",
+        }
+        for i in range(count)
+    ]
+
+
+def build_cases(count: int, rooms: int) -> Dict[str, Tuple[Callable[[Any], List[Any]], Any]]:
+    """
+    Returns:
+        Dict[str, Tuple[Callable, Any]]: {结果种类: (解析函数, 上游数据)}，解析函数返回模型列表
+    """
+    client = get_client()
+    twitter, pinterest, booking, scholar = client.twitter, client.pinterest, client.booking, client.scholar
+    hotel_count = max(1, count // 10)
+    # 经过一次 JSON 编解码，保证每条数据都是独立的对象
+    raw = codec.loads(
+        codec.dumps(
+            {
+                "tweets": build_tweets(count),
+                "pins": {"data": build_pins(count)},
+                "hotels": build_hotels(hotel_count, rooms),
+                "papers": {"organic": build_papers(count)},
+            }
+        )
+    )
+    return {
+        "tweets": (lambda data: [twitter._parse_tweet_with_ref(result) for result in data], raw["tweets"]),
+        "pins": (pinterest._parse_pins, raw["pins"]),
+        "hotels": (lambda data: [booking._parse_hotel_detail(hotel) for hotel in data], raw["hotels"]),
+        "papers": (scholar._parse_papers, raw["papers"]),
+    }
+
+
+def _retained_bytes(build: Callable[[], List[Any]]) -> Tuple[int, List[Any]]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, result
+
+
+def _time_per_call(fn: Callable[[], Any], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(cases: Dict[str, Tuple[Callable[[Any], List[Any]], Any]], repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Returns:
+        Dict[str, Dict[str, float]]: {结果种类: {items, records_bytes, models_bytes, records_us, models_us, to_dict_us}}，
+            bytes 为全部结果的内存占用，us 为每条结果的耗时
+    """
+    results = {}
+    for name, (parse, data) in cases.items():
+        records_bytes, records = _retained_bytes(lambda: [model.to_dict() for model in parse(data)])
+        models_bytes, models = _retained_bytes(lambda: parse(data))
+        assert [model.to_dict() for model in models] == records, f"to_dict() is not lossless for {name}"
+        assert codec.dumps([model.to_dict() for model in models]) == codec.dumps(records)
+        items = len(models)
+        del records
+
+        results[name] = {
+            "items": items,
+            "records_bytes": records_bytes,
+            "models_bytes": models_bytes,
+            "records_us": _time_per_call(lambda: [model.to_dict() for model in parse(data)], repeat) / items * 1e6,
+            "models_us": _time_per_call(lambda: parse(data), repeat) / items * 1e6,
+            "to_dict_us": _time_per_call(lambda: [model.to_dict() for model in models], repeat) / items * 1e6,
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Result model vs dict memory and speed benchmark")
+    parser.add_argument("--count", type=int, default=5000, help="tweets / pins / papers to parse, hotels are count / 10")
+    parser.add_argument("--rooms", type=int, default=10, help="rooms per hotel")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions, the fastest is reported")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(build_cases(args.count, args.rooms), args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(
+        f"{'result':<8} {'items':>6} {'records':>10} {'models':>10} {'saved':>6} "
+        f"{'parse records':>14} {'parse models':>13} {'to_dict':>10}"
+    )
+    for name, r in results.items():
+        saved = 1 - r["models_bytes"] / r["records_bytes"]
+        print(
+            f"{name:<8} {r['items']:>6} {r['records_bytes'] / r['items']:>6.0f} B/i {r['models_bytes'] / r['items']:>6.0f} B/i {saved:>6.0%} "
+            f"{r['records_us']:>11.2f} us {r['models_us']:>10.2f} us {r['to_dict_us']:>7.2f} us"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""
+代理替身返回的预置响应
+
+按 X-Original-Host 与请求路径组织，内容取自各上游接口的真实响应结构（字段有删减），
+足以让每个数据源方法走完正常的解析流程并返回 success
+
+HOST 与 data_sources.client.config 中的 *_base_url 保持一致；这里不导入 client，避免基准脚本为此付出导入开销
+"""
+
+from typing import Any, Dict, List, Tuple
+
+TWITTER_HOST = "twitter154.p.rapidapi.com"
+YAHOO_HOST = "apidojo-yahoo-finance-v1.p.rapidapi.com"
+BOOKING_HOST = "booking-com15.p.rapidapi.com"
+PINTEREST_HOST = "unofficial-pinterest-api.p.rapidapi.com"
+TRIPADVISOR_HOST = "api.content.tripadvisor.com"
+COMMODITIES_HOST = "commodities-apised.p.rapidapi.com"
+METAL_HOST = "live-gold-prices.p.rapidapi.com"
+SERPER_HOST = "google.serper.dev"
+
+_CHART_BARS = 20
+_CHART_START = 1704153600  # 2024-01-02 00:00:00 UTC
+
+_TWITTER_USER = {
+    "user_id": "44196397",
+    "username": "elonmusk",
+    "name": "Elon Musk",
+    "creation_date": "Tue Jun 02 20:12:29 +0000 2009",
+    "description": "",
+    "location": "",
+    "external_url": None,
+    "profile_pic_url": "https://pbs.twimg.com/profile_images/1.jpg",
+    "profile_banner_url": "https://pbs.twimg.com/profile_banners/1.jpg",
+    "follower_count": 180000000,
+    "following_count": 700,
+    "number_of_tweets": 40000,
+    "listed_count": 150000,
+    "favourites_count": 50000,
+    "is_verified": False,
+    "is_blue_verified": True,
+    "is_private": False,
+    "bot": False,
+}
+
+
+def _tweet(index: int) -> Dict[str, Any]:
+    return {
+        "tweet_id": str(1800000000000000000 + index),
+        "creation_date": "Thu Mar 13 18:08:35 +0000 2025",
+        "text": f"Sample tweet {index} about AI",
+        "language": "en",
+        "media_url": None,
+        "video_url": None,
+        "retweet_count": 10 * index,
+        "reply_count": index,
+        "favorite_count": 100 * index,
+        "quote_count": 0,
+        "views": 1000 * index,
+        "bookmark_count": 0,
+        "user": _TWITTER_USER,
+    }
+
+
+_TWEETS = [_tweet(i) for i in range(1, 21)]
+
+_PIN = {
+    "id": "1044483101891823678",
+    "title": "Modern living room",
+    "description": "Minimal interior design",
+    "alt_text": "",
+    "auto_alt_text": "a living room with a sofa",
+    "images": {"orig": {"url": "https://i.pinimg.com/originals/1.jpg"}},
+    "reaction_counts": {"1": 42},
+    "pinner": {
+        "id": "1044483239327345678",
+        "image_large_url": "https://i.pinimg.com/140x140/1.jpg",
+        "follower_count": 1200,
+        "username": "interiors",
+        "full_name": "Interiors",
+    },
+}
+
+_HOTEL = {
+    "hotel_id": 1377073,
+    "property": {
+        "name": "Hotel Sample",
+        "accuratePropertyClass": 4,
+        "reviewScore": 8.6,
+        "reviewCount": 1532,
+        "latitude": 48.8566,
+        "longitude": 2.3522,
+        "priceBreakdown": {"grossPrice": {"currency": "USD", "value": 245.5}},
+    },
+}
+
+_FLIGHT_LEG = {
+    "departureAirport": {"code": "BOM"},
+    "arrivalAirport": {"code": "DEL"},
+    "departureTime": "2025-06-01T08:00:00",
+    "arrivalTime": "2025-06-01T10:10:00",
+    "totalTime": 7800,
+    "flightInfo": {"carrierInfo": {"marketingCarrier": "AI"}, "flightNumber": 865},
+    "flightStops": [],
+}
+
+_LOCATION = {
+    "location_id": "60763",
+    "name": "New York City",
+    "address_obj": {"city": "New York City", "country": "United States", "address_string": "New York City, NY"},
+}
+
+_ORGANIC = [
+    {
+        "title": f"Result {i}",
+        "link": f"https://example.org/{i}",
+        "snippet": "Sample snippet",
+        "publicationInfo": "A Author - Journal, 2024",
+        "year": 2024,
+        "citedBy": i,
+        "pdfUrl": f"https://example.org/{i}.pdf",
+        "id": f"id{i}",
+        "priorityDate": "2020-01-01",
+        "filingDate": "2020-06-01",
+        "grantDate": "2022-01-01",
+        "inventor": "A Inventor",
+        "assignee": "Example Inc",
+        "publicationNumber": f"US{10000000 + i}B2",
+    }
+    for i in range(20)
+]
+
+# {host: [(路径正则, 响应)]}，路径正则匹配请求路径的结尾，按顺序取第一个匹配项
+CANNED_RESPONSES: Dict[str, List[Tuple[str, Any]]] = {
+    TWITTER_HOST: [
+        (r"/search/search$", {"results": _TWEETS, "continuation_token": "DAACCgACGRElM"}),
+        (r"/user/details$", _TWITTER_USER),
+        (r"/user/tweets$", {"results": _TWEETS[:10], "continuation_token": "DAACCgACGRElN"}),
+    ],
+    YAHOO_HOST: [
+        (
+            r"/stock/v3/get-chart$",
+            {
+                "chart": {
+                    "result": [
+                        {
+                            "timestamp": [_CHART_START + 86400 * i for i in range(_CHART_BARS)],
+                            "indicators": {
+                                "quote": [
+                                    {
+                                        "open": [180.0 + i for i in range(_CHART_BARS)],
+                                        "high": [182.0 + i for i in range(_CHART_BARS)],
+                                        "low": [179.0 + i for i in range(_CHART_BARS)],
+                                        "close": [181.0 + i for i in range(_CHART_BARS)],
+                                        "volume": [50000000 + i for i in range(_CHART_BARS)],
+                                    }
+                                ]
+                            },
+                        }
+                    ],
+                    "error": None,
+                }
+            },
+        ),
+        (
+            r"/news/v2/list$",
+            {
+                "data": {
+                    "main": {
+                        "stream": [
+                            {
+                                "content": {
+                                    "id": f"news-{i}",
+                                    "title": f"Market update {i}",
+                                    "pubDate": "2025-03-13T18:08:35Z",
+                                    "contentType": "STORY",
+                                    "clickThroughUrl": {"url": f"https://finance.yahoo.com/news/{i}.html"},
+                                    "provider": {"displayName": "Reuters"},
+                                    "thumbnail": {"resolutions": [{"tag": "original", "url": f"https://s.yimg.com/{i}.jpg"}]},
+                                    "finance": {"stockTickers": [{"symbol": "AAPL"}]},
+                                }
+                            }
+                            for i in range(10)
+                        ]
+                    }
+                }
+            },
+        ),
+        (
+            r"/stock/get-fundamentals$",
+            {
+                "quoteSummary": {
+                    "result": [
+                        {
+                            "summaryDetail": {
+                                "marketCap": {"raw": 3.4e12},
+                                "trailingPE": {"raw": 33.1},
+                                "forwardPE": {"raw": 29.5},
+                                "dividendYield": {"raw": 0.0044},
+                                "beta": {"raw": 1.24},
+                                "fiftyTwoWeekLow": {"raw": 164.08},
+                                "fiftyTwoWeekHigh": {"raw": 260.1},
+                                "fiftyDayAverage": {"raw": 235.2},
+                                "twoHundredDayAverage": {"raw": 226.4},
+                                "volume": {"raw": 52000000},
+                                "averageVolume": {"raw": 48000000},
+                            },
+                            "financialData": {
+                                "currentPrice": {"raw": 228.0},
+                                "targetLowPrice": {"raw": 184.0},
+                                "targetHighPrice": {"raw": 325.0},
+                                "targetMeanPrice": {"raw": 252.0},
+                                "targetMedianPrice": {"raw": 255.0},
+                                "recommendationMean": {"raw": 2.0},
+                                "recommendationKey": "buy",
+                                "numberOfAnalystOpinions": {"raw": 40},
+                            },
+                        }
+                    ],
+                    "error": None,
+                }
+            },
+        ),
+        (
+            r"/stock/v3/get-insights$",
+            {
+                "finance": {
+                    "result": {
+                        "instrumentInfo": {
+                            "technicalEvents": {"provider": "Trading Central", "shortTermOutlook": {"direction": "Bullish", "score": 3}},
+                            "keyTechnicals": {"support": 220.0, "resistance": 240.0, "stopLoss": 215.0},
+                            "valuation": {"description": "Overvalued", "discount": "-9%", "relativeValue": "Premium", "provider": "Trading Central"},
+                        },
+                        "companySnapshot": {"company": {"innovativeness": 0.9, "sustainability": 0.6, "insiderSentiments": 0.3}},
+                        "recommendation": {"targetPrice": 250.0, "rating": "BUY", "provider": "Argus Research"},
+                    },
+                    "error": None,
+                }
+            },
+        ),
+        (
+            r"/stock/v4/get-statistics$",
+            {
+                "quoteSummary": {
+                    "result": [
+                        {
+                            "defaultKeyStatistics": {
+                                "enterpriseValue": {"raw": 3.5e12},
+                                "forwardPE": {"raw": 29.5},
+                                "forwardEps": {"raw": 7.7},
+                                "priceToBook": {"raw": 52.0},
+                                "mostRecentQuarter": {"fmt": "2024-12-28"},
+                                "netIncomeToCommon": {"raw": 9.6e10},
+                                "profitMargins": {"raw": 0.24},
+                                "beta": {"raw": 1.24},
+                            }
+                        }
+                    ],
+                    "error": None,
+                }
+            },
+        ),
+    ],
+    BOOKING_HOST: [
+        (
+            r"/api/v1/flights/searchFlights$",
+            {
+                "status": True,
+                "message": "Success",
+                "data": {
+                    "flightOffers": [
+                        {
+                            "segments": [{"legs": [_FLIGHT_LEG]}],
+                            "priceBreakdown": {"total": {"currencyCode": "USD", "units": 120, "nanos": 500000000}},
+                        }
+                        for _ in range(10)
+                    ]
+                },
+            },
+        ),
+        (
+            r"/api/v1/hotels/searchDestination$",
+            {
+                "status": True,
+                "message": "Success",
+                "data": [
+                    {
+                        "dest_id": "-1456928",
+                        "search_type": "city",
+                        "name": "Paris",
+                        "city_name": "Paris",
+                        "label": "Paris, Ile de France, France",
+                        "longitude": 2.3522,
+                        "latitude": 48.8566,
+                        "country": "France",
+                    }
+                ],
+            },
+        ),
+        (r"/api/v1/hotels/searchHotels$", {"status": True, "message": "Success", "data": {"hotels": [_HOTEL] * 20}}),
+        (
+            r"/api/v1/hotels/getHotelDetails$",
+            {
+                "status": True,
+                "message": "Success",
+                "data": {
+                    "hotel_id": 1377073,
+                    "hotel_name": "Hotel Sample",
+                    "facilities_block": {"facilities": [{"name": "Free WiFi"}, {"name": "Parking"}]},
+                    "hotel_important_information_with_codes": [{"phrase": "Check-in from 15:00"}],
+                    "rooms": {
+                        "137707301": {
+                            "photos": [{"url_max1280": "https://cf.bstatic.com/1.jpg"}],
+                            "description": "Double room",
+                            "bed_configurations": [{"bed_types": [{"name_with_count": "1 large double bed", "description": "Large double bed"}]}],
+                        }
+                    },
+                },
+            },
+        ),
+    ],
+    PINTEREST_HOST: [
+        (r"/pinterest/pins/advance$", {"data": [_PIN] * 10, "nextPageCursor": "Y2JVSG81"}),
+        (
+            r"/pinterest/users/relevance$",
+            {
+                "data": [
+                    {
+                        "id": "1044483239327345678",
+                        "username": "interiors",
+                        "full_name": "Interiors",
+                        "follower_count": 1200,
+                        "recent_pin_images": {"192x": [{"url": "https://i.pinimg.com/192x/1.jpg"}]},
+                    }
+                ]
+            },
+        ),
+    ],
+    TRIPADVISOR_HOST: [
+        (r"/location/search$", {"data": [_LOCATION] * 10}),
+        (r"/location/nearby_search$", {"data": [_LOCATION] * 10}),
+        (
+            r"/location/\d+/details$",
+            {
+                **_LOCATION,
+                "description": "The city that never sleeps",
+                "web_url": "https://www.tripadvisor.com/Tourism-g60763",
+                "rating": "4.5",
+                "num_reviews": "1000",
+                "ancestors": [{"level": "State", "name": "New York", "location_id": "28953"}],
+                "subratings": {"0": {"name": "rate_location", "localized_name": "Location", "value": "4.5"}},
+                "trip_types": [{"name": "business", "localized_name": "Business", "value": "10"}],
+                "subcategory": [{"name": "city", "localized_name": "City"}],
+            },
+        ),
+        (
+            r"/location/\d+/reviews$",
+            {
+                "data": [
+                    {
+                        "id": 1000 + i,
+                        "rating": 5,
+                        "title": "Great",
+                        "text": "Great place",
+                        "published_date": "2025-01-01T00:00:00Z",
+                        "subratings": {"0": {"name": "RATE_VALUE", "localized_name": "Value", "value": 5}},
+                    }
+                    for i in range(5)
+                ]
+            },
+        ),
+        (
+            r"/location/\d+/photos$",
+            {"data": [{"id": 2000 + i, "caption": "", "images": {"original": {"url": f"https://media-cdn.tripadvisor.com/{i}.jpg"}}} for i in range(5)]},
+        ),
+    ],
+    COMMODITIES_HOST: [
+        (
+            r"/v1/supported$",
+            {
+                "success": True,
+                "supported_commodities": {"XAU": "Gold", "XAG": "Silver", "BRENTOIL": "Brent Crude Oil"},
+                "supported_currencies": {"USD": "US Dollar", "EUR": "Euro"},
+            },
+        ),
+        (r"/v1/market-data$", {"success": True, "base_currency": "USD", "rates": {"XAU": 2650.4}}),
+    ],
+    METAL_HOST: [
+        (
+            r"/web-crawling/api/gold-index$",
+            {
+                "data": {
+                    metal: {
+                        "currency": "USD",
+                        "name": metal,
+                        "results": [{"bid": "2650.1", "mid": "2650.4", "high": "2661.0", "low": "2640.2", "originalTime": "2025-03-13T18:08:35Z", "unit": "ounce"}],
+                    }
+                    for metal in ("gold", "silver", "platinum", "palladium")
+                }
+            },
+        ),
+    ],
+    SERPER_HOST: [
+        (r"/scholar$", {"organic": _ORGANIC}),
+        (r"/patents$", {"organic": _ORGANIC[:10]}),
+    ],
+}
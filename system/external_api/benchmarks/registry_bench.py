@@ -0,0 +1,80 @@
+"""
+数据源延迟加载的冷启动基准
+
+每轮启动一个新的 Python 进程，分别测量导入 client 模块的耗时，以及导入之后 get_client() 并访问一个数据源的耗时:
+- lazy: 默认行为，只导入被访问的数据源模块
+- eager: 先调用 preload_sources() 加载全部数据源，等价于延迟加载之前的行为
+
+运行:
+    cd system && python -m external_api.benchmarks.registry_bench --runs 10 --source metal
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+CHILD_CODE = """
+import json, resource, sys, time
+start = time.perf_counter()
+from external_api.data_sources.client import get_client
+imported = time.perf_counter()
+client = get_client()
+if {preload}:
+    client.preload_sources()
+client_ready = time.perf_counter()
+client.{source}
+first_access = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "get_client_ms": (client_ready - imported) * 1000,
+    "first_access_ms": (first_access - imported) * 1000,
+    "source_modules": sum(1 for name in sys.modules if name.endswith("_source")),
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def run_once(source: str, preload: bool) -> Dict[str, Any]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE.format(preload=preload, source=source)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, float]:
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for lazy data source loading")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--source", default="metal", help="data source accessed after get_client()")
+    args = parser.parse_args()
+
+    results = {}
+    for mode, preload in (("eager", True), ("lazy", False)):
+        results[mode] = summarize([run_once(args.source, preload) for _ in range(args.runs)])
+
+    print(f"runs={args.runs} source={args.source} (medians)")
+    print(f"{'mode':<6} {'import':>10} {'get_client':>12} {'first access':>14} {'source modules':>15} {'max RSS':>10}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<6} {r['import_ms']:>7.1f} ms {r['get_client_ms']:>9.1f} ms {r['first_access_ms']:>11.1f} ms "
+            f"{r['source_modules']:>15.0f} {r['max_rss_mb']:>7.1f} MB"
+        )
+    saved = results["eager"]["first_access_ms"] - results["lazy"]["first_access_ms"]
+    print(f"lazy loading saves {saved:.1f} ms from get_client() to first access")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+同步调用基准
+
+同步代码调用数据源的两种方式，对本地代理替身各调用 --calls 次（关闭响应缓存与 singleflight）:
+- asyncio_run: 每次调用 asyncio.run(client.<source>.<method>(...))，每次新建事件循环与连接
+- sync: client.sync.<source>.<method>(...)，所有调用在同一个后台事件循环上执行，复用 keep-alive 连接
+分别在单线程中顺序调用，以及在 --threads 个线程的线程池中并发调用（模拟线程池 worker），
+报告吞吐、平均耗时与代理替身看到的连接数
+
+运行:
+    cd system && python -m external_api.benchmarks.sync_bench
+    cd system && python -m external_api.benchmarks.sync_bench --calls 500 --threads 16 --latency 0.005
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from external_api.benchmarks.mock_proxy import MockProxy
+
+
+def _asyncio_run_call(client: Any) -> Any:
+    return asyncio.run(client.commodities.get_supported_commodities())
+
+
+def _sync_call(client: Any) -> Any:
+    return client.sync.commodities.get_supported_commodities()
+
+
+MODES: Dict[str, Callable[[Any], Any]] = {"asyncio_run": _asyncio_run_call, "sync": _sync_call}
+
+
+def _measure(proxy: MockProxy, call: Callable[[], Any], calls: int, threads: int) -> Dict[str, float]:
+    connections_before = proxy.connection_count
+    start = time.perf_counter()
+    if threads <= 1:
+        results = [call() for _ in range(calls)]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(lambda _: call(), range(calls)))
+    elapsed = time.perf_counter() - start
+    assert all(result.get("success") for result in results), results[:3]
+    return {
+        "calls_per_s": calls / elapsed,
+        "avg_ms": elapsed / calls * 1000 * max(threads, 1),
+        "connections": proxy.connection_count - connections_before,
+    }
+
+
+def run(calls: int, threads: int, latency: float) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Returns:
+        Dict: {"sequential" / "threads": {mode: {"calls_per_s", "avg_ms", "connections"}}}
+    """
+    proxy = MockProxy(latency=latency)
+    proxy_url, _ = proxy.start_in_thread()
+
+    from external_api.data_sources import client as client_module
+
+    client_module.config["external_api_proxy_url"] = f"{proxy_url}/llm/external-api"
+    client_module.config["response_cache_maxsize"] = 0
+    client_module.config["singleflight_enabled"] = False
+    client = client_module.get_client()
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {"sequential": {}, "threads": {}}
+    try:
+        for mode, fn in MODES.items():
+            fn(client)  # 预热: 加载数据源，sync 模式启动后台循环
+            results["sequential"][mode] = _measure(proxy, lambda: fn(client), calls, 1)
+            results["threads"][mode] = _measure(proxy, lambda: fn(client), calls, threads)
+    finally:
+        client.sync.close()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Sync facade vs asyncio.run per call against a local proxy stand-in")
+    parser.add_argument("--calls", type=int, default=200, help="calls per mode")
+    parser.add_argument("--threads", type=int, default=8, help="worker threads in the thread pool pass")
+    parser.add_argument("--latency", type=float, default=0.0, help="injected fixed latency in seconds")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.calls, args.threads, args.latency)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"calls={args.calls} threads={args.threads} latency={args.latency}s")
+    print(f"{'pass':<12} {'mode':<12} {'calls/s':>9} {'avg':>11} {'connections':>12}")
+    for pass_name, per_mode in results.items():
+        for mode, r in per_mode.items():
+            print(f"{pass_name:<12} {mode:<12} {r['calls_per_s']:>9.0f} {r['avg_ms']:>8.2f} ms {r['connections']:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+传输层并发扇出基准
+
+对本地代理替身并发发起 N 个请求，比较 http1（aiohttp 连接池）与 http2（httpx 多路复用）两种传输层:
+- cold: 新建传输层后的第一轮，包含建立连接和 TLS 握手的开销
+- warm: 同一传输层的第二轮，复用已建立的连接
+
+两种模式都走 TLS，与线上访问 https 代理的方式一致
+
+运行:
+    cd system && python -m external_api.benchmarks.transport_bench --requests 500 --concurrency 200 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import ssl
+import statistics
+import time
+from typing import Any, Dict, List
+
+import aiohttp
+
+from external_api.benchmarks.mock_proxy import H2MockProxy, MockProxy, create_self_signed_cert, create_server_ssl_context
+from external_api.data_sources.session_pool import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    SessionPool,
+)
+from external_api.data_sources.transport import (
+    TRANSPORT_HTTP1,
+    TRANSPORT_HTTP2,
+    AiohttpTransport,
+    Transport,
+    create_transport,
+)
+
+HEADERS = {
+    "X-Original-Host": "apidojo-yahoo-finance-v1.p.rapidapi.com",
+    "X-Biz-Id": "matrix-agent",
+}
+
+
+async def _fan_out(transport: Transport, url: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    versions = set()
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await transport.request("GET", f"{url}/stock/v3/get-chart", headers=HEADERS, params={"symbol": f"S{i}"}, timeout=30)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+            versions.add(response.http_version)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(requests)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "http_version": ",".join(sorted(versions)),
+    }
+
+
+async def run_benchmark(kind: str, requests: int, concurrency: int, latency: float, cert_file: str, key_file: str) -> Dict[str, Any]:
+    if kind == TRANSPORT_HTTP2:
+        server: Any = H2MockProxy(latency=latency)
+        url = await server.start(create_server_ssl_context(cert_file, key_file, "h2"))
+    else:
+        server = MockProxy(latency=latency)
+        url = await server.start(ssl_context=create_server_ssl_context(cert_file, key_file, "http/1.1"))
+
+    if kind == TRANSPORT_HTTP2:
+        # httpx 在 trust_env=True 时读取 SSL_CERT_FILE
+        transport = create_transport(kind)
+    else:
+        # aiohttp 在导入时缓存默认 SSL 上下文，需要显式传入信任自签名证书的上下文
+        client_context = ssl.create_default_context(cafile=cert_file)
+        transport = AiohttpTransport(
+            SessionPool(
+                connector_factory=lambda: aiohttp.TCPConnector(
+                    limit=DEFAULT_CONNECTION_LIMIT,
+                    limit_per_host=DEFAULT_CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+                    ssl=client_context,
+                )
+            )
+        )
+    try:
+        cold = await _fan_out(transport, url, requests, concurrency)
+        warm = await _fan_out(transport, url, requests, concurrency)
+    finally:
+        await transport.close()
+        await server.stop()
+    return {"transport": kind, "cold": cold, "warm": warm, "connections": server.connection_count}
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    for phase in ("cold", "warm"):
+        r = result[phase]
+        print(
+            f"{result['transport']:<6} {phase:<5} {r['http_version']:<9} "
+            f"{r['elapsed'] * 1000:>9.1f} ms {r['rps']:>9.1f} req/s "
+            f"p50 {r['p50_ms']:>7.1f} ms  p99 {r['p99_ms']:>7.1f} ms"
+        )
+    print(f"{result['transport']:<6} TCP/TLS connections opened: {result['connections']}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent fan-out benchmark for http1 / http2 transports")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="injected server latency in seconds")
+    args = parser.parse_args()
+
+    cert_file, key_file = create_self_signed_cert()
+    # 让 httpx 信任自签名证书
+    os.environ["SSL_CERT_FILE"] = cert_file
+
+    print(f"requests={args.requests} concurrency={args.concurrency} latency={args.latency}s")
+    for kind in (TRANSPORT_HTTP1, TRANSPORT_HTTP2):
+        _print_result(await run_benchmark(kind, args.requests, args.concurrency, args.latency, cert_file, key_file))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,19 +4,70 @@
 类的继承关系:
 BaseApi (基类)
 """
+import asyncio
+import copy
 import inspect
+import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 import os
+import time
 
+import aiohttp
+
+from .cache import ResponseCache, get_default_response_cache
+from .hedging import Hedger
+from .instrumentation import record_request
+from .ratelimit import RateLimiter
+from .resilience import CircuitBreaker, RetryPolicy, parse_retry_after
+from . import tracing
+from .transport import HttpResponse, Transport, encode_json_body, get_default_transport
+
+
+EXCLUDE_METHODS = ['get_capabilities', 'get_api_info', 'source_name', 'get_source_info', 'bind_transport', 'bind_response_cache', 'bind_rate_limiter', 'bind_resilience', 'bind_hedger', 'get_capabilities_schema']
+
+logger = logging.getLogger("data_sources_base")
+
+
+class _CapabilityEntry(NamedTuple):
+    name: str
+    func: Callable
+    doc: str
+    signature: inspect.Signature
+
+
+# 按数据源类缓存的能力索引，能力只依赖类定义，同一个类只需扫描一次
+_capability_index: Dict[type, List[_CapabilityEntry]] = {}
+_capabilities: Dict[type, List[Dict[str, Any]]] = {}
+_capabilities_schema: Dict[type, List[Dict[str, Any]]] = {}
+
+
+def _body_size(data: Any) -> int:
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    return 0
 
-EXCLUDE_METHODS = ['get_capabilities', 'get_api_info', 'source_name', 'get_source_info']
 
 class BaseAPI(ABC):
     """
     数据源基类
     所有数据源都需要继承此类并实现相关方法
     """
+
+    # 由 ApiClient 绑定的共享传输层，未绑定时使用进程级默认传输层
+    _transport: Optional[Transport] = None
+    # 由 ApiClient 绑定的共享响应缓存，未绑定时使用进程级默认缓存，参见 cache.cached
+    _response_cache: Optional[ResponseCache] = None
+    # 由 ApiClient 绑定的按上游 host 限流器，未绑定时不限流
+    _rate_limiter: Optional[RateLimiter] = None
+    # 由 ApiClient 绑定的重试策略与本数据源的熔断器，未绑定时不重试、不熔断，参见 resilience.py
+    _retry_policy: Optional[RetryPolicy] = None
+    _circuit_breaker: Optional[CircuitBreaker] = None
+    # 由 ApiClient 在开启对冲请求时绑定，未绑定时 _hedged_request 等同于 _request，参见 hedging.py
+    _hedger: Optional[Hedger] = None
+
     @abstractmethod
     def __init__(self, config: Dict[str, Any]):
         """
@@ -47,39 +98,265 @@ class BaseAPI(ABC):
         """
         pass
 
+    def bind_transport(self, transport: Transport) -> None:
+        """
+        绑定共享传输层，由 ApiClient 在加载数据源时调用
+
+        Args:
+            transport: 共享传输层
+        """
+        self._transport = transport
+
+    def bind_response_cache(self, cache: ResponseCache) -> None:
+        """
+        绑定共享响应缓存，由 ApiClient 在加载数据源时调用
+
+        Args:
+            cache: 共享响应缓存
+        """
+        self._response_cache = cache
+
+    def bind_rate_limiter(self, rate_limiter: RateLimiter) -> None:
+        """
+        绑定按上游 host 的限流器，由 ApiClient 在加载数据源时调用
+
+        Args:
+            rate_limiter: 共享限流器
+        """
+        self._rate_limiter = rate_limiter
+
+    def bind_resilience(self, retry_policy: Optional[RetryPolicy], circuit_breaker: Optional[CircuitBreaker]) -> None:
+        """
+        绑定重试策略与熔断器，由 ApiClient 在加载数据源时调用
+
+        Args:
+            retry_policy: 共享重试策略，为 None 时不重试
+            circuit_breaker: 本数据源的熔断器，为 None 时不熔断
+        """
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+
+    def bind_hedger(self, hedger: Optional[Hedger]) -> None:
+        """
+        绑定对冲请求执行器，由 ApiClient 在加载数据源时调用
+
+        Args:
+            hedger: 共享的对冲请求执行器，为 None 时不对冲
+        """
+        self._hedger = hedger
+
+    def _get_response_cache(self) -> ResponseCache:
+        if self._response_cache is None:
+            self._response_cache = get_default_response_cache()
+        return self._response_cache
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        """
+        通过共享传输层发送请求，所有请求复用传输层的连接
+        - 绑定了限流器时，每次尝试前先按请求头中的 X-Original-Host 取令牌，超出速率时排队等待
+        - 绑定了重试策略时，幂等请求在连接错误、超时或可重试状态码时退避重试；
+          所有尝试与退避共享 total_timeout 的总时限，之后每次尝试的超时不超过剩余时间，剩余时间不足时不再重试
+        - 绑定了熔断器时，熔断期间直接抛出 CircuitOpenError；每次调用（包括其全部重试）只向熔断器记录一次结果
+        - 每次尝试的请求体与响应体字节数计入当前调用的指标，参见 instrumentation.py
+        - 开启追踪时每次尝试记录一个 http span，重试前的等待计入当前 span 的 backoff 阶段，参见 tracing.py
+
+        Args:
+            method: HTTP 方法
+            url: 请求地址
+            kwargs: headers / params / json / data / timeout，参见 Transport.request
+
+        Returns:
+            HttpResponse: 已读取完整响应体的响应，重试耗尽时为最后一次的响应
+
+        Raises:
+            asyncio.TimeoutError: 请求超时（重试耗尽）
+            aiohttp.ClientError: 连接或协议错误（重试耗尽），或熔断器打开（CircuitOpenError）
+        """
+        if self._transport is None:
+            self._transport = get_default_transport()
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return await self._request_with_retries(method, url, **kwargs)
+
+        # 只在调用开始时检查一次，半开状态放行的探测调用可以完成自己的重试
+        breaker.before_request()
+        try:
+            response = await self._request_with_retries(method, url, **kwargs)
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            breaker.record_failure()
+            raise
+        # 4xx 说明上游可用，只有 5xx 计为失败
+        if response.status >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _request_with_retries(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        """
+        _request 的重试循环，参数与返回值参见 _request
+        """
+        policy = self._retry_policy
+        max_attempts = policy.max_attempts if policy is not None and policy.should_retry(method) else 1
+        if kwargs.get("json") is not None:
+            # 只编码一次，重试复用同一请求体
+            kwargs["data"], kwargs["headers"] = encode_json_body(kwargs["json"], kwargs.get("headers"))
+        kwargs.pop("json", None)
+        bytes_out = _body_size(kwargs.get("data"))
+        request_timeout = kwargs.get("timeout")
+        deadline = None
+        if max_attempts > 1 and policy.total_timeout is not None:  # type: ignore
+            deadline = time.monotonic() + policy.total_timeout  # type: ignore
+
+        attempt = 1
+        while True:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                kwargs["timeout"] = remaining if request_timeout is None else min(request_timeout, remaining)
+
+            try:
+                with tracing.span("http", method=method, url=url, attempt=attempt) as span:
+                    response = await self._send(method, url, span, **kwargs)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                record_request(bytes_out, 0)
+                if attempt >= max_attempts:
+                    raise
+                delay = policy.backoff(attempt)  # type: ignore
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(f"{method} {url} failed ({type(e).__name__}: {e}), retry {attempt}/{max_attempts - 1} in {delay:.2f}s")
+            else:
+                record_request(bytes_out, len(response.content))
+                if attempt >= max_attempts or response.status not in policy.retry_statuses:  # type: ignore
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > policy.max_retry_after:  # type: ignore
+                    return response
+                delay = retry_after if retry_after is not None else policy.backoff(attempt)  # type: ignore
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    return response
+                logger.warning(f"{method} {url} returned {response.status}, retry {attempt}/{max_attempts - 1} in {delay:.2f}s")
+
+            parent = tracing.current_span()
+            if parent is not None:
+                parent.add_phase("backoff", delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method: str, url: str, span: Optional[tracing.Span], **kwargs: Any) -> HttpResponse:
+        """
+        _request 的一次尝试: 先按 X-Original-Host 取限流令牌，再经传输层发送；
+        span 不为空时记录 rate_limit / request 阶段耗时，并在请求头 X-Request-Id 中带上 trace_id
+        """
+        host = (kwargs.get("headers") or {}).get("X-Original-Host")
+        if self._rate_limiter is not None and host:
+            waited = await self._rate_limiter.acquire(host)
+            if span is not None:
+                span.add_phase("rate_limit", waited)
+        if span is None:
+            return await self._transport.request(method, url, **kwargs)  # type: ignore
+
+        span.set_attribute("host", host)
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), tracing.TRACE_HEADER: span.trace_id}
+        start = time.perf_counter()
+        response = await self._transport.request(method, url, **kwargs)  # type: ignore
+        span.add_phase("request", time.perf_counter() - start)
+        span.set_attribute("status", response.status)
+        span.set_attribute("bytes_in", len(response.content))
+        if response.status >= 500:
+            span.status = tracing.SPAN_STATUS_ERROR
+        return response
+
+    async def _hedged_request(self, name: str, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        """
+        发送请求，绑定了对冲执行器时对慢请求发送一个相同的对冲请求，取先成功返回的响应
+        只用于幂等且延迟长尾明显的接口，每个请求（包括对冲请求）都经过 _request 的限流、重试与熔断
+
+        Args:
+            name: 接口名称，对冲延迟与预算按 数据源名称.接口名称 统计
+            method: HTTP 方法
+            url: 请求地址
+            kwargs: 参见 _request
+
+        Returns:
+            HttpResponse: 先成功返回的响应
+        """
+        if self._hedger is None:
+            return await self._request(method, url, **kwargs)
+        return await self._hedger.run(f"{self.source_name}.{name}", lambda: self._request(method, url, **kwargs))
+
+    @classmethod
+    def _get_capability_index(cls) -> List[_CapabilityEntry]:
+        """
+        扫描类的公开方法，构建能力索引，结果按类缓存
+        """
+        index = _capability_index.get(cls)
+        if index is not None:
+            return index
+
+        index = []
+        for attr_name in dir(cls):
+            if attr_name.startswith('_') or attr_name in EXCLUDE_METHODS:  # 排除私有方法
+                continue
+            attr = getattr(cls, attr_name)
+            if not callable(attr):
+                continue
+            # 获取方法的文档字符串
+            doc = inspect.getdoc(attr)
+            if not doc:  # 跳过没有文档的方法
+                continue
+            if 'raise NotImplementedError' in inspect.getsource(attr):  # 跳过未实现的方法
+                continue
+            # 获取方法的签名
+            index.append(_CapabilityEntry(attr_name, attr, doc, inspect.signature(attr)))
+        _capability_index[cls] = index
+        return index
+
     def get_capabilities(self) -> List[Dict[str, Any]]:
         """
         获取数据源所有能力的描述
-        通过扫描实例方法及其文档字符串自动获取能力描述
+        通过扫描类的公开方法及其文档字符串自动获取能力描述，扫描结果按类缓存
 
         Returns:
             List[Dict[str, Any]]: 数据源提供的所有方法的描述列表
         """
-        # 获取所有公开方法（不包括内置方法和私有方法）
-        capabilities = []
-        for attr_name in dir(self):
-            if not attr_name.startswith('_'):  # 排除私有方法
-                attr = getattr(self, attr_name)
-                if callable(attr) and attr_name not in EXCLUDE_METHODS:
-                    # 获取方法的文档字符串
-                    doc = inspect.getdoc(attr)
-                    if not doc:  # 跳过没有文档的方法
-                        continue
-                    if 'raise NotImplementedError' in inspect.getsource(attr):  # 跳过未实现的方法
-                        continue
-                    # 获取方法的签名
-                    sig = inspect.signature(attr)
-                    # 构建能力描述
-                    capability = {
-                        "name": attr_name,
-                        "description": doc.split('\n\n')[0] if doc else "",  # 取第一段作为简短描述
-                        "parameters": {
-                            name: str(param.annotation).replace('typing.', '')
-                            for name, param in sig.parameters.items()
-                            if name != 'self'
-                        },
-                        "return_type": str(sig.return_annotation).replace('typing.', ''),
-                        "doc": doc  # 完整的文档字符串
-                    }
-                    capabilities.append(capability)
-        return capabilities
\ No newline at end of file
+        cls = type(self)
+        capabilities = _capabilities.get(cls)
+        if capabilities is None:
+            capabilities = []
+            for entry in self._get_capability_index():
+                # 构建能力描述
+                capability = {
+                    "name": entry.name,
+                    "description": entry.doc.split('\n\n')[0] if entry.doc else "",  # 取第一段作为简短描述
+                    "parameters": {
+                        name: str(param.annotation).replace('typing.', '')
+                        for name, param in entry.signature.parameters.items()
+                        if name != 'self'
+                    },
+                    "return_type": str(entry.signature.return_annotation).replace('typing.', ''),
+                    "doc": entry.doc  # 完整的文档字符串
+                }
+                capabilities.append(capability)
+            _capabilities[cls] = capabilities
+        # 返回副本，调用方修改不影响缓存
+        return copy.deepcopy(capabilities)
+
+    def get_capabilities_schema(self) -> List[Dict[str, Any]]:
+        """
+        获取数据源所有能力的工具定义，参数与返回值使用 JSON Schema 描述，结果按类缓存
+
+        Returns:
+            List[Dict[str, Any]]: 工具定义列表，格式参见 schema.method_to_tool_schema
+        """
+        from .schema import method_to_tool_schema
+
+        cls = type(self)
+        schemas = _capabilities_schema.get(cls)
+        if schemas is None:
+            schemas = [
+                method_to_tool_schema(self.source_name, entry.name, entry.func, entry.doc)
+                for entry in self._get_capability_index()
+            ]
+            _capabilities_schema[cls] = schemas
+        return copy.deepcopy(schemas)
@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional
 import aiohttp
 
 from .base import BaseAPI
+from .models import OUTPUT_FORMAT_RECORDS, BedConfiguration, HotelDetail, HotelRoom, check_output_format
 
 logger = logging.getLogger("booking_source")
 
@@ -160,11 +161,12 @@ class BookingSource(BaseAPI):
 
             # Send request
             try:
-                async with aiohttp.ClientSession(trust_env=True) as session:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        # Check response status
-                        response.raise_for_status()
-                        data = await response.json()
+                response = await self._hedged_request(
+                    "search_flights", "GET", request_url, headers=self.headers, params=params, timeout=self._timeout
+                )
+                # Check response status
+                response.raise_for_status()
+                data = response.json()
 
             except asyncio.TimeoutError:
                 error_msg = f"Request timeout (timeout={self._timeout}s)"
@@ -280,11 +282,10 @@ class BookingSource(BaseAPI):
 
             # 发送请求
             try:
-                async with aiohttp.ClientSession(trust_env=True) as session:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        # 检查响应状态
-                        response.raise_for_status()
-                        data = await response.json()
+                response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+                # 检查响应状态
+                response.raise_for_status()
+                data = response.json()
 
             except asyncio.TimeoutError:
                 error_msg = f"Request timeout (timeout={self._timeout}s)"
@@ -449,11 +450,12 @@ class BookingSource(BaseAPI):
 
             # 发送请求
             try:
-                async with aiohttp.ClientSession(trust_env=True) as session:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        # 检查响应状态
-                        response.raise_for_status()
-                        data = await response.json()
+                response = await self._hedged_request(
+                    "_search_hotels_by_destid", "GET", request_url, headers=self.headers, params=params, timeout=self._timeout
+                )
+                # 检查响应状态
+                response.raise_for_status()
+                data = response.json()
 
             except asyncio.TimeoutError:
                 error_msg = f"Request timeout (timeout={self._timeout}s)"
@@ -660,6 +662,7 @@ class BookingSource(BaseAPI):
         temperature_unit: str = "c",
         languagecode: str = "en-us",
         currency_code: str = "EUR",
+        output_format: str = OUTPUT_FORMAT_RECORDS,
     ) -> Dict[str, Any]:
         """
         Search for hotel details by hotel ID
@@ -675,6 +678,8 @@ class BookingSource(BaseAPI):
             temperature_unit(str): Temperature unit, default is c, options: c or f, where c = Celsius, f = Fahrenheit
             languagecode(str): Language code, default en-us
             currency_code(str): Currency code, default EUR
+            output_format(str): Format of the hotel detail, options: records|models, default: records.
+                models returns a compact HotelDetail object (see models.py), hotel.to_dict() gives the records format.
 
         Returns:
             Dict[str, Any]: Dictionary containing hotel details, e.g.
@@ -746,6 +751,8 @@ class BookingSource(BaseAPI):
         #     ...     print(f"请求成功")
         # """
         try:
+            check_output_format(output_format)
+
             # 请求酒店详情
             # 构建请求参数
             params = {
@@ -767,11 +774,12 @@ class BookingSource(BaseAPI):
             request_url = f"{self.proxy_url}/api/v1/hotels/getHotelDetails"
 
             try:
-                async with aiohttp.ClientSession(trust_env=True) as session:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        # 检查响应状态
-                        response.raise_for_status()
-                        data = await response.json()
+                response = await self._hedged_request(
+                    "search_hotel_details", "GET", request_url, headers=self.headers, params=params, timeout=self._timeout
+                )
+                # 检查响应状态
+                response.raise_for_status()
+                data = response.json()
 
             except asyncio.TimeoutError:
                 error_msg = f"Request timeout (timeout={self._timeout}s)"
@@ -789,14 +797,17 @@ class BookingSource(BaseAPI):
                 return {"success": False, "error": error_msg}
 
             hotel_detail = self._parse_hotel_detail(data.get("data", {}))
-            return {"success": True, "data": hotel_detail}
+            if output_format == OUTPUT_FORMAT_RECORDS:
+                hotel_detail = hotel_detail.to_dict()
+            # 保持原有的返回结构，详情外层还有一层 {"success": True, "data": ...}
+            return {"success": True, "data": {"success": True, "data": hotel_detail}}
         except Exception as e:
             error_msg = f"Error occurred while searching hotel details: {str(e)}"
             logger.error(error_msg)
             logger.exception(e)
             return {"success": False, "error": error_msg}
 
-    def _parse_hotel_detail(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_hotel_detail(self, data: Dict[str, Any]) -> HotelDetail:
         """解析酒店详情"""
         facilities = []
         for facility in data.get("facilities_block", {}).get("facilities", []):
@@ -812,7 +823,6 @@ class BookingSource(BaseAPI):
 
         rooms = {}
         for roomId, roomInfo in data.get("rooms", {}).items():
-            room = {}
             photos_data = roomInfo.get("photos", [])
             photos = []
             for photo in photos_data:
@@ -839,49 +849,47 @@ class BookingSource(BaseAPI):
                 for bed_type in bed_config.get("bed_types", []):
                     bed_name_cnt = bed_type.get("name_with_count", "")
                     bed_desc = bed_type.get("description", "")
-                    bed_configurations.append({"name_with_count": bed_name_cnt, "description": bed_desc})
+                    bed_configurations.append(BedConfiguration(name_with_count=bed_name_cnt, description=bed_desc))
 
-            room = {
-                "photos": photos,
-                "children_and_beds_text": children_and_beds_text,
-                "description": description,
-                "bed_configurations": bed_configurations,
-            }
-            rooms[roomId] = room
-
-        hotel_detail = {
-            "hotel_id": data.get("hotel_id", ""),  # 酒店 id
-            "hotel_name": data.get("hotel_name", ""),  # 酒店名称
-            "url": data.get("url", ""),  # 酒店url
-            "review_nr": data.get("review_nr", ""),  # 评论数量
-            "rating": data.get("raw_data", {}).get("reviewScore", ""),  # 综合评分
-            "arrival_date": data.get("arrival_date", ""),  # 入住日期
-            "departure_date": data.get("departure_date", ""),  # 离开日期
-            "latitude": data.get("latitude", ""),  # 经度
-            "longitude": data.get("longitude", ""),  # 纬度
-            "address": data.get("address", ""),  # 地址
-            "city": data.get("city", ""),  # 城市名
-            "district": data.get("district", "") if data.get("district", "") != data.get("city", "") else "",  # 地址所在区
-            "countrycode": data.get("countrycode", ""),  # 国家代码
-            "country_trans": data.get("country_trans", ""),  # 国家名
-            "currency_code": data.get("currency_code", ""),  # 货币代码
-            "zip": data.get("zip", ""),  # 邮政编码
-            "timezone": data.get("timezone", ""),  # 时区
-            "soldout": data.get("soldout", ""),  # 是否售罄
-            "available_rooms": data.get("available_rooms", ""),  # 可用房间数
-            "max_rooms_in_reservation": data.get("max_rooms_in_reservation", ""),  # 最大预订房间数
-            "average_room_size_for_ufi_m2": data.get("average_room_size_for_ufi_m2", ""),  # 平均房间大小
-            "is_family_friendly": data.get("is_family_friendly", ""),  # 是否家庭友好
-            "is_closed": data.get("is_closed", ""),  # 是否关门
-            "is_cash_accepted_check_enabled": data.get("is_cash_accepted_check_enabled", ""),  # 是否接受现金
-            "hotel_include_breakfast": data.get("hotel_include_breakfast", ""),  # 是否包含早餐
-            "family_facilities": data.get("family_facilities", ""),  # 家庭设施
-            "facilities": facilities,
-            "spoken_languages": data.get("spoken_languages", []),  # 可用语言
-            "hotel_important_information": hotel_important_information,
-            "rooms": rooms,
-        }
-        return {"success": True, "data": hotel_detail}
+            rooms[roomId] = HotelRoom(
+                photos=photos,
+                children_and_beds_text=children_and_beds_text,
+                description=description,
+                bed_configurations=bed_configurations,
+            )
+
+        return HotelDetail(
+            hotel_id=data.get("hotel_id", ""),  # 酒店 id
+            hotel_name=data.get("hotel_name", ""),  # 酒店名称
+            url=data.get("url", ""),  # 酒店url
+            review_nr=data.get("review_nr", ""),  # 评论数量
+            rating=data.get("raw_data", {}).get("reviewScore", ""),  # 综合评分
+            arrival_date=data.get("arrival_date", ""),  # 入住日期
+            departure_date=data.get("departure_date", ""),  # 离开日期
+            latitude=data.get("latitude", ""),  # 经度
+            longitude=data.get("longitude", ""),  # 纬度
+            address=data.get("address", ""),  # 地址
+            city=data.get("city", ""),  # 城市名
+            district=data.get("district", "") if data.get("district", "") != data.get("city", "") else "",  # 地址所在区
+            countrycode=data.get("countrycode", ""),  # 国家代码
+            country_trans=data.get("country_trans", ""),  # 国家名
+            currency_code=data.get("currency_code", ""),  # 货币代码
+            zip=data.get("zip", ""),  # 邮政编码
+            timezone=data.get("timezone", ""),  # 时区
+            soldout=data.get("soldout", ""),  # 是否售罄
+            available_rooms=data.get("available_rooms", ""),  # 可用房间数
+            max_rooms_in_reservation=data.get("max_rooms_in_reservation", ""),  # 最大预订房间数
+            average_room_size_for_ufi_m2=data.get("average_room_size_for_ufi_m2", ""),  # 平均房间大小
+            is_family_friendly=data.get("is_family_friendly", ""),  # 是否家庭友好
+            is_closed=data.get("is_closed", ""),  # 是否关门
+            is_cash_accepted_check_enabled=data.get("is_cash_accepted_check_enabled", ""),  # 是否接受现金
+            hotel_include_breakfast=data.get("hotel_include_breakfast", ""),  # 是否包含早餐
+            family_facilities=data.get("family_facilities", ""),  # 家庭设施
+            facilities=facilities,
+            spoken_languages=data.get("spoken_languages", []),  # 可用语言
+            hotel_important_information=hotel_important_information,
+            rooms=rooms,
+        )
 
     def _format_duration(self, seconds: int) -> str:
         """Convert seconds to hours and minutes format"""
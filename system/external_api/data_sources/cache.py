@@ -0,0 +1,238 @@
+"""
+数据源方法级 TTL 响应缓存
+
+用法:
+    class CommoditiesSource(BaseAPI):
+        @cached(ttl=CACHE_TTL_DAY)
+        async def get_supported_commodities(self) -> Dict[str, Any]:
+            ...
+
+- 缓存键由 数据源名称 + 方法名 + 归一化后的参数 组成，位置参数与关键字参数、显式传入默认值与省略默认值视为同一次调用；
+  参数无法 JSON 序列化时没有稳定的键，该次调用不缓存
+- TTL 由各方法通过装饰器声明，所有方法共享同一个 LRU 缓存，容量由 ApiClient 配置
+- 只缓存成功的结果（返回值不是 {"success": False, ...}），命中时返回深拷贝，调用方修改返回值不会污染缓存
+"""
+
+import copy
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from .instrumentation import record_cache
+from . import tracing
+
+CACHE_TTL_MINUTE = 60
+CACHE_TTL_HOUR = 60 * 60
+CACHE_TTL_DAY = 24 * 60 * 60
+
+DEFAULT_CACHE_MAXSIZE = 1024
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+class ResponseCache:
+    """
+    带 TTL 的 LRU 缓存，线程安全
+
+    每个条目保存自己的过期时间，超出容量时淘汰最久未使用的条目
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE):
+        """
+        初始化缓存
+
+        Args:
+            maxsize: 最大条目数，<= 0 时禁用缓存
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def _method_stats(self, method: str) -> Dict[str, int]:
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = {"hits": 0, "misses": 0}
+        return stats
+
+    def get(self, method: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        查询缓存
+
+        Args:
+            method: 统计用的方法名，格式为 source_name.method_name
+            key: 缓存键
+
+        Returns:
+            Tuple[bool, Any]: (是否命中, 缓存值的深拷贝)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            stats = self._method_stats(method)
+            if entry is None:
+                stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            stats["hits"] += 1
+            value = entry[1]
+        return True, copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        写入缓存，超出容量时淘汰最久未使用的条目
+
+        Args:
+            key: 缓存键
+            value: 缓存值，写入时深拷贝
+            ttl: 过期时间（秒）
+        """
+        if not self.enabled or ttl <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        清空所有缓存条目，保留统计数据
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计
+
+        Returns:
+            Dict[str, Any]: 包含以下字段:
+                - size: int, 当前条目数
+                - maxsize: int, 最大条目数
+                - hits / misses: int, 总命中 / 未命中次数
+                - hit_rate: float, 总命中率
+                - evictions: int, LRU 淘汰次数
+                - methods: Dict[str, Dict[str, int]], 按方法统计的 hits / misses
+        """
+        with self._lock:
+            methods = {name: dict(stats) for name, stats in self._stats.items()}
+            size = len(self._entries)
+            evictions = self._evictions
+        hits = sum(stats["hits"] for stats in methods.values())
+        misses = sum(stats["misses"] for stats in methods.values())
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "evictions": evictions,
+            "methods": methods,
+        }
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_response_cache() -> ResponseCache:
+    """
+    获取进程级默认缓存，供未被 ApiClient 绑定缓存的数据源使用
+
+    Returns:
+        ResponseCache: 默认缓存
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:  # Double-check
+                _default_cache = ResponseCache()
+    return _default_cache
+
+
+def make_call_key(method: str, signature: inspect.Signature, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    根据方法签名归一化调用参数，生成可哈希的调用键
+
+    Args:
+        method: 方法全名，格式为 source_name.method_name
+        signature: 方法签名
+        args: 位置参数
+        kwargs: 关键字参数
+
+    Returns:
+        Optional[Tuple[str, str]]: (方法全名, 归一化参数)，参数与签名不匹配或无法 JSON 序列化时返回 None
+    """
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    arguments = {name: value for name, value in bound.arguments.items() if name != "self"}
+    try:
+        # 不使用 repr 兜底: 对象的 repr 通常带内存地址，相同的调用得到不同的键，或不同的调用得到相同的键
+        return method, json.dumps(arguments, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_cacheable(result: Any) -> bool:
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+def cached(ttl: float) -> Callable[[F], F]:
+    """
+    为数据源的异步方法添加 TTL 响应缓存
+
+    Args:
+        ttl: 缓存有效期（秒）
+
+    Returns:
+        Callable: 装饰器，保留原方法的签名与文档字符串
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cache = self._get_response_cache()
+            if not cache.enabled:
+                return await func(self, *args, **kwargs)
+
+            method = f"{self.source_name}.{func.__name__}"
+            key = make_call_key(method, signature, (self, *args), kwargs)
+            if key is None:
+                # 参数不合法时交给原方法抛出异常，参数无法序列化时不缓存
+                return await func(self, *args, **kwargs)
+
+            hit, value = cache.get(method, key)
+            record_cache(hit)
+            span = tracing.current_span()
+            if span is not None:
+                span.set_attribute("cache", "hit" if hit else "miss")
+            if hit:
+                return value
+            result = await func(self, *args, **kwargs)
+            if _is_cacheable(result):
+                cache.set(key, result, ttl)
+            return result
+
+        wrapper.cache_ttl = ttl  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
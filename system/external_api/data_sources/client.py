@@ -2,22 +2,32 @@
 统一的数据源访问客户端
 """
 
+import functools
 import importlib
 import inspect
 import logging
 import os
-import pkgutil
 import threading
 from enum import Enum
-from pathlib import Path
-from typing import Dict
-
-from docstring_parser import parse
-
-from .base import EXCLUDE_METHODS, BaseAPI
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import BaseAPI
+from .cache import DEFAULT_CACHE_MAXSIZE, ResponseCache, make_call_key
+from .descriptions import DESCRIPTIONS_FILE, load_descriptions, render_api_desc
+from .hedging import HedgePolicy, Hedger
+from .instrumentation import CallMetrics
+from .ratelimit import RateLimiter
+from .registry import DATA_SOURCES_PACKAGE, FUNCTION_REGISTRY, SOURCE_REGISTRY, SourceSpec, find_unregistered_modules
+from .resilience import CircuitBreaker, RetryPolicy
+from .singleflight import SingleFlight
+from .sync import SyncApiClient
+from . import tracing
+from .transport import TRANSPORT_HTTP1, create_transport
 
 # 用于在shell中设置LLM_GATEWAY_BASE_URL环境变量
 LLM_GATEWAY_BASE_URL_ENV_NAME = "LLM_GATEWAY_BASE_URL"
+# 用于在shell中选择访问代理的传输层: http1（默认）或 http2；http2 依赖 h2，由 pyproject.toml 中的 httpx[http2] 安装
+EXTERNAL_API_TRANSPORT_ENV_NAME = "EXTERNAL_API_TRANSPORT"
 
 logger = logging.getLogger("data_sources_client")
 
@@ -39,6 +49,39 @@ config = {
     "serper_base_url": "google.serper.dev",
     "external_api_proxy_url": get_external_api_proxy_url(),
     "timeout": 60,
+    "transport": os.getenv(EXTERNAL_API_TRANSPORT_ENV_NAME) or TRANSPORT_HTTP1,
+    "connection_limit": 100,
+    "connection_limit_per_host": 64,
+    "keepalive_timeout": 30,
+    # 方法级响应缓存的最大条目数，<= 0 时禁用缓存
+    "response_cache_maxsize": DEFAULT_CACHE_MAXSIZE,
+    # 批量接口（如 get_multiple_stocks_price）同时进行的请求数上限
+    "fan_out_concurrency": 8,
+    # 预构建的数据源描述，参见 descriptions.py，为空时不加载
+    "api_descriptions_file": DESCRIPTIONS_FILE,
+    # 是否合并并发中的相同调用（相同数据源、方法与参数）
+    "singleflight_enabled": True,
+    # 按上游 host（上面的 *_base_url）限流: {host: RateLimit(每秒请求数, 突发上限)}，超出速率的请求排队等待
+    # 例如 {"twitter154.p.rapidapi.com": RateLimit(5, 10)}，参见 ratelimit.py
+    "rate_limits": {},
+    # 未在 rate_limits 中列出的 host 使用的限流配置，为 None 时不限流
+    "rate_limit_default": None,
+    # 幂等请求（GET）的最多尝试次数，1 表示不重试；退避从 retry_base_delay 秒开始翻倍，不超过 retry_max_delay 秒
+    "retry_max_attempts": 3,
+    "retry_base_delay": 0.5,
+    "retry_max_delay": 8.0,
+    # 重试时一次调用（所有尝试与退避）的总时限（秒），之后的尝试超时按剩余时间收紧；为 None 时每次尝试都使用完整的 timeout
+    "retry_total_timeout": 90.0,
+    # 单个数据源连续失败达到阈值后熔断，recovery_timeout 秒后放行一个探测请求；阈值 <= 0 时不熔断
+    "circuit_failure_threshold": 5,
+    "circuit_recovery_timeout": 30.0,
+    # 对延迟长尾明显的接口（如 booking 的酒店与航班搜索）发送对冲请求，参见 hedging.py
+    # 首个请求超过最近耗时的 hedge_percentile 分位仍未返回时再发一个，对冲请求数不超过首发请求的 hedge_budget_ratio
+    "hedging_enabled": False,
+    "hedge_percentile": 0.95,
+    "hedge_budget_ratio": 0.1,
+    # 是否按数据源与方法统计调用指标（耗时直方图、字节数、成功 / 失败次数、缓存命中率），并上报到 metrics.metrics，参见 instrumentation.py
+    "call_metrics_enabled": True,
 }
 
 
@@ -47,6 +90,49 @@ class ApiType(Enum):
     FUNCTION = "function"
 
 
+class _SourceProxy:
+    """
+    数据源代理
+    协程方法经由 ApiClient._dispatch 调用，其他属性直接透传给数据源（包括赋值）；
+    __class__ 返回数据源的类，isinstance(client.twitter, TwitterSource) 与直接持有数据源时一致
+    """
+
+    def __init__(self, client: "ApiClient", source: BaseAPI):
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_source", source)
+        object.__setattr__(self, "_methods", {})
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        return type(self._source)
+
+    def __getattr__(self, name: str) -> Any:
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+
+        attr = getattr(self._source, name)
+        if name.startswith("_") or not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def dispatch(*args: Any, **kwargs: Any) -> Any:
+            return await self._client._dispatch(self._source, name, attr, args, kwargs)
+
+        self._methods[name] = dispatch
+        return dispatch
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._source, name, value)
+        self._methods.pop(name, None)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._source)
+
+    def __repr__(self) -> str:
+        return f"<_SourceProxy {self._source!r}>"
+
+
 class ApiClient:
     """
     统一的数据源访问客户端
@@ -76,26 +162,64 @@ class ApiClient:
         with self._lock:
             if self._initialized:  # Double-check
                 return
+            # 已加载的数据源实例，注册表中的数据源在首次访问时加载
             self._sources: Dict[str, BaseAPI] = {}
             self._functions: Dict[str, BaseAPI] = {}
+            self._source_registry: Dict[str, SourceSpec] = dict(SOURCE_REGISTRY)
+            self._function_registry: Dict[str, SourceSpec] = dict(FUNCTION_REGISTRY)
+            self._sources_lock = threading.Lock()
+            # 所有数据源共享的传输层及其 keep-alive 连接池
+            self._transport = create_transport(
+                config["transport"],
+                limit=config["connection_limit"],
+                limit_per_host=config["connection_limit_per_host"],
+                keepalive_timeout=config["keepalive_timeout"],
+            )
+            # 所有数据源共享的响应缓存，各方法的 TTL 通过 cache.cached 声明
+            self._response_cache = ResponseCache(maxsize=config["response_cache_maxsize"])
+            # 按上游 host 限流，所有数据源共享
+            self._rate_limiter = RateLimiter(config["rate_limits"], default=config["rate_limit_default"])
+            # 所有数据源共享的重试策略，熔断器按数据源各一个
+            self._retry_policy = RetryPolicy(
+                max_attempts=config["retry_max_attempts"],
+                base_delay=config["retry_base_delay"],
+                max_delay=config["retry_max_delay"],
+                total_timeout=config["retry_total_timeout"],
+            )
+            self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+            # 对冲请求执行器，对冲延迟不超过请求超时
+            self._hedger: Optional[Hedger] = None
+            if config["hedging_enabled"]:
+                self._hedger = Hedger(
+                    HedgePolicy(
+                        percentile=config["hedge_percentile"],
+                        max_delay=config["timeout"],
+                        budget_ratio=config["hedge_budget_ratio"],
+                    )
+                )
+            # 按数据源与方法统计调用指标
+            self._call_metrics: Optional[CallMetrics] = CallMetrics() if config["call_metrics_enabled"] else None
+            # 合并并发中的相同调用
+            self._singleflight = SingleFlight()
+            self._signatures: Dict[Tuple[type, str], inspect.Signature] = {}
+            self._proxies: Dict[str, _SourceProxy] = {}
+            self._sync: Optional[SyncApiClient] = None
+            # 数据源描述只依赖类的文档字符串，渲染一次后缓存；优先使用预构建的描述，避免导入数据源模块
+            self._desc_cache: Dict[Tuple[ApiType, str], str] = {}
+            self._prebuilt_descs = load_descriptions(config["api_descriptions_file"])
             self._load_data_sources()
             self._initialized = True
 
     def _load_data_sources(self):
         """
-        动态加载所有可用的数据源
-        通过扫描data_sources目录下的所有模块来加载数据源
+        加载未在注册表中登记的数据源
+        注册表中的数据源延迟到首次访问时加载（参见 _get_source），data_sources 目录下未登记的
+        *_source / *_function 模块仍在初始化时立即导入，保持自动发现新数据源的行为
         """
-        current_dir = Path(__file__).parent
-        for module_info in pkgutil.iter_modules([str(current_dir)]):
-            type_dict = self._sources
-            if module_info.name.endswith("_function"):
-                type_dict = self._functions
-            elif not module_info.name.endswith("_source"):
-                continue
-
+        for module_name in find_unregistered_modules():
+            type_dict = self._functions if module_name.endswith("_function") else self._sources
             try:
-                module = importlib.import_module(f".{module_info.name}", package="external_api.data_sources")
+                module = importlib.import_module(f".{module_name}", package=DATA_SOURCES_PACKAGE)
                 for item_name in dir(module):
                     item = getattr(module, item_name)
                     if (
@@ -104,12 +228,229 @@ class ApiClient:
                         and item != BaseAPI
                         and item.__name__ not in self._exclude_sources
                     ):
-                        source = item(config)
+                        source = self._create_source(item)
                         type_dict[source.source_name] = source
             except Exception as e:
-                logger.error(f"加载数据源模块 {module_info.name} 失败: {str(e)}\n")
+                logger.error(f"加载数据源模块 {module_name} 失败: {str(e)}\n")
                 logger.exception(e)
 
+    def _create_source(self, source_class: type) -> BaseAPI:
+        source = source_class(config)
+        source.bind_transport(self._transport)
+        source.bind_response_cache(self._response_cache)
+        source.bind_rate_limiter(self._rate_limiter)
+        breaker = None
+        if config["circuit_failure_threshold"] > 0:
+            breaker = CircuitBreaker(source.source_name, config["circuit_failure_threshold"], config["circuit_recovery_timeout"])
+            self._circuit_breakers[source.source_name] = breaker
+        source.bind_resilience(self._retry_policy, breaker)
+        source.bind_hedger(self._hedger)
+        return source
+
+    def _get_source(self, name: str, api_type: ApiType = ApiType.DATA_SOURCE) -> Optional[BaseAPI]:
+        """
+        获取数据源实例，注册表中的数据源在首次访问时导入模块并实例化
+
+        Args:
+            name: 数据源名称
+            api_type: 数据源类型
+
+        Returns:
+            Optional[BaseAPI]: 数据源实例，不存在或加载失败时返回 None
+        """
+        if api_type == ApiType.FUNCTION:
+            type_dict, registry = self._functions, self._function_registry
+        else:
+            type_dict, registry = self._sources, self._source_registry
+
+        source = type_dict.get(name)
+        if source is not None:
+            return source
+        spec = registry.get(name)
+        if spec is None or spec.class_name in self._exclude_sources:
+            return None
+
+        with self._sources_lock:
+            source = type_dict.get(name)
+            if source is not None:  # Double-check
+                return source
+            try:
+                module = importlib.import_module(f".{spec.module}", package=DATA_SOURCES_PACKAGE)
+                source = self._create_source(getattr(module, spec.class_name))
+            except Exception as e:
+                logger.error(f"加载数据源 {name} ({spec.module}.{spec.class_name}) 失败: {str(e)}\n")
+                logger.exception(e)
+                return None
+            if source.source_name != name:
+                logger.warning(f"数据源 {spec.module}.{spec.class_name} 的 source_name 为 {source.source_name}，与注册名 {name} 不一致")
+            type_dict[name] = source
+            return source
+
+    def _get_source_names(self, api_type: ApiType = ApiType.DATA_SOURCE) -> List[str]:
+        if api_type == ApiType.FUNCTION:
+            names = list(self._function_registry) + list(self._functions)
+        else:
+            names = list(self._source_registry) + list(self._sources)
+        return list(dict.fromkeys(names))
+
+    def preload_sources(self) -> None:
+        """
+        Load all registered data sources and functions immediately, e.g. to warm up a long-running server
+        """
+        for name in self._get_source_names(ApiType.DATA_SOURCE):
+            self._get_source(name, ApiType.DATA_SOURCE)
+        for name in self._get_source_names(ApiType.FUNCTION):
+            self._get_source(name, ApiType.FUNCTION)
+
+    async def close(self) -> None:
+        """
+        Close the shared transport and connection pool used by all data sources
+        """
+        await self._transport.close()
+
+    async def close_current_loop(self) -> None:
+        """
+        Close only the connections the shared transport holds for the running event loop,
+        other event loops using this client keep their connections
+        """
+        await self._transport.close_current_loop()
+
+    @property
+    def sync(self) -> SyncApiClient:
+        """
+        Synchronous facade for callers without an event loop, e.g. client.sync.yahoo_finance.get_stock_price("AAPL", "2024-01-01", "2024-02-01")
+        Calls run on one long-lived background event loop thread and reuse its pooled connections
+
+        Returns:
+            SyncApiClient: facade shared by all threads
+        """
+        if self._sync is None:
+            with self._lock:
+                if self._sync is None:  # Double-check
+                    self._sync = SyncApiClient(self)
+        return self._sync
+
+    async def _dispatch(
+        self,
+        source: BaseAPI,
+        method_name: str,
+        method: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        调用数据源方法并记录调用指标与追踪 span，并发中的相同调用只向上游请求一次
+
+        Args:
+            source: 数据源实例
+            method_name: 方法名
+            method: 已绑定数据源实例的协程方法
+            args: 位置参数
+            kwargs: 关键字参数
+
+        Returns:
+            Any: 方法返回值
+        """
+        call = functools.partial(self._coalesce, source, method_name, method, args, kwargs)
+        with tracing.span(f"{source.source_name}.{method_name}") as span:
+            if self._call_metrics is None:
+                result = await call()
+            else:
+                result = await self._call_metrics.observe(source.source_name, method_name, call)
+            if span is not None and isinstance(result, dict) and result.get("success") is False:
+                span.status = tracing.SPAN_STATUS_ERROR
+                span.set_attribute("error", result.get("error"))
+            return result
+
+    async def _coalesce(
+        self,
+        source: BaseAPI,
+        method_name: str,
+        method: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        调用数据源方法，开启 singleflight 时合并并发中的相同调用，参数参见 _dispatch
+        """
+        if not config["singleflight_enabled"]:
+            return await method(*args, **kwargs)
+
+        signature_key = (type(source), method_name)
+        signature = self._signatures.get(signature_key)
+        if signature is None:
+            signature = self._signatures[signature_key] = inspect.signature(method)
+
+        key = make_call_key(f"{source.source_name}.{method_name}", signature, args, kwargs)
+        if key is None:
+            return await method(*args, **kwargs)
+        return await self._singleflight.do(key, lambda: method(*args, **kwargs))
+
+    def get_singleflight_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of concurrent call coalescing
+
+        Returns:
+            Dict[str, int]: in_flight - number of distinct calls currently running, shared - number of calls served by another in-flight call
+        """
+        return {"in_flight": self._singleflight.in_flight, "shared": self._singleflight.shared}
+
+    def get_call_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-method call metrics of data source calls made through the client, empty when call metrics are disabled
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {"source.method": stats}, stats contain calls, success, errors, cancelled,
+            latency (avg and max in seconds, buckets as {upper bound: count}), requests (upstream requests incl. retries),
+            bytes_out, bytes_in, cache_hits, cache_misses and cache_hit_rate
+        """
+        return self._call_metrics.get_stats() if self._call_metrics is not None else {}
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-host rate limiter statistics
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {host: stats}, stats contain rate, burst, queue_depth (callers currently waiting),
+            acquired, waited, total_wait, avg_wait and max_wait (seconds)
+        """
+        return self._rate_limiter.get_stats()
+
+    def get_circuit_breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the circuit breaker state of every loaded data source
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {source_name: stats}, stats contain state (closed/open/half_open),
+            failures (consecutive), opened (times opened) and rejected (requests failed fast)
+        """
+        return {name: breaker.get_stats() for name, breaker in list(self._circuit_breakers.items())}
+
+    def get_hedge_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get hedged request statistics per endpoint, empty when hedging is disabled
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {"source.endpoint": stats}, stats contain requests, hedged (hedges sent),
+            hedge_wins (hedges that answered first), skipped (hedges suppressed by the budget) and delay (current hedge delay in seconds)
+        """
+        return self._hedger.get_stats() if self._hedger is not None else {}
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics of the response cache shared by all data sources
+
+        Returns:
+            Dict[str, Any]: Cache statistics, see ResponseCache.get_stats
+        """
+        return self._response_cache.get_stats()
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached responses
+        """
+        self._response_cache.clear()
+
     def get_function_desc(self, function_name: str) -> str:
         """
         Get a brief description and usage example of the specified function
@@ -145,86 +486,22 @@ class ApiClient:
         Returns:
             str: Readable description of the data source and its API
         """
-        output_lines = ["# Available data sources (refer to the python code examples, write python code to call them)\n"]
-
-        # Directly use the mapping value to get the data source instance
-        if api_type == ApiType.DATA_SOURCE:
-            api = self._sources.get(api_name)
+        key = (api_type, api_name)
+        desc = self._desc_cache.get(key)
+        if desc is not None:
+            return desc
+
+        prebuilt = self._prebuilt_descs.get(api_type.value, {}).get(api_name)
+        if prebuilt is not None:
+            desc = prebuilt["desc"]
         else:
-            api = self._functions.get(api_name)
-
-        if not api:
-            return f"# {api_type.value} {api_name} does not exist"
-
-        api_info = api.get_api_info()
-
-        # Add data source title and description
-        display_name = api_info.get("name", api_name)
-        source_desc = api_info.get("description", "No description available")
-        output_lines.extend([f"## {display_name}", f"{source_desc}\n"])
-
-        # Get data source methods
-        apis = []
-        for method_name, method in inspect.getmembers(api.__class__, predicate=inspect.isfunction):
-            # Skip internal methods
-            if method_name.startswith("_") or method_name in EXCLUDE_METHODS:
-                continue
-
-            # Get method docstring
-            doc = inspect.getdoc(method)
-            if not doc:
-                continue
+            api = self._get_source(api_name, api_type)
+            if not api:
+                return f"# {api_type.value} {api_name} does not exist"
+            desc = render_api_desc(api, api_name)
 
-            # Parse docstring
-            docstring = parse(doc)
-
-            # Prepare method description
-            method_lines = [f"### {method_name}"]
-            if docstring.short_description:
-                method_lines.append(docstring.short_description + "\n")
-
-            # Add parameter description
-            if docstring.params:
-                method_lines.append("**Parameters:**")
-                for param in docstring.params:
-                    param_desc = f"- `{param.arg_name}`"
-                    if param.type_name:
-                        param_desc += f": {param.type_name}"
-                    if param.description:
-                        param_desc += f" - {param.description}"
-                    method_lines.append(param_desc)
-                method_lines.append("")
-
-            # Add return value description
-            if docstring.returns:
-                method_lines.append("**Returns:**")
-                if docstring.returns.type_name:
-                    method_lines.append(f"Type: `{docstring.returns.type_name}`")
-                if docstring.returns.description:
-                    method_lines.append("```")
-                    method_lines.append(docstring.returns.description)
-                    method_lines.append("```")
-                method_lines.append("")
-
-            # Add example
-            if docstring.examples:
-                method_lines.append("**Example:**")
-                method_lines.append("```python")
-                for example in docstring.examples:
-                    if example.description:
-                        # Directly add example code, no processing
-                        method_lines.append(example.description.strip())
-                method_lines.append("```")
-                method_lines.append("")
-
-            apis.extend(method_lines)
-
-        # Merge all method descriptions
-        if apis:
-            output_lines.extend(apis)
-        output_lines.append("---\n")
-
-        return "\n".join(output_lines)
+        self._desc_cache[key] = desc
+        return desc
 
     def get_data_sources_basic_info(self) -> Dict[str, Dict[str, str]]:
         """
@@ -235,12 +512,19 @@ class ApiClient:
         """
         result = {}
 
-        for name, source in self._sources.items():
+        for name in self._get_source_names(ApiType.DATA_SOURCE):
             # yahoo_finance和twitter 已通过 tool 实现，这里不展示
             if name in ["yahoo_finance", "twitter", "booking", "pinterest", "tripadvisor"]:
                 continue
 
-            source_info = source.get_api_info()
+            prebuilt = self._prebuilt_descs.get(ApiType.DATA_SOURCE.value, {}).get(name)
+            if prebuilt is not None:
+                source_info = prebuilt["info"]
+            else:
+                source = self._get_source(name, ApiType.DATA_SOURCE)
+                if source is None:
+                    continue
+                source_info = source.get_api_info()
 
             # Get display name and description
             display_name = source_info.get("name", name)
@@ -256,26 +540,33 @@ class ApiClient:
         获取所有数据源的所有方法的描述
         """
         result = []
-        for function_name, function in self._functions.items():
+        for function_name in self._get_source_names(ApiType.FUNCTION):
             result.append(self.get_function_desc(function_name))
         return "\n".join(result)
 
-    def __getattr__(self, name: str) -> BaseAPI:
+    def __getattr__(self, name: str) -> _SourceProxy:
         """
-        Get data source instance by attribute access
+        Get data source by attribute access
+        Coroutine methods called through it are dispatched by the client, identical concurrent calls are coalesced
 
         Args:
             name: data source name
 
         Returns:
-            BaseDataSource: data source instance
+            _SourceProxy: proxy of the data source instance, isinstance checks and attribute reads / writes behave as on the instance
 
         Raises:
             AttributeError: data source does not exist
         """
-        if name not in self._sources:
-            raise AttributeError(f"Data source {name} does not exist")
-        return self._sources[name]
+        if name.startswith("_"):
+            raise AttributeError(name)
+        proxy = self._proxies.get(name)
+        if proxy is None:
+            source = self._get_source(name, ApiType.DATA_SOURCE)
+            if source is None:
+                raise AttributeError(f"Data source {name} does not exist")
+            proxy = self._proxies[name] = _SourceProxy(self, source)
+        return proxy
 
 
 # 全局默认实例
@@ -0,0 +1,174 @@
+"""
+统一的 JSON 编解码
+
+数据源、传输层与 FunctionProxy 都通过这里编解码 JSON，直接对原始字节操作，避免 bytes -> str 的中间拷贝。
+后端按以下顺序选择第一个可用的，也可以用环境变量 EXTERNAL_API_JSON_CODEC 指定（orjson / msgspec / json）:
+- orjson（可选依赖）
+- msgspec（可选依赖）
+- json（标准库）
+
+快速后端拒绝的输入自动回退到标准库:
+- 解码: 含 NaN / Infinity 字面量等标准库接受而快速后端拒绝的输入，回退后结果与标准库一致
+- 编码: 无法编码的对象（如超出 64 位的整数）回退到标准库
+与标准库不一致之处:
+- 编码: orjson / msgspec 把 NaN / Infinity 编码为 null（合法的 JSON），不会触发回退；
+  标准库输出不合法的 NaN / Infinity 字面量。需要区分时先自行检查
+- 解码: orjson 将超出 64 位的整数解码为 float
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Tuple, Union
+
+logger = logging.getLogger("codec")
+
+EXTERNAL_API_JSON_CODEC_ENV_NAME = "EXTERNAL_API_JSON_CODEC"
+
+CODEC_ORJSON = "orjson"
+CODEC_MSGSPEC = "msgspec"
+CODEC_JSON = "json"
+
+
+def _json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_orjson() -> Tuple[Callable[[Any], Any], Callable[[Any], bytes]]:
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=option)
+
+    return orjson.loads, dumps
+
+
+def _load_msgspec() -> Tuple[Callable[[Any], Any], Callable[[Any], bytes]]:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    # msgspec 的异常不继承 ValueError / TypeError，转换为与标准库一致的异常类型
+    def loads(data: Any) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return encoder.encode(obj)
+        except msgspec.EncodeError as e:
+            raise TypeError(str(e)) from e
+
+    return loads, dumps
+
+
+_BACKENDS: Dict[str, Callable[[], Tuple[Callable[[Any], Any], Callable[[Any], bytes]]]] = {
+    CODEC_ORJSON: _load_orjson,
+    CODEC_MSGSPEC: _load_msgspec,
+    CODEC_JSON: lambda: (_json_loads, _json_dumps),
+}
+
+
+def get_codec(name: str) -> Tuple[Callable[[Any], Any], Callable[[Any], bytes]]:
+    """
+    获取指定后端的 (loads, dumps)，不带回退
+
+    Args:
+        name: orjson / msgspec / json
+
+    Returns:
+        Tuple[Callable, Callable]: loads 接受 bytes 或 str，dumps 返回 UTF-8 编码的 bytes
+
+    Raises:
+        ValueError: 未知的后端
+        ImportError: 后端未安装
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON codec: {name}, expected one of {', '.join(_BACKENDS)}")
+    return _BACKENDS[name]()
+
+
+def _select_backend() -> Tuple[str, Callable[[Any], Any], Callable[[Any], bytes]]:
+    requested = os.getenv(EXTERNAL_API_JSON_CODEC_ENV_NAME, "")
+    candidates = [requested] if requested else [CODEC_ORJSON, CODEC_MSGSPEC]
+    for name in candidates:
+        try:
+            fast_loads, fast_dumps = get_codec(name)
+            return name, fast_loads, fast_dumps
+        except ImportError:
+            if requested:
+                logger.warning(f"JSON codec {requested} is not installed, falling back to json")
+    return CODEC_JSON, _json_loads, _json_dumps
+
+
+CODEC_NAME, _fast_loads, _fast_dumps = _select_backend()
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    解码 JSON
+
+    Args:
+        data: 原始字节或字符串
+
+    Returns:
+        Any: 解码结果
+
+    Raises:
+        ValueError: 不是合法的 JSON（json.JSONDecodeError）
+    """
+    try:
+        return _fast_loads(data)
+    except ValueError:
+        if _fast_loads is _json_loads:
+            raise
+    return _json_loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    编码 JSON，不转义非 ASCII 字符；使用 orjson / msgspec 时 NaN / Infinity 编码为 null
+
+    Args:
+        obj: 待编码对象
+
+    Returns:
+        bytes: UTF-8 编码的 JSON
+
+    Raises:
+        TypeError: 对象无法编码为 JSON
+    """
+    try:
+        return _fast_dumps(obj)
+    except (TypeError, ValueError, OverflowError):
+        if _fast_dumps is _json_dumps:
+            raise
+    return _json_dumps(obj)
+
+
+def loads_payload(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    解码上游响应，部分上游把 JSON 再编码为字符串返回，此时再解码一次
+
+    Args:
+        data: 原始字节或字符串
+
+    Returns:
+        Any: 解码结果
+    """
+    result = loads(data)
+    if isinstance(result, str):
+        try:
+            return loads(result)
+        except ValueError:
+            return result
+    return result
@@ -3,13 +3,13 @@ Commodities data source implementation
 """
 
 import asyncio
-import json
 import logging
 from typing import Any, Dict, Optional
 
 import aiohttp
 
 from .base import BaseAPI
+from .cache import CACHE_TTL_DAY, cached
 
 logger = logging.getLogger("commodities_source")
 
@@ -45,6 +45,7 @@ class CommoditiesSource(BaseAPI):
             "description": "Commodity price data source, provides price information for commodities such as COCOA, COFFEE, CORN, OIL, SOYBEAN, SUGAR, WHEAT, etc.",
         }
 
+    @cached(ttl=CACHE_TTL_DAY)
     async def get_supported_commodities(self) -> Dict[str, Any]:
         """Get the list of supported commodities.
         This method is used to get the list of commodities that can be queried.
@@ -83,16 +84,12 @@ class CommoditiesSource(BaseAPI):
         try:
             request_url = f"{self.proxy_url}/v1/supported"
 
-            # Send request using aiohttp
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(request_url, headers=self._headers, timeout=self._timeout) as response:
-                    response.raise_for_status()
+            # Send request
+            response = await self._request("GET", request_url, headers=self._headers, timeout=self._timeout)
+            response.raise_for_status()
 
-                    # Parse the response
-                    data = await response.json(content_type=None)
-
-            if isinstance(data, str):
-                data = json.loads(data)
+            # Parse the response
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
@@ -170,16 +167,12 @@ class CommoditiesSource(BaseAPI):
 
             request_url = f"{self.proxy_url}/v1/market-data"
 
-            # Send request using aiohttp
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(request_url, headers=self._headers, params=params, timeout=self._timeout) as response:
-                    response.raise_for_status()
-
-                    # Parse the response
-                    data = await response.json(content_type=None)
+            # Send request
+            response = await self._request("GET", request_url, headers=self._headers, params=params, timeout=self._timeout)
+            response.raise_for_status()
 
-            if isinstance(data, str):
-                data = json.loads(data)
+            # Parse the response
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
@@ -0,0 +1,220 @@
+"""
+数据源描述的渲染、缓存与预构建
+
+ApiClient 每次构建 prompt 都需要数据源描述，描述只依赖数据源类的文档字符串，因此:
+- render_api_desc: 由数据源实例渲染 markdown 描述，ApiClient 按数据源缓存渲染结果
+- 构建步骤将所有描述写入 api_descriptions.json，ApiClient 启动时直接加载，无需导入数据源模块:
+    cd system && python -m external_api.data_sources.descriptions [--markdown api_descriptions.md]
+
+产物中记录了每个数据源模块文件的哈希，模块修改后对应条目自动失效，回退为实时渲染
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .base import EXCLUDE_METHODS, BaseAPI
+
+logger = logging.getLogger("descriptions")
+
+DESCRIPTIONS_FILE = os.path.join(os.path.dirname(__file__), "api_descriptions.json")
+DESC_HEADER = "# Available data sources (refer to the python code examples, write python code to call them)\n"
+
+_PACKAGE_DIR = Path(__file__).parent
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _generator_fingerprint() -> str:
+    """
+    渲染结果同时依赖 base.py（公共方法与 EXCLUDE_METHODS）和本模块的渲染逻辑
+    """
+    return _file_hash(_PACKAGE_DIR / "base.py") + _file_hash(Path(__file__))
+
+
+def _module_hash(module: str) -> Optional[str]:
+    path = _PACKAGE_DIR / f"{module}.py"
+    return _file_hash(path) if path.exists() else None
+
+
+def render_api_desc(api: BaseAPI, api_name: str) -> str:
+    """
+    渲染数据源的 markdown 描述，包括数据源简介以及每个公开方法的参数、返回值和示例
+
+    Args:
+        api: 数据源实例
+        api_name: 数据源名称
+
+    Returns:
+        str: 数据源描述
+    """
+    from docstring_parser import parse
+
+    output_lines = [DESC_HEADER]
+
+    api_info = api.get_api_info()
+
+    # Add data source title and description
+    display_name = api_info.get("name", api_name)
+    source_desc = api_info.get("description", "No description available")
+    output_lines.extend([f"## {display_name}", f"{source_desc}\n"])
+
+    # Get data source methods
+    apis = []
+    for method_name, method in inspect.getmembers(api.__class__, predicate=inspect.isfunction):
+        # Skip internal methods
+        if method_name.startswith("_") or method_name in EXCLUDE_METHODS:
+            continue
+
+        # Get method docstring
+        doc = inspect.getdoc(method)
+        if not doc:
+            continue
+
+        # Parse docstring
+        docstring = parse(doc)
+
+        # Prepare method description
+        method_lines = [f"### {method_name}"]
+        if docstring.short_description:
+            method_lines.append(docstring.short_description + "\n")
+
+        # Add parameter description
+        if docstring.params:
+            method_lines.append("**Parameters:**")
+            for param in docstring.params:
+                param_desc = f"- `{param.arg_name}`"
+                if param.type_name:
+                    param_desc += f": {param.type_name}"
+                if param.description:
+                    param_desc += f" - {param.description}"
+                method_lines.append(param_desc)
+            method_lines.append("")
+
+        # Add return value description
+        if docstring.returns:
+            method_lines.append("**Returns:**")
+            if docstring.returns.type_name:
+                method_lines.append(f"Type: `{docstring.returns.type_name}`")
+            if docstring.returns.description:
+                method_lines.append("```")
+                method_lines.append(docstring.returns.description)
+                method_lines.append("```")
+            method_lines.append("")
+
+        # Add example
+        if docstring.examples:
+            method_lines.append("**Example:**")
+            method_lines.append("```python")
+            for example in docstring.examples:
+                if example.description:
+                    # Directly add example code, no processing
+                    method_lines.append(example.description.strip())
+            method_lines.append("```")
+            method_lines.append("")
+
+        apis.extend(method_lines)
+
+    # Merge all method descriptions
+    if apis:
+        output_lines.extend(apis)
+    output_lines.append("---\n")
+
+    return "\n".join(output_lines)
+
+
+def build_descriptions(client: Any) -> Dict[str, Any]:
+    """
+    渲染 ApiClient 中所有数据源与函数的描述
+
+    Args:
+        client: ApiClient 实例
+
+    Returns:
+        Dict[str, Any]: 可写入 api_descriptions.json 的描述数据
+    """
+    from .client import ApiType
+
+    result: Dict[str, Any] = {"fingerprint": _generator_fingerprint()}
+    for api_type in ApiType:
+        entries = {}
+        for name in client._get_source_names(api_type):
+            api = client._get_source(name, api_type)
+            if api is None:
+                continue
+            module = type(api).__module__.rsplit(".", 1)[-1]
+            entries[name] = {
+                "module": module,
+                "module_hash": _module_hash(module),
+                "info": api.get_api_info(),
+                "desc": render_api_desc(api, name),
+            }
+        result[api_type.value] = entries
+    return result
+
+
+def load_descriptions(path: str = DESCRIPTIONS_FILE) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    加载预构建的描述，丢弃模块已被修改的条目
+
+    Args:
+        path: api_descriptions.json 路径
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, Any]]]: {api_type: {name: {"info": ..., "desc": ...}}}，
+        文件不存在、无法解析或已过期时返回空字典
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.warning(f"加载预构建的数据源描述失败: {str(e)}")
+        return {}
+
+    if data.get("fingerprint") != _generator_fingerprint():
+        logger.info("预构建的数据源描述已过期，将实时渲染")
+        return {}
+
+    result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for api_type, entries in data.items():
+        if api_type == "fingerprint":
+            continue
+        result[api_type] = {
+            name: entry for name, entry in entries.items() if entry.get("module_hash") == _module_hash(entry.get("module", ""))
+        }
+    return result
+
+
+def main() -> None:
+    from .client import ApiClient
+
+    parser = argparse.ArgumentParser(description="Render all data source descriptions into a startup artifact")
+    parser.add_argument("--output", default=DESCRIPTIONS_FILE, help="JSON artifact path")
+    parser.add_argument("--markdown", default="", help="also write all descriptions into a markdown file")
+    args = parser.parse_args()
+
+    data = build_descriptions(ApiClient())
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    if args.markdown:
+        with open(args.markdown, "w", encoding="utf-8") as f:
+            for api_type, entries in data.items():
+                if api_type == "fingerprint":
+                    continue
+                for entry in entries.values():
+                    f.write(entry["desc"] + "\n")
+    print(f"Wrote {sum(len(v) for k, v in data.items() if k != 'fingerprint')} descriptions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
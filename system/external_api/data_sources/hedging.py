@@ -0,0 +1,143 @@
+"""
+对冲请求（hedged requests）
+
+用于延迟长尾明显的上游接口（需要在数据源中显式使用 BaseAPI._hedged_request，默认关闭）:
+- 按接口记录最近的请求耗时，首个请求超过其 percentile 分位耗时仍未返回时，再发送一个相同的请求，取先成功返回的结果，另一个取消
+- 分位耗时在 [min_delay, max_delay] 之间，样本数不足 min_samples 时不对冲
+- 对冲受预算限制: 每个首发请求为预算增加 budget_ratio，每次对冲消耗 1，预算上限 budget_burst，
+  因此对冲请求最多占首发请求的 budget_ratio，上游变慢时不会把负载放大一倍
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, NamedTuple, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class HedgePolicy(NamedTuple):
+    """
+    对冲策略
+    """
+
+    percentile: float = 0.95  # 超过该分位耗时未返回时发送对冲请求
+    min_delay: float = 0.05  # 对冲延迟下限（秒）
+    max_delay: float = 30.0  # 对冲延迟上限（秒）
+    min_samples: int = 20  # 至少积累多少个耗时样本后才开始对冲
+    window: int = 256  # 计算分位耗时使用的最近样本数
+    budget_ratio: float = 0.1  # 对冲请求数占首发请求数的上限
+    budget_burst: float = 10.0  # 预算上限，限制空闲后的集中对冲
+
+
+class _HedgeState:
+    def __init__(self, policy: HedgePolicy):
+        self.latencies: Deque[float] = deque(maxlen=policy.window)
+        self.budget = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.skipped = 0  # 达到对冲延迟但预算不足的请求数
+
+
+class Hedger:
+    """
+    按接口执行对冲请求，线程安全
+    """
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        self.policy = policy or HedgePolicy()
+        self._states: Dict[str, _HedgeState] = {}
+        self._lock = threading.Lock()
+
+    def _get_state(self, key: str) -> _HedgeState:
+        state = self._states.get(key)
+        if state is None:
+            with self._lock:
+                state = self._states.setdefault(key, _HedgeState(self.policy))
+        return state
+
+    def _hedge_delay(self, state: _HedgeState) -> Optional[float]:
+        if len(state.latencies) < self.policy.min_samples:
+            return None
+        samples = sorted(state.latencies)
+        index = min(len(samples) - 1, int(self.policy.percentile * len(samples)))
+        return min(self.policy.max_delay, max(self.policy.min_delay, samples[index]))
+
+    def _take_budget(self, state: _HedgeState) -> bool:
+        with self._lock:
+            if state.budget < 1:
+                state.skipped += 1
+                return False
+            state.budget -= 1
+            state.hedged += 1
+            return True
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        执行请求，必要时发送一个对冲请求
+
+        Args:
+            key: 接口标识，耗时样本与预算按 key 统计
+            fn: 无参协程函数，每次调用发送一个请求
+
+        Returns:
+            T: 先成功返回的结果；两个请求都失败时抛出首发请求的异常
+        """
+        state = self._get_state(key)
+        with self._lock:
+            state.requests += 1
+            state.budget = min(self.policy.budget_burst, state.budget + self.policy.budget_ratio)
+            delay = self._hedge_delay(state)
+
+        start = time.monotonic()
+        primary = asyncio.ensure_future(fn())
+        hedge: Optional["asyncio.Future[T]"] = None
+        try:
+            if delay is not None:
+                await asyncio.wait({primary}, timeout=delay)
+                if not primary.done() and self._take_budget(state):
+                    hedge = asyncio.ensure_future(fn())
+                    hedge_start = time.monotonic()
+
+            if hedge is None:
+                result = await primary
+                state.latencies.append(time.monotonic() - start)
+                return result
+
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (primary, hedge):
+                    if task in done and task.exception() is None:
+                        elapsed = time.monotonic() - (start if task is primary else hedge_start)
+                        state.latencies.append(elapsed)
+                        if task is hedge:
+                            with self._lock:
+                                state.hedge_wins += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取各接口的对冲统计
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {key: {requests, hedged, hedge_wins, skipped, delay}}，delay 为当前对冲延迟（秒），样本不足时为 None
+        """
+        with self._lock:
+            return {
+                key: {
+                    "requests": state.requests,
+                    "hedged": state.hedged,
+                    "hedge_wins": state.hedge_wins,
+                    "skipped": state.skipped,
+                    "delay": self._hedge_delay(state),
+                }
+                for key, state in self._states.items()
+            }
@@ -0,0 +1,202 @@
+"""
+数据源调用指标
+
+经由 ApiClient 调用的每个数据源方法（client.<source>.<method>(...)）按 (数据源, 方法) 统计:
+- 调用次数与结果: success / error（抛出异常或返回 {"success": False, ...}）/ cancelled
+- 耗时直方图（LATENCY_BUCKETS，秒）、总耗时与最大耗时
+- 上游请求数与字节数: bytes_out 为请求体，bytes_in 为响应体，重试与对冲请求都计入，由 BaseAPI._request 上报
+- 响应缓存命中与未命中，由 cache.cached 上报
+当前调用通过 contextvars 传递，调用中创建的任务（并发子请求、对冲请求、singleflight 共享任务）也计入该调用；
+合并到其他调用上的 singleflight 等待者不产生上游请求
+
+同时上报到 metrics.metrics（与 browser/global_browser.py 相同），该模块不存在时不上报，本地统计不受影响:
+- external_api_call {source, method, status}
+- external_api_call_latency {source, method, bucket}: 耗时所在桶的上限（秒），最后一个桶为 +Inf
+- external_api_cache {source, method, result}: hit / miss
+"""
+
+import asyncio
+import bisect
+import contextvars
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+try:
+    from metrics.metrics import metrics_counter_inc
+except ImportError:
+
+    def metrics_counter_inc(name: str, labels: Dict[str, str]) -> None:
+        pass
+
+
+T = TypeVar("T")
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+STATUS_SUCCESS = "success"
+STATUS_ERROR = "error"
+STATUS_CANCELLED = "cancelled"
+
+
+class _CallRecord:
+    __slots__ = ("requests", "bytes_out", "bytes_in", "cache_hit")
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.cache_hit: Optional[bool] = None
+
+
+_current_call: contextvars.ContextVar[Optional[_CallRecord]] = contextvars.ContextVar("external_api_call", default=None)
+
+
+def record_request(bytes_out: int, bytes_in: int) -> None:
+    """
+    记录当前调用的一次上游请求，不在被统计的调用中时忽略
+
+    Args:
+        bytes_out: 请求体字节数
+        bytes_in: 响应体字节数，请求失败时为 0
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.requests += 1
+        call.bytes_out += bytes_out
+        call.bytes_in += bytes_in
+
+
+def record_cache(hit: bool) -> None:
+    """
+    记录当前调用的响应缓存结果，不在被统计的调用中时忽略
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.cache_hit = hit
+
+
+class _MethodStats:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.calls = 0
+        self.success = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.latency_counts: List[int] = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.requests = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("success") is False
+
+
+class CallMetrics:
+    """
+    按 (数据源, 方法) 汇总调用指标，线程安全
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_labels = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        self._stats: Dict[Tuple[str, str], _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    async def observe(self, source: str, method: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        执行一次调用并记录指标
+
+        Args:
+            source: 数据源名称
+            method: 方法名
+            fn: 无参协程函数，执行实际调用
+
+        Returns:
+            T: fn 的返回值，异常原样抛出
+        """
+        call = _CallRecord()
+        token = _current_call.set(call)
+        status = STATUS_ERROR
+        start = time.perf_counter()
+        try:
+            result = await fn()
+            status = STATUS_ERROR if _is_error(result) else STATUS_SUCCESS
+            return result
+        except asyncio.CancelledError:
+            status = STATUS_CANCELLED
+            raise
+        finally:
+            _current_call.reset(token)
+            self._record(source, method, status, time.perf_counter() - start, call)
+
+    def _record(self, source: str, method: str, status: str, latency: float, call: _CallRecord) -> None:
+        bucket = bisect.bisect_left(self.buckets, latency)
+        key = (source, method)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _MethodStats(self.buckets)
+            stats.calls += 1
+            if status == STATUS_SUCCESS:
+                stats.success += 1
+            elif status == STATUS_ERROR:
+                stats.errors += 1
+            else:
+                stats.cancelled += 1
+            stats.latency_counts[bucket] += 1
+            stats.latency_sum += latency
+            stats.latency_max = max(stats.latency_max, latency)
+            stats.requests += call.requests
+            stats.bytes_out += call.bytes_out
+            stats.bytes_in += call.bytes_in
+            if call.cache_hit is True:
+                stats.cache_hits += 1
+            elif call.cache_hit is False:
+                stats.cache_misses += 1
+
+        labels = {"source": source, "method": method}
+        metrics_counter_inc("external_api_call", {**labels, "status": status})
+        metrics_counter_inc("external_api_call_latency", {**labels, "bucket": self._bucket_labels[bucket]})
+        if call.cache_hit is not None:
+            metrics_counter_inc("external_api_cache", {**labels, "result": "hit" if call.cache_hit else "miss"})
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取各方法的调用指标
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {"source.method": stats}，stats 包括 calls、success、errors、cancelled、
+                latency（avg / max 秒，buckets 为 {桶上限: 次数}）、requests、bytes_out、bytes_in、
+                cache_hits、cache_misses、cache_hit_rate（没有缓存结果时为 None）
+        """
+        with self._lock:
+            result = {}
+            for (source, method), stats in self._stats.items():
+                cache_lookups = stats.cache_hits + stats.cache_misses
+                result[f"{source}.{method}"] = {
+                    "calls": stats.calls,
+                    "success": stats.success,
+                    "errors": stats.errors,
+                    "cancelled": stats.cancelled,
+                    "latency": {
+                        "avg": stats.latency_sum / stats.calls,
+                        "max": stats.latency_max,
+                        "buckets": dict(zip(self._bucket_labels, stats.latency_counts)),
+                    },
+                    "requests": stats.requests,
+                    "bytes_out": stats.bytes_out,
+                    "bytes_in": stats.bytes_in,
+                    "cache_hits": stats.cache_hits,
+                    "cache_misses": stats.cache_misses,
+                    "cache_hit_rate": stats.cache_hits / cache_lookups if cache_lookups else None,
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -3,7 +3,6 @@ Metal data source implementation
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -95,20 +94,15 @@ class MetalSource(BaseAPI):
 
             request_url = f"{self.proxy_url}/web-crawling/api/gold-index"
 
-            # Send request using aiohttp
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.post(request_url, headers=self._headers, params=params, json=payload, timeout=self._timeout) as response:
-                    response.raise_for_status()
-                    # Parse the response
-                    data = await response.json(content_type=None)
-
-            if isinstance(data, str):
-                data = json.loads(data)
+            # Send request
+            response = await self._request("POST", request_url, headers=self._headers, params=params, json=payload, timeout=self._timeout)
+            response.raise_for_status()
+            # Parse the response
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
 
-            print(data)
             result = {}
             for metal, info in data.get("data", {}).items():
                 metal_info = {
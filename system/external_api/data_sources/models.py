@@ -0,0 +1,335 @@
+"""
+解析结果模型
+
+推文、Pin、酒店详情与学术论文的解析结果默认以嵌套 dict 返回（records），一次会话中往往累积数千条，
+每个 dict 的哈希表开销远大于其中的数据。这里的模型使用 __slots__（dataclass(slots=True)）存储字段:
+- 数据源方法传入 output_format="models" 时直接返回模型，其余字段（success / count / cursor 等）不变
+- to_dict() 无损还原为 records 格式（键名、键顺序、可选键是否出现都与原 dict 一致），records 格式即由它生成
+- 部分模型字段名与 records 键名不同（如 ScholarPaper.cited_by / citedBy），序列化前先调用 to_dict()
+
+内存与速度对比见 benchmarks/models_bench.py
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# 解析结果的返回格式
+OUTPUT_FORMAT_RECORDS = "records"
+OUTPUT_FORMAT_MODELS = "models"
+OUTPUT_FORMATS = (OUTPUT_FORMAT_RECORDS, OUTPUT_FORMAT_MODELS)
+
+
+def check_output_format(output_format: str) -> None:
+    """
+    Raises:
+        ValueError: 不支持的 output_format
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output_format: {output_format}")
+
+
+@dataclass(slots=True)
+class TwitterUserMetrics:
+    followers_count: int
+    following_count: int
+    tweet_count: int
+    listed_count: int
+    like_count: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "followers_count": self.followers_count,
+            "following_count": self.following_count,
+            "tweet_count": self.tweet_count,
+            "listed_count": self.listed_count,
+            "like_count": self.like_count,
+        }
+
+
+@dataclass(slots=True)
+class TwitterUser:
+    id: str
+    username: Optional[str]
+    name: Optional[str]
+    created_at: Optional[str]
+    description: Optional[str]
+    location: Optional[str]
+    url: Optional[str]
+    profile_image_url: Optional[str]
+    profile_banner_url: Optional[str]
+    public_metrics: TwitterUserMetrics
+    verified: bool
+    blue_verified: bool
+    private: bool
+    bot: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "username": self.username,
+            "name": self.name,
+            "created_at": self.created_at,
+            "description": self.description,
+            "location": self.location,
+            "url": self.url,
+            "profile_image_url": self.profile_image_url,
+            "profile_banner_url": self.profile_banner_url,
+            "public_metrics": self.public_metrics.to_dict(),
+            "verified": self.verified,
+            "blue_verified": self.blue_verified,
+            "private": self.private,
+            "bot": self.bot,
+        }
+
+
+@dataclass(slots=True)
+class TweetMetrics:
+    retweet_count: int
+    reply_count: int
+    like_count: int
+    quote_count: int
+    view_count: int
+    bookmark_count: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "retweet_count": self.retweet_count,
+            "reply_count": self.reply_count,
+            "like_count": self.like_count,
+            "quote_count": self.quote_count,
+            "view_count": self.view_count,
+            "bookmark_count": self.bookmark_count,
+        }
+
+
+@dataclass(slots=True)
+class Tweet:
+    id: str
+    created_at: Optional[str]
+    text: str
+    language: Optional[str]
+    media_urls: List[str]
+    video_urls: List[str]
+    public_metrics: TweetMetrics
+    user: TwitterUser
+    referenced_tweets: Optional["ReferencedTweet"] = None  # 为空时 to_dict() 不输出该键
+
+    def to_dict(self) -> Dict[str, Any]:
+        tweet = {
+            "id": self.id,
+            "created_at": self.created_at,
+            "text": self.text,
+            "language": self.language,
+            "media_urls": self.media_urls,
+            "video_urls": self.video_urls,
+            "public_metrics": self.public_metrics.to_dict(),
+            "user": self.user.to_dict(),
+        }
+        if self.referenced_tweets is not None:
+            tweet["referenced_tweets"] = self.referenced_tweets.to_dict()
+        return tweet
+
+
+@dataclass(slots=True)
+class ReferencedTweet:
+    """
+    被引用的推文: reply 只有 id，retweet / quote 带完整的推文（被转推的推文可能再引用一条推文）
+    """
+
+    type: str  # reply / retweet / quote
+    id: Optional[str] = None
+    tweet: Optional[Tweet] = None
+    quoted_status: Optional["ReferencedTweet"] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.tweet is None:
+            return {"type": self.type, "id": self.id}
+        referenced = {"type": self.type, **self.tweet.to_dict()}
+        if self.quoted_status is not None:
+            referenced["quoted_status"] = self.quoted_status.to_dict()
+        return referenced
+
+
+@dataclass(slots=True)
+class PinVideo:
+    url: str
+    duration: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"url": self.url, "duration": self.duration}
+
+
+@dataclass(slots=True)
+class PinVideos:
+    has_video: bool
+    hls: Optional[PinVideo] = None  # V_HLSV4
+    mp4_720p: Optional[PinVideo] = None  # V_720P
+
+    def to_dict(self) -> Dict[str, Any]:
+        videos: Dict[str, Any] = {"has_video": self.has_video}
+        if self.hls is not None:
+            videos["V_HLSV4"] = self.hls.to_dict()
+        if self.mp4_720p is not None:
+            videos["V_720P"] = self.mp4_720p.to_dict()
+        return videos
+
+
+@dataclass(slots=True)
+class Pinner:
+    id: str
+    image_url: str
+    follower_count: int
+    username: str
+    full_name: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "image_url": self.image_url,
+            "follower_count": self.follower_count,
+            "username": self.username,
+            "full_name": self.full_name,
+        }
+
+
+@dataclass(slots=True)
+class Pin:
+    id: str
+    title: str
+    description: str
+    alt_text: str
+    auto_alt_text: str
+    image_url: str  # records 格式中为 images.url
+    videos: PinVideos
+    created_at: str
+    likes: int
+    pinner: Pinner
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "alt_text": self.alt_text,
+            "auto_alt_text": self.auto_alt_text,
+            "images": {"url": self.image_url},
+            "videos": self.videos.to_dict(),
+            "created_at": self.created_at,
+            "likes": self.likes,
+            "pinner": self.pinner.to_dict(),
+        }
+
+
+@dataclass(slots=True)
+class BedConfiguration:
+    name_with_count: str
+    description: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name_with_count": self.name_with_count, "description": self.description}
+
+
+@dataclass(slots=True)
+class HotelRoom:
+    photos: List[str]
+    children_and_beds_text: Dict[str, Any]
+    description: str
+    bed_configurations: List[BedConfiguration]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "photos": self.photos,
+            "children_and_beds_text": self.children_and_beds_text,
+            "description": self.description,
+            "bed_configurations": [bed.to_dict() for bed in self.bed_configurations],
+        }
+
+
+@dataclass(slots=True)
+class HotelDetail:
+    hotel_id: Any
+    hotel_name: str
+    url: str
+    review_nr: Any
+    rating: Any
+    arrival_date: str
+    departure_date: str
+    latitude: Any
+    longitude: Any
+    address: str
+    city: str
+    district: str
+    countrycode: str
+    country_trans: str
+    currency_code: str
+    zip: str
+    timezone: str
+    soldout: Any
+    available_rooms: Any
+    max_rooms_in_reservation: Any
+    average_room_size_for_ufi_m2: Any
+    is_family_friendly: Any
+    is_closed: Any
+    is_cash_accepted_check_enabled: Any
+    hotel_include_breakfast: Any
+    family_facilities: Any
+    facilities: List[str]
+    spoken_languages: List[str]
+    hotel_important_information: List[str]
+    rooms: Dict[str, HotelRoom]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hotel_id": self.hotel_id,
+            "hotel_name": self.hotel_name,
+            "url": self.url,
+            "review_nr": self.review_nr,
+            "rating": self.rating,
+            "arrival_date": self.arrival_date,
+            "departure_date": self.departure_date,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "address": self.address,
+            "city": self.city,
+            "district": self.district,
+            "countrycode": self.countrycode,
+            "country_trans": self.country_trans,
+            "currency_code": self.currency_code,
+            "zip": self.zip,
+            "timezone": self.timezone,
+            "soldout": self.soldout,
+            "available_rooms": self.available_rooms,
+            "max_rooms_in_reservation": self.max_rooms_in_reservation,
+            "average_room_size_for_ufi_m2": self.average_room_size_for_ufi_m2,
+            "is_family_friendly": self.is_family_friendly,
+            "is_closed": self.is_closed,
+            "is_cash_accepted_check_enabled": self.is_cash_accepted_check_enabled,
+            "hotel_include_breakfast": self.hotel_include_breakfast,
+            "family_facilities": self.family_facilities,
+            "facilities": self.facilities,
+            "spoken_languages": self.spoken_languages,
+            "hotel_important_information": self.hotel_important_information,
+            "rooms": {room_id: room.to_dict() for room_id, room in self.rooms.items()},
+        }
+
+
+@dataclass(slots=True)
+class ScholarPaper:
+    title: Optional[str]
+    snippet: Optional[str]
+    link: Optional[str]
+    publication_info: Optional[str]  # records 格式中为 publicationInfo
+    year: Any
+    cited_by: Any  # records 格式中为 citedBy
+    pdf_url: Optional[str]  # records 格式中为 pdfUrl
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "snippet": self.snippet,
+            "link": self.link,
+            "publicationInfo": self.publication_info,
+            "year": self.year,
+            "citedBy": self.cited_by,
+            "pdfUrl": self.pdf_url,
+        }
@@ -7,8 +7,6 @@ import logging
 import math
 from typing import Any, Dict, Optional
 
-import aiohttp
-
 from .base import BaseAPI
 
 logger = logging.getLogger("patents_source")
@@ -80,10 +78,9 @@ class PatentSource(BaseAPI):
         request_url = f"{self.proxy_url}/patents"
 
         try:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.post(request_url, headers=self.headers, json=payload, timeout=self.timeout) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            response = await self._request("POST", request_url, headers=self.headers, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
 
             organic = data.get("organic", [])
             results = []
@@ -3,7 +3,6 @@ Pinterest data source implementation
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -11,6 +10,7 @@ from typing import Any, Dict, Optional
 import aiohttp
 
 from .base import BaseAPI
+from .models import OUTPUT_FORMAT_RECORDS, Pin, Pinner, PinVideo, PinVideos, check_output_format
 
 logger = logging.getLogger("pinterest_source")
 
@@ -39,7 +39,12 @@ class PinterestSource(BaseAPI):
         return {"name": self.source_name, "description": "Pinterest data source, provides user and pin search features for Pinterest."}
 
     async def search_pins(
-        self, keyword: str, num: int = 10, nextPageCursor: Optional[str] = None, sort: str = "relevance"
+        self,
+        keyword: str,
+        num: int = 10,
+        nextPageCursor: Optional[str] = None,
+        sort: str = "relevance",
+        output_format: str = OUTPUT_FORMAT_RECORDS,
     ) -> Dict[str, Any]:
         """
         Search related pins.
@@ -51,6 +56,8 @@ class PinterestSource(BaseAPI):
             num(int): Number of results per page, e.g. 10
             nextPageCursor(str): Pagination cursor for next page, default None for first page
             sort(str): Sort order, default "relevance", options: "relevance" or "recent"
+            output_format(str): Format of "pins", options: records|models, default: records.
+                models returns compact Pin objects (see models.py), pin.to_dict() gives the records format.
 
         Returns:
             Dict[str, Any]: Dictionary containing pin search results, e.g.
@@ -109,6 +116,8 @@ class PinterestSource(BaseAPI):
         #     ...     print(f"Search failed: {result['error']}")
         # """
         try:
+            check_output_format(output_format)
+
             # Build query parameters
             params = {"keyword": keyword, "num": num, "sort": sort}
 
@@ -117,16 +126,11 @@ class PinterestSource(BaseAPI):
 
             request_url = f"{self.proxy_url}/pinterest/pins/advance"
 
-            # Send request using aiohttp
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.post(request_url, headers=self._headers, json=params, timeout=self._timeout) as response:
-                    response.raise_for_status()
-                    # Parse the response
-                    data = await response.json(content_type=None)
-
-            # The API returns a JSON string, need to parse it first
-            if isinstance(data, str):
-                data = json.loads(data)
+            # Send request
+            response = await self._request("POST", request_url, headers=self._headers, json=params, timeout=self._timeout)
+            response.raise_for_status()
+            # Parse the response
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
@@ -135,6 +139,8 @@ class PinterestSource(BaseAPI):
                 raise ValueError(f"API response missing data field: {data}")
 
             pins = self._parse_pins(data)
+            if output_format == OUTPUT_FORMAT_RECORDS:
+                pins = [pin.to_dict() for pin in pins]
 
             return {"success": True, "data": {"keyword": keyword, "count": len(pins), "pins": pins, "cursor": data.get("nextPageCursor")}}
 
@@ -194,16 +200,11 @@ class PinterestSource(BaseAPI):
             # Set request parameters
             params = {"keyword": username}
 
-            # Send request using aiohttp
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(request_url, headers=self._headers, params=params, timeout=self._timeout) as response:
-                    response.raise_for_status()
-                    # Parse the response
-                    data = await response.json(content_type=None)
-
-            # Parse response data
-            if isinstance(data, str):
-                data = json.loads(data)
+            # Send request
+            response = await self._request("GET", request_url, headers=self._headers, params=params, timeout=self._timeout)
+            response.raise_for_status()
+            # Parse the response
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
@@ -237,68 +238,56 @@ class PinterestSource(BaseAPI):
         except Exception:
             return date_str
 
-    def _parse_pins(self, data: dict[str, Any]) -> list[dict[str, Any]]:
-        print(f"xwy-pins, {data}")
-        print("-" * 100)
-        print("\n")
+    def _parse_pins(self, data: dict[str, Any]) -> list[Pin]:
         pins = []
         for pin_data in data.get("data", []):
             if not isinstance(pin_data, dict):
                 logger.warning(f"Skip invalid pin data: {pin_data}")
                 continue
 
-            video = {"has_video": False}
+            videos = PinVideos(has_video=False)
             if pin_data.get("videos", None):
-                V_HLSV4 = None
-                if pin_data.get("videos", {}).get("video_list", {}).get("V_HLSV4", None):
-                    V_HLSV4 = {
-                        "url": pin_data.get("videos", {}).get("video_list", {}).get("V_HLSV4", {}).get("url", ""),
-                        "duration": pin_data.get("videos", {}).get("video_list", {}).get("V_HLSV4", {}).get("duration", 0),
-                    }
-
-                V_720P = None
-                if pin_data.get("videos", {}).get("video_list", {}).get("V_720P", None):
-                    V_720P = {
-                        "url": pin_data.get("videos", {}).get("video_list", {}).get("V_720P", {}).get("url", ""),
-                        "duration": pin_data.get("videos", {}).get("video_list", {}).get("V_720P", {}).get("duration", 0),
-                    }
-
-                video: Dict[str, Any] = {"has_video": True}
-                if V_HLSV4:
-                    video["V_HLSV4"] = V_HLSV4
-                if V_720P:
-                    video["V_720P"] = V_720P
+                video_list = pin_data.get("videos", {}).get("video_list", {})
+                videos = PinVideos(has_video=True)
+                if video_list.get("V_HLSV4", None):
+                    videos.hls = PinVideo(
+                        url=video_list.get("V_HLSV4", {}).get("url", ""),
+                        duration=video_list.get("V_HLSV4", {}).get("duration", 0),
+                    )
+                if video_list.get("V_720P", None):
+                    videos.mp4_720p = PinVideo(
+                        url=video_list.get("V_720P", {}).get("url", ""),
+                        duration=video_list.get("V_720P", {}).get("duration", 0),
+                    )
 
             image_url = pin_data.get("images", {}).get("original", {}).get("url", "")
             if len(image_url) <= 0:
                 image_url = pin_data.get("images", {}).get("orig", {}).get("url", "")
 
-            pin = {
-                "id": pin_data.get("id", ""),
-                "title": pin_data.get("title", ""),
-                "description": pin_data.get("description", ""),
-                "alt_text": pin_data.get("alt_text", ""),
-                "auto_alt_text": pin_data.get("auto_alt_text", ""),
-                "images": {"url": image_url},
-                "videos": video,
-                "created_at": "2024-03-21 08:29:49",  # 创建时间
-                "likes": pin_data.get("reaction_counts", {}).get("1", 0),
-                "pinner": {
-                    "id": pin_data.get("pinner", {}).get("id", ""),
-                    "image_url": pin_data.get("pinner", {}).get("image_large_url", ""),
-                    "follower_count": pin_data.get("pinner", {}).get("follower_count", 0),
-                    "username": pin_data.get("pinner", {}).get("username", ""),
-                    "full_name": pin_data.get("pinner", {}).get("full_name", ""),
-                },
-            }
+            pinner = pin_data.get("pinner", {})
+            pin = Pin(
+                id=pin_data.get("id", ""),
+                title=pin_data.get("title", ""),
+                description=pin_data.get("description", ""),
+                alt_text=pin_data.get("alt_text", ""),
+                auto_alt_text=pin_data.get("auto_alt_text", ""),
+                image_url=image_url,
+                videos=videos,
+                created_at="2024-03-21 08:29:49",  # 创建时间
+                likes=pin_data.get("reaction_counts", {}).get("1", 0),
+                pinner=Pinner(
+                    id=pinner.get("id", ""),
+                    image_url=pinner.get("image_large_url", ""),
+                    follower_count=pinner.get("follower_count", 0),
+                    username=pinner.get("username", ""),
+                    full_name=pinner.get("full_name", ""),
+                ),
+            )
             pins.append(pin)
         return pins
 
     def _parse_user_info(self, resp: dict[str, Any]) -> dict[str, Any]:
         data = resp.get("data", [])
-        print(f"xwy-user, {data}")
-        print("-" * 100)
-        print("\n")
         if len(data) <= 0:
             return {}
 
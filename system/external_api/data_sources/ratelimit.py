@@ -0,0 +1,173 @@
+"""
+按上游 host 的令牌桶限流
+
+所有数据源共用一个代理，但每个上游（请求头 X-Original-Host，即 config 中的 *_base_url）有各自的 RapidAPI 配额。
+限流器在请求发出前按 host 取令牌，超出速率的调用排队等待而不是失败:
+- 每个 host 一个令牌桶，速率 rate（每秒令牌数），容量 burst（允许的突发请求数）
+- 令牌按到达顺序预约（等价于 GCRA），先到的调用先拿到令牌，排队的调用不会被后来者插队
+- 等待中的调用被取消时，若它是最后一个预约者则归还令牌
+- 令牌桶只依赖单调时钟，不绑定事件循环，多个线程 / 事件循环共享同一个限流器
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+
+class RateLimit(NamedTuple):
+    """
+    一个上游的限流配置
+    """
+
+    rate: float  # 每秒令牌数
+    burst: int = 1  # 桶容量，空闲后允许连续发出的请求数
+
+
+class TokenBucket:
+    """
+    令牌桶，线程安全
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒令牌数，必须大于 0
+            burst: 桶容量，至少为 1
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self._interval = 1.0 / rate
+        # 理论到达时间: 桶中已预约的令牌全部补齐的时刻，不晚于当前时刻时桶是满的
+        self._next_free = 0.0
+        self._lock = threading.Lock()
+        self.queue_depth = 0
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self) -> float:
+        """
+        预约一个令牌
+
+        Returns:
+            float: 令牌可用的时刻（time.monotonic）
+        """
+        with self._lock:
+            now = time.monotonic()
+            ready_at = max(now, self._next_free - (self.burst - 1) * self._interval)
+            self._next_free = max(self._next_free, now) + self._interval
+            return ready_at
+
+    def _cancel(self, ready_at: float) -> None:
+        with self._lock:
+            # 只有最后一个预约可以直接归还，否则会打乱后续预约的时刻
+            if abs(self._next_free - (ready_at + self.burst * self._interval)) < 1e-9:
+                self._next_free -= self._interval
+
+    async def acquire(self) -> float:
+        """
+        取一个令牌，没有可用令牌时按到达顺序排队等待
+
+        Returns:
+            float: 等待时长（秒）
+        """
+        ready_at = self._reserve()
+        delay = ready_at - time.monotonic()
+        if delay > 0:
+            with self._lock:
+                self.queue_depth += 1
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._cancel(ready_at)
+                raise
+            finally:
+                with self._lock:
+                    self.queue_depth -= 1
+        wait = max(0.0, delay)
+        with self._lock:
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+        return wait
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "queue_depth": self.queue_depth,
+                "acquired": self.acquired,
+                "waited": self.waited,
+                "total_wait": self.total_wait,
+                "avg_wait": self.total_wait / self.waited if self.waited else 0.0,
+                "max_wait": self.max_wait,
+            }
+
+
+class RateLimiter:
+    """
+    按 host 管理令牌桶，线程安全
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Union[RateLimit, tuple]]] = None,
+        default: Optional[Union[RateLimit, tuple]] = None,
+    ):
+        """
+        初始化限流器
+
+        Args:
+            limits: {host: RateLimit(rate, burst)}，也接受 (rate, burst) 元组
+            default: 未在 limits 中列出的 host 使用的限流配置，为 None 时不限流
+        """
+        self._limits = {host: RateLimit(*limit) for host, limit in (limits or {}).items()}
+        self._default = RateLimit(*default) if default is not None else None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, host: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            return bucket
+        limit = self._limits.get(host, self._default)
+        if limit is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(limit.rate, limit.burst)
+            return bucket
+
+    async def acquire(self, host: str) -> float:
+        """
+        为发往 host 的请求取一个令牌
+
+        Args:
+            host: 上游 host（X-Original-Host）
+
+        Returns:
+            float: 等待时长（秒），未对该 host 限流时为 0
+        """
+        bucket = self._get_bucket(host)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取各 host 的限流统计
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {host: TokenBucket.get_stats()}，只包含已有请求的 host
+        """
+        return {host: bucket.get_stats() for host, bucket in list(self._buckets.items())}
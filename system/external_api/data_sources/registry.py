@@ -0,0 +1,54 @@
+"""
+数据源注册表
+
+记录 source_name 到 (模块, 类) 的映射，ApiClient 在首次访问某个数据源时才导入对应模块并实例化，
+进程只为实际用到的数据源付出导入与初始化的开销
+
+新增数据源时在这里登记；未登记的 *_source / *_function 模块仍会在 ApiClient 初始化时立即加载
+"""
+
+import pkgutil
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+DATA_SOURCES_PACKAGE = "external_api.data_sources"
+
+
+class SourceSpec(NamedTuple):
+    """
+    数据源的登记信息
+    """
+
+    module: str  # data_sources 包下的模块名
+    class_name: str  # BaseAPI 子类名
+
+
+SOURCE_REGISTRY: Dict[str, SourceSpec] = {
+    "booking": SourceSpec("booking_source", "BookingSource"),
+    "commodities": SourceSpec("commodities_source", "CommoditiesSource"),
+    "metal": SourceSpec("metal_source", "MetalSource"),
+    "patent": SourceSpec("patents_source", "PatentSource"),
+    "pinterest": SourceSpec("pinterest_source", "PinterestSource"),
+    "scholar": SourceSpec("scholar_source", "ScholarSource"),
+    "tripadvisor": SourceSpec("tripadvisor_source", "TripAdvisorSource"),
+    "twitter": SourceSpec("twitter_source", "TwitterSource"),
+    "yahoo_finance": SourceSpec("yahoo_source", "YahooFinanceSource"),
+}
+
+FUNCTION_REGISTRY: Dict[str, SourceSpec] = {}
+
+
+def find_unregistered_modules() -> List[str]:
+    """
+    查找 data_sources 目录下未登记的 *_source / *_function 模块，只扫描文件名，不导入模块
+
+    Returns:
+        List[str]: 未登记的模块名
+    """
+    registered = {spec.module for spec in SOURCE_REGISTRY.values()} | {spec.module for spec in FUNCTION_REGISTRY.values()}
+    current_dir = Path(__file__).parent
+    return [
+        module_info.name
+        for module_info in pkgutil.iter_modules([str(current_dir)])
+        if module_info.name.endswith(("_source", "_function")) and module_info.name not in registered
+    ]
@@ -0,0 +1,149 @@
+"""
+请求重试与熔断
+
+在 BaseAPI._request 中对每次上游请求生效，数据源方法无需改动:
+- 重试: 幂等请求（默认只有 GET）在连接错误、超时或可重试状态码（429 / 5xx）时按指数退避 + 全抖动重试，
+  响应带 Retry-After 时按其等待（超过 max_retry_after 时不再重试，直接返回该响应）；
+  一次调用的全部尝试与退避不超过 total_timeout 秒，之后的尝试超时按剩余时间收紧
+- 熔断: 每个数据源一个熔断器，按调用计数（重试耗尽后的最终结果记一次），连续失败（连接错误、超时、5xx）的调用达到阈值后打开，打开期间请求直接抛出 CircuitOpenError；
+  recovery_timeout 秒后进入半开状态，放行一个探测请求，成功则关闭，失败则重新打开
+
+CircuitOpenError 继承 aiohttp.ClientError，数据源中已有的异常处理会将其转换为 {"success": False, ...}
+"""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import aiohttp
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class RetryPolicy(NamedTuple):
+    """
+    重试策略
+    """
+
+    max_attempts: int = 3  # 最多尝试次数（包括首次请求），1 表示不重试
+    base_delay: float = 0.5  # 第一次重试的退避上限（秒），之后每次翻倍
+    max_delay: float = 8.0  # 退避上限（秒）
+    max_retry_after: float = 30.0  # 愿意遵从的最长 Retry-After（秒）
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    methods: Tuple[str, ...] = ("GET",)  # 可以安全重试的幂等方法
+    total_timeout: Optional[float] = None  # 一次调用所有尝试与退避的总时限（秒），为空时不限制
+
+    def should_retry(self, method: str) -> bool:
+        return self.max_attempts > 1 and method.upper() in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        第 attempt 次重试前的等待时间（全抖动），attempt 从 1 开始
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析 Retry-After 响应头
+
+    Args:
+        value: 秒数或 HTTP 日期
+
+    Returns:
+        Optional[float]: 需要等待的秒数，无法解析时返回 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """
+    熔断器打开，请求未发送
+    """
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit breaker for {name} is open, retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    熔断器，线程安全
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        初始化熔断器
+
+        Args:
+            name: 名称（数据源名称），用于错误信息
+            failure_threshold: 连续失败多少次调用后打开（一次调用的全部重试只计一次）
+            recovery_timeout: 打开多久后放行一个探测请求（秒）
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """
+        请求发送前调用
+
+        Raises:
+            CircuitOpenError: 熔断器打开，或半开状态下已有探测请求在进行
+        """
+        with self._lock:
+            if self.state == CIRCUIT_CLOSED:
+                return
+            now = time.monotonic()
+            elapsed = now - self._opened_at
+            if elapsed >= self.recovery_timeout:
+                # 放行一个探测请求；探测请求被取消而没有结果时，下一个周期再放行一个
+                self.state = CIRCUIT_HALF_OPEN
+                self._opened_at = now
+                return
+            self.rejected += 1
+            retry_in = self.recovery_timeout - elapsed
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CIRCUIT_CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == CIRCUIT_HALF_OPEN or (self.state == CIRCUIT_CLOSED and self.failures >= self.failure_threshold):
+                self.state = CIRCUIT_OPEN
+                self.opened += 1
+                self._opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,172 @@
+"""
+数据源能力的 JSON Schema 导出
+
+将数据源方法的签名与文档字符串转换为工具定义（参数与返回值均为 JSON Schema），
+工具路由可以直接加载导出的文件，无需导入数据源模块或做运行时反射:
+    cd system && python -m external_api.data_sources.schema [--output capabilities_schema.json]
+"""
+
+import argparse
+import collections.abc
+import inspect
+import json
+import typing
+from typing import Any, Callable, Dict, List, Optional
+
+SCHEMA_DRAFT = "https://json-schema.org/draft/2020-12/schema"
+
+_PRIMITIVE_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+}
+
+
+def annotation_to_schema(annotation: Any) -> Dict[str, Any]:
+    """
+    将类型注解转换为 JSON Schema
+
+    Args:
+        annotation: 类型注解，未标注时为 inspect.Parameter.empty
+
+    Returns:
+        Dict[str, Any]: JSON Schema，无法表示的类型返回空 schema（接受任意值）
+    """
+    if annotation is inspect.Parameter.empty or annotation is Any:
+        return {}
+    if annotation in _PRIMITIVE_TYPES:
+        return {"type": _PRIMITIVE_TYPES[annotation]}
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        non_null = [arg for arg in args if arg is not type(None)]
+        schemas = [annotation_to_schema(arg) for arg in non_null]
+        if len(non_null) < len(args):
+            schemas.append({"type": "null"})
+        return {"anyOf": schemas}
+    if origin is typing.Literal:
+        return {"enum": list(args)}
+    if annotation in (list, tuple, set) or origin in (list, tuple, set, collections.abc.Sequence):
+        schema: Dict[str, Any] = {"type": "array"}
+        if origin is tuple and args and args[-1] is not Ellipsis:
+            # 定长元组 Tuple[int, str] 按位置描述
+            schema["prefixItems"] = [annotation_to_schema(arg) for arg in args]
+            schema["items"] = False
+        elif args:
+            # List[int] / Tuple[int, ...] / Set[int]
+            schema["items"] = annotation_to_schema(args[0])
+        return schema
+    if origin in (collections.abc.AsyncIterator, collections.abc.AsyncIterable, collections.abc.AsyncGenerator):
+        # 异步迭代器按元素数组描述，能力上标记 streaming
+        return {"type": "array", "items": annotation_to_schema(args[0]) if args else {}}
+    if annotation is dict or origin is dict or origin is collections.abc.Mapping:
+        schema = {"type": "object"}
+        if len(args) == 2 and args[1] is not Any:
+            schema["additionalProperties"] = annotation_to_schema(args[1])
+        return schema
+    return {}
+
+
+def _is_json_serializable(value: Any) -> bool:
+    try:
+        json.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def method_to_tool_schema(source_name: str, method_name: str, func: Callable, doc: str) -> Dict[str, Any]:
+    """
+    将数据源方法转换为工具定义
+
+    Args:
+        source_name: 数据源名称
+        method_name: 方法名
+        func: 方法（未绑定的函数）
+        doc: 方法的文档字符串
+
+    Returns:
+        Dict[str, Any]: 工具定义，包含 name / description / parameters / returns / streaming
+    """
+    from docstring_parser import parse
+
+    docstring = parse(doc)
+    param_docs = {param.arg_name: param.description for param in docstring.params}
+    hints = _get_type_hints(func)
+    signature = inspect.signature(func)
+
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for name, param in signature.parameters.items():
+        if name == "self" or param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
+        prop = annotation_to_schema(hints.get(name, param.annotation))
+        if param_docs.get(name):
+            prop["description"] = param_docs[name]
+        if param.default is inspect.Parameter.empty:
+            required.append(name)
+        elif _is_json_serializable(param.default):
+            prop["default"] = param.default
+        properties[name] = prop
+
+    returns = annotation_to_schema(hints.get("return", signature.return_annotation))
+    if docstring.returns and docstring.returns.description:
+        returns["description"] = docstring.returns.description
+
+    return {
+        "name": f"{source_name}.{method_name}",
+        "description": docstring.short_description or "",
+        "parameters": {"type": "object", "properties": properties, "required": required},
+        "returns": returns,
+        "streaming": inspect.isasyncgenfunction(inspect.unwrap(func)),
+    }
+
+
+def _get_type_hints(func: Callable) -> Dict[str, Any]:
+    try:
+        return typing.get_type_hints(inspect.unwrap(func))
+    except Exception:
+        return {}
+
+
+def build_schema_document(client: Any) -> Dict[str, Any]:
+    """
+    导出 ApiClient 中所有数据源的工具定义
+
+    Args:
+        client: ApiClient 实例
+
+    Returns:
+        Dict[str, Any]: {"$schema": ..., "sources": {source_name: {"description": ..., "tools": [...]}}}
+    """
+    sources: Dict[str, Any] = {}
+    for name in client._get_source_names():
+        source = client._get_source(name)
+        if source is None:
+            continue
+        sources[name] = {
+            "description": source.get_api_info().get("description", ""),
+            "tools": source.get_capabilities_schema(),
+        }
+    return {"$schema": SCHEMA_DRAFT, "sources": sources}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from .client import ApiClient
+
+    parser = argparse.ArgumentParser(description="Export data source capabilities as JSON Schema tool definitions")
+    parser.add_argument("--output", default="capabilities_schema.json")
+    args = parser.parse_args(argv)
+
+    document = build_schema_document(ApiClient())
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print(f"Wrote {sum(len(s['tools']) for s in document['sources'].values())} tools to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
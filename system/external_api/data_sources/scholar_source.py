@@ -5,14 +5,20 @@
 import asyncio
 import logging
 import math
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import aiohttp
 
 from .base import BaseAPI
+from .models import OUTPUT_FORMAT_RECORDS, ScholarPaper, check_output_format
 
 logger = logging.getLogger("scholar_source")
 
+MAX_PAGE_SIZE = 20  # 最大每页数量,api有限制
+MAX_RESULTS = 500
+# 同时请求的页面数上限
+DEFAULT_FAN_OUT_CONCURRENCY = 8
+
 
 class ScholarSource(BaseAPI):
     """Academic data source
@@ -29,6 +35,7 @@ class ScholarSource(BaseAPI):
             "X-Biz-Id": "matrix-agent",
             "X-Request-Timeout": str(config["timeout"] - 5),
         }
+        self._fan_out_concurrency = config.get("fan_out_concurrency", DEFAULT_FAN_OUT_CONCURRENCY)
 
     @property
     def source_name(self) -> str:
@@ -68,7 +75,7 @@ class ScholarSource(BaseAPI):
             end_year(str): 结束年份
 
         Returns:
-            Dict[str, Any]: 单页搜索结果
+            Dict[str, Any]: 单页搜索结果，data 为 List[ScholarPaper]
         """
         payload = {"q": query, "page": page, "num": page_size}
         if start_year:
@@ -79,27 +86,11 @@ class ScholarSource(BaseAPI):
         request_url = f"{self.proxy_url}/scholar"
 
         try:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.post(request_url, headers=self.headers, json=payload, timeout=self.timeout) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-            organic = data.get("organic", [])
-
-            results = []
-            for item in organic:
-                results.append(
-                    {
-                        "title": item.get("title"),
-                        "snippet": item.get("snippet"),
-                        "link": item.get("link"),
-                        "publicationInfo": item.get("publicationInfo"),
-                        "year": item.get("year"),
-                        "citedBy": item.get("citedBy"),
-                        "pdfUrl": item.get("pdfUrl"),
-                    }
-                )
-            return {"success": True, "data": results}
+            response = await self._request("POST", request_url, headers=self.headers, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+
+            return {"success": True, "data": self._parse_papers(data)}
         except asyncio.TimeoutError:
             error_msg = f"Request timeout (timeout={self.timeout}s)"
             logger.error(f"_fetch_scholar_page error: page={page}, {error_msg}")
@@ -111,12 +102,158 @@ class ScholarSource(BaseAPI):
             logger.error(f"_fetch_scholar_page error: page={page}, error={e}")
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _parse_papers(data: Dict[str, Any]) -> List[ScholarPaper]:
+        return [
+            ScholarPaper(
+                title=item.get("title"),
+                snippet=item.get("snippet"),
+                link=item.get("link"),
+                publication_info=item.get("publicationInfo"),
+                year=item.get("year"),
+                cited_by=item.get("citedBy"),
+                pdf_url=item.get("pdfUrl"),
+            )
+            for item in data.get("organic", [])
+        ]
+
+    @staticmethod
+    def _plan_pages(num_results: int) -> List[Tuple[int, int]]:
+        """
+        计算分页
+
+        Args:
+            num_results(int): 结果数，超过 MAX_RESULTS 时截断
+
+        Returns:
+            List[Tuple[int, int]]: [(页码, 该页数量)]，最后一页可能不满一页
+        """
+        num_results = min(num_results, MAX_RESULTS)
+        if num_results <= 0:
+            return []
+        page_size = min(num_results, MAX_PAGE_SIZE)
+        total_pages = math.ceil(num_results / page_size)
+        pages = []
+        for page in range(1, total_pages + 1):
+            # 最后一页可能需要调整数量
+            if page == total_pages and num_results % page_size != 0:
+                pages.append((page, num_results % page_size))
+            else:
+                pages.append((page, page_size))
+        return pages
+
+    async def _iter_scholar_pages(
+        self,
+        query: str,
+        num_results: int,
+        start_year: Optional[str],
+        end_year: Optional[str],
+        max_concurrency: Optional[int],
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        按页码顺序逐页返回搜索结果
+
+        最多同时请求 max_concurrency 页（包括已完成但尚未被消费的页），调用方处理当前页时后续页面继续请求。
+        某一页返回的结果少于请求数量时，说明后续页面为空，取消并不再请求后续页面
+
+        Args:
+            query(str): 搜索关键词
+            num_results(int): 结果数
+            start_year(str): 开始年份
+            end_year(str): 结束年份
+            max_concurrency(int): 同时请求的页面数上限，为空时使用配置值
+
+        Returns:
+            AsyncIterator[Tuple[int, Dict[str, Any]]]: (页码, _fetch_scholar_page 的结果)
+        """
+        pages = self._plan_pages(num_results)
+        concurrency = max(1, max_concurrency or self._fan_out_concurrency)
+        tasks: Dict[int, "asyncio.Task[Dict[str, Any]]"] = {}
+        next_index = 0
+
+        def schedule() -> None:
+            nonlocal next_index
+            while len(tasks) < concurrency and next_index < len(pages):
+                page, page_size = pages[next_index]
+                tasks[next_index] = asyncio.ensure_future(
+                    self._fetch_scholar_page(
+                        query=query,
+                        page_size=page_size,
+                        page=page,
+                        start_year=start_year,
+                        end_year=end_year,
+                    )
+                )
+                next_index += 1
+
+        try:
+            schedule()
+            for index, (page, page_size) in enumerate(pages):
+                result = await tasks.pop(index)
+                short_page = result["success"] and len(result["data"]) < page_size
+                if short_page:
+                    # 后续页面为空，取消已发出的请求并不再请求
+                    next_index = len(pages)
+                    for task in tasks.values():
+                        task.cancel()
+                else:
+                    schedule()
+                yield page, result
+                if short_page:
+                    return
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def iter_scholar(
+        self,
+        query: str,
+        num_results: int = 10,
+        start_year: Optional[str] = None,
+        end_year: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        output_format: str = OUTPUT_FORMAT_RECORDS,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search for academic papers and yield them as result pages arrive, in ranking order.
+        Fetching stops early when a page comes back short. A failed page ends the iteration with RuntimeError,
+        papers of earlier pages have already been yielded; use search_scholar to get partial results instead.
+
+        Args:
+            query(str): Search keywords.
+            num_results(int): Number of results to return, default is 10, max is 500.
+            start_year(str): Start year, YYYY, default is None.
+            end_year(str): End year, YYYY, default is None.
+            max_concurrency(int): Maximum number of pages requested at the same time, default is 8.
+            output_format(str): Format of the papers, options: records|models, default: records.
+                models returns compact ScholarPaper objects (see models.py), paper.to_dict() gives the records format.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: Async iterator of papers, each paper has the same format as in search_scholar
+
+        Raises:
+            RuntimeError: A page request failed, the message contains the page number and its error
+
+        Example:
+            >>> async for paper in client.scholar.iter_scholar("machine learning", num_results=200):
+            ...     print(paper["title"])
+        """
+        check_output_format(output_format)
+        async for page, result in self._iter_scholar_pages(query, num_results, start_year, end_year, max_concurrency):
+            if not result["success"]:
+                raise RuntimeError(f"Scholar page {page} failed: {result['error']}")
+            for paper in result["data"]:
+                yield paper.to_dict() if output_format == OUTPUT_FORMAT_RECORDS else paper
+
     async def search_scholar(
         self,
         query: str,
         num_results: int = 10,
         start_year: Optional[str] = None,
         end_year: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        output_format: str = OUTPUT_FORMAT_RECORDS,
     ) -> Dict[str, Any]:
         """
         Search for academic papers.
@@ -126,6 +263,9 @@ class ScholarSource(BaseAPI):
             num_results(int): Number of results to return, default is 10, max is 500.
             start_year(str): Start year, YYYY, default is None.
             end_year(str): End year, YYYY, default is None.
+            max_concurrency(int): Maximum number of pages requested at the same time, default is 8.
+            output_format(str): Format of the papers, options: records|models, default: records.
+                models returns compact ScholarPaper objects (see models.py), paper.to_dict() gives the records format.
 
         Returns:
             Dict[str, Any]: Search results, format:
@@ -163,49 +303,20 @@ class ScholarSource(BaseAPI):
         #     ...     print(f"Search succeeded, {len(result['data']['papers'])} results returned")
         # """
         try:
-            # 限制最大结果数
-            if num_results > 500:
-                num_results = 500
-
-            # 计算分页
-            MAX_PAGE_SIZE = 20  # 最大每页数量,api有限制
-            page_size = min(num_results, MAX_PAGE_SIZE)
-            total_pages = math.ceil(num_results / page_size)
-
-            # 并发请求所有页面
-            tasks = []
-            for page in range(1, total_pages + 1):
-                # 最后一页可能需要调整数量
-                if page == total_pages and num_results % page_size != 0:
-                    current_page_size = num_results % page_size
-                else:
-                    current_page_size = page_size
+            check_output_format(output_format)
 
-                tasks.append(
-                    self._fetch_scholar_page(
-                        query=query,
-                        page_size=current_page_size,
-                        page=page,
-                        start_year=start_year,
-                        end_year=end_year,
-                    )
-                )
-
-            # 等待所有请求完成
-            results = await asyncio.gather(*tasks)
+            # 限制最大结果数
+            if num_results > MAX_RESULTS:
+                num_results = MAX_RESULTS
 
-            # 合并结果
+            # 分页并发请求（有上限），遇到不满的页面后提前结束，合并结果
             all_papers = []
             has_error = False
             error_msgs = []
-            successful_pages = 0
 
-            for i, result in enumerate(results):
-                page_num = i + 1
+            async for page_num, result in self._iter_scholar_pages(query, num_results, start_year, end_year, max_concurrency):
                 if result["success"]:
-                    page_results = result["data"]
-                    all_papers.extend(page_results)
-                    successful_pages += 1
+                    all_papers.extend(result["data"])
                 else:
                     has_error = True
                     error_msgs.append(f"Page {page_num}: {result['error']}")
@@ -216,6 +327,8 @@ class ScholarSource(BaseAPI):
 
             # 限制返回数量
             all_papers = all_papers[:num_results]
+            if output_format == OUTPUT_FORMAT_RECORDS:
+                all_papers = [paper.to_dict() for paper in all_papers]
 
             return {"success": True, "data": {"papers": all_papers}}
         except Exception as e:
@@ -0,0 +1,146 @@
+"""
+共享 HTTP 连接池
+
+aiohttp.ClientSession 绑定在创建它的事件循环上，因此连接池按事件循环各持有一个 session，
+同一事件循环内的所有请求共享同一组 keep-alive 连接，避免每次调用都重新建立 TCP/TLS 连接
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger("session_pool")
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 64
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+
+
+class SessionPool:
+    """
+    按事件循环复用的 aiohttp.ClientSession 连接池
+
+    线程安全，可以被多个事件循环（多个线程）同时使用
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        connector_factory: Optional[Callable[[], aiohttp.BaseConnector]] = None,
+        **session_kwargs: Any,
+    ):
+        """
+        初始化连接池
+
+        Args:
+            limit: 单个事件循环内的最大连接数
+            limit_per_host: 同一 host 的最大连接数，所有数据源都经由同一个代理，因此这也是到代理的并发上限
+            keepalive_timeout: 空闲连接的保活时间（秒）
+            connector_factory: 自定义 connector 的工厂函数，为空时使用 TCPConnector
+            session_kwargs: 透传给 aiohttp.ClientSession 的其他参数
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._connector_factory = connector_factory
+        self._session_kwargs = {"trust_env": True, **session_kwargs}
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._lock = threading.Lock()
+
+    def _create_connector(self) -> aiohttp.BaseConnector:
+        if self._connector_factory is not None:
+            return self._connector_factory()
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        获取当前事件循环对应的共享 session，不存在时创建
+
+        Returns:
+            aiohttp.ClientSession: 当前事件循环的共享 session，调用方不要关闭它
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._discard_dead_sessions()
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                session = aiohttp.ClientSession(connector=self._create_connector(), **self._session_kwargs)
+                self._sessions[loop] = session
+            return session
+
+    def _discard_dead_sessions(self) -> None:
+        """
+        丢弃所属事件循环已经关闭的 session（例如每次调用都使用 asyncio.run 的场景）
+        事件循环关闭后无法再 await close，只能将 connector 标记为关闭以释放引用
+        """
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            session = self._sessions.pop(loop)
+            connector = session.connector
+            session.detach()
+            if connector is not None:
+                try:
+                    connector._close()
+                except Exception as e:
+                    logger.debug(f"关闭已失效的 connector 失败: {str(e)}")
+
+    async def close_current(self) -> None:
+        """
+        只关闭当前事件循环的 session，其他事件循环的 session 不受影响
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._discard_dead_sessions()
+            session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def close(self) -> None:
+        """
+        关闭所有 session
+        当前事件循环的 session 直接关闭，其他仍在运行的事件循环的 session 投递到对应循环中关闭
+        """
+        current_loop = asyncio.get_running_loop()
+        with self._lock:
+            self._discard_dead_sessions()
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current_loop:
+                await session.close()
+            elif loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+                await asyncio.wrap_future(future)
+            else:
+                logger.warning("事件循环未运行，无法关闭其 session，已直接丢弃")
+                session.detach()
+
+
+_default_pool: Optional[SessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_session_pool() -> SessionPool:
+    """
+    获取进程级默认连接池，供未被 ApiClient 绑定连接池的数据源使用
+
+    Returns:
+        SessionPool: 默认连接池
+    """
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:  # Double-check
+                _default_pool = SessionPool()
+    return _default_pool
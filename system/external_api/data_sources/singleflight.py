@@ -0,0 +1,81 @@
+"""
+并发相同调用合并（singleflight）
+
+同一时刻对同一方法、同一参数的多次调用只向上游发起一次请求，其余调用等待同一个结果
+- 首个调用创建共享任务，后续调用通过 asyncio.shield 等待该任务，单个调用被取消不会影响其他调用
+- 任务完成后立即移除，之后的调用重新发起请求（结果缓存由 cache.cached 负责）
+- 有等待者合并进来时，每个调用方（包括首个调用）都拿到结果的深拷贝，原始结果不交给任何调用方，
+  调用方修改返回值互不影响；没有等待者时首个调用直接拿到结果，之后到达的相同调用重新发起请求
+- asyncio 任务绑定事件循环，因此按 (事件循环, 调用键) 合并
+"""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Flight:
+    __slots__ = ("task", "waiters", "taken")
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+        # 首个调用已直接取走结果，不能再合并
+        self.taken = False
+
+
+class SingleFlight:
+    """
+    按调用键合并并发中的相同调用，线程安全
+    """
+
+    def __init__(self):
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Flight] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行调用，若相同调用正在进行则等待其结果
+
+        Args:
+            key: 调用键
+            fn: 无参协程函数，仅在没有相同调用进行中时执行
+
+        Returns:
+            Any: 调用结果，有等待者合并时为结果的深拷贝
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            flight = self._calls.get(flight_key)
+            leader = flight is None or flight.taken
+            if leader:
+                task = loop.create_task(fn())
+                flight = self._calls[flight_key] = _Flight(task)
+                task.add_done_callback(lambda _, flight=flight: self._forget(flight_key, flight))
+            else:
+                flight.waiters += 1
+                self.shared += 1
+
+        result = await asyncio.shield(flight.task)
+        if leader:
+            with self._lock:
+                if flight.waiters == 0:
+                    flight.taken = True
+                    return result
+        return copy.deepcopy(result)
+
+    def _forget(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], flight: _Flight) -> None:
+        task = flight.task
+        with self._lock:
+            if self._calls.get(flight_key) is flight:
+                del self._calls[flight_key]
+        # 所有等待者都已取消时，避免 "Task exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
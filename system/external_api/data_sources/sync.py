@@ -0,0 +1,239 @@
+"""
+数据源的同步调用门面
+
+数据源方法都是协程，notebook、pandas 流水线、线程池中的同步代码如果每次调用都用 asyncio.run，
+每次都会新建并关闭事件循环，连接池中的 session 绑定在事件循环上（参见 session_pool.py），连接也随之无法复用。
+SyncApiClient 在一个常驻的后台线程中运行事件循环，同步调用把协程线程安全地投递到该循环并阻塞等待结果，
+所有同步调用共享该循环上的 keep-alive 连接、singleflight 与限流器:
+
+    client = get_client()
+    price = client.sync.yahoo_finance.get_stock_price("AAPL", "2024-01-01", "2024-02-01")
+
+异步生成器方法（如 twitter.iter_tweets）返回阻塞迭代器，可以直接 for 循环:
+
+    for tweet in client.sync.twitter.iter_tweets("Tesla", max_items=100):
+        print(tweet["id"], tweet["text"])
+
+可以在任意线程中并发调用；不能在后台循环自身（即数据源方法内部）调用，否则会死锁
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Coroutine, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """
+    在后台守护线程中常驻运行的事件循环，首次提交协程时启动
+    """
+
+    def __init__(self, name: str = "external-api-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None:
+            return loop
+        with self._lock:
+            if self._loop is None:  # Double-check
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """
+        把协程投递到后台循环，不等待结果
+
+        Raises:
+            RuntimeError: 在后台循环线程中调用
+        """
+        loop = self._ensure_started()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot block on the background loop from inside it, await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        在后台循环中执行协程并阻塞等待结果
+
+        Args:
+            coro: 协程
+            timeout: 等待超时（秒），为空时一直等待；超时后协程被取消
+
+        Returns:
+            T: 协程的返回值，异常原样抛出
+
+        Raises:
+            TimeoutError: 等待超时
+            RuntimeError: 在后台循环线程中调用
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            if future.done():
+                # 协程本身抛出的 TimeoutError
+                raise
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout}s") from None
+        except KeyboardInterrupt:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """停止并关闭后台循环，循环中未完成的任务被取消；之后再提交协程会启动新的循环"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        async def shutdown() -> None:
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        if threading.current_thread() is not thread:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class _SyncSourceProxy:
+    """
+    数据源的同步代理，协程方法变为阻塞调用，异步生成器方法变为阻塞迭代器，其他属性直接透传
+    """
+
+    def __init__(self, facade: "SyncApiClient", proxy: Any):
+        self._facade = facade
+        self._proxy = proxy
+        self._methods: Dict[str, Callable[..., Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+
+        attr = getattr(self._proxy, name)
+        if name.startswith("_"):
+            return attr
+        if inspect.isasyncgenfunction(attr):
+            method = self._wrap_async_generator(attr)
+        elif inspect.iscoroutinefunction(attr):
+            method = self._wrap_coroutine(attr)
+        else:
+            return attr
+        self._methods[name] = method
+        return method
+
+    def _wrap_coroutine(self, attr: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._facade.run(attr(*args, **kwargs))
+
+        return call
+
+    def _wrap_async_generator(self, attr: Callable[..., Any]) -> Callable[..., Iterator[Any]]:
+        """
+        每次 next 在后台循环中执行一次 __anext__；迭代提前结束（break、异常或迭代器被回收）时，
+        在后台循环中 aclose 异步生成器，使其 finally 与预取任务得到清理
+        """
+
+        @functools.wraps(attr)
+        def iterate(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            agen = attr(*args, **kwargs)
+            try:
+                while True:
+                    try:
+                        item = self._facade.run(agen.__anext__())
+                    except StopAsyncIteration:
+                        return
+                    yield item
+            finally:
+                self._facade.run(agen.aclose())
+
+        return iterate
+
+    def __repr__(self) -> str:
+        return f"<_SyncSourceProxy {self._proxy!r}>"
+
+
+class SyncApiClient:
+    """
+    ApiClient 的同步门面，client.sync.<source>.<method>(...) 阻塞执行 client.<source>.<method>(...)
+    """
+
+    def __init__(self, client: Any, timeout: Optional[float] = None, loop: Optional[BackgroundLoop] = None):
+        """
+        Args:
+            client: ApiClient
+            timeout: 每次调用的等待超时（秒），为空时一直等待
+            loop: 执行调用的后台循环，为空时新建一个
+        """
+        self._client = client
+        self.timeout = timeout
+        self._loop = loop or BackgroundLoop()
+        self._proxies: Dict[str, _SyncSourceProxy] = {}
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        在后台循环中执行任意协程，例如在一个 async 函数中用 asyncio.gather 并发多个调用；
+        需要传入协程对象，asyncio.gather(...) 本身只能在事件循环中创建
+
+        Args:
+            coro: 协程
+            timeout: 等待超时（秒），为空时使用门面的默认超时
+        """
+        return self._loop.run(coro, timeout if timeout is not None else self.timeout)
+
+    def close(self) -> None:
+        """
+        关闭后台循环上的连接并停止后台循环；ApiClient 在其他事件循环上的连接不受影响，
+        之后的同步调用会启动新的后台循环
+        """
+        try:
+            self.run(self._client.close_current_loop())
+        finally:
+            self._loop.stop()
+
+    def __getattr__(self, name: str) -> _SyncSourceProxy:
+        """
+        Get the synchronous proxy of a data source, its coroutine methods block until the result is ready
+
+        Args:
+            name: data source name
+
+        Returns:
+            _SyncSourceProxy: synchronous proxy of the data source
+
+        Raises:
+            AttributeError: data source does not exist
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        proxy = self._proxies.get(name)
+        if proxy is None:
+            proxy = self._proxies[name] = _SyncSourceProxy(self, getattr(self._client, name))
+        return proxy
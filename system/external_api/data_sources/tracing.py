@@ -0,0 +1,336 @@
+"""
+轻量级调用链追踪
+
+一次工具调用（FunctionProxy 的 request_id）或一次数据源调用对应一条 trace，trace 中的 span:
+- function.<name>: FunctionProxy 调用 function server，trace_id 即 request_id，阶段 encode / request / decode
+  （流式调用为 request（收到响应头）/ stream）；execute_batch 的一次批量请求为 function.batch，trace_id 即 batch_id
+- <source>.<method>: 经由 ApiClient 调用的数据源方法，阶段 backoff（重试前的等待）
+- http: BaseAPI._request 的每次尝试（包括重试与对冲请求），阶段 rate_limit（等待限流令牌）/ request（传输层请求）
+当前 span 通过 contextvars 传递，调用中创建的任务也挂在同一条 trace 下。
+不在任何 trace 中的数据源调用自动开启一条新 trace；function server 等其他进程可以用 trace(request_id)
+把执行过程中的数据源调用归到发起调用的 request_id 下（FunctionProxy 在请求头 X-Request-Id 中传递 request_id）。
+追踪开启时，发往 external-api 代理的请求同样带上 X-Request-Id，便于在代理日志中对应
+
+trace 中所有 span 结束后一次性导出，每个 span 一个 dict，参见 Span.to_dict。
+导出目标由环境变量配置，都未设置时不追踪，每个埋点只多一次全局变量判断:
+- EXTERNAL_API_TRACE_FILE: 以 JSON Lines 追加写入本地文件，后台线程写入
+- EXTERNAL_API_TRACE_COLLECTOR: 以 {"spans": [...]} POST 到采集端 URL，后台线程发送，队列满时丢弃
+也可以调用 set_exporter 设置
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.request
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import codec
+
+logger = logging.getLogger("tracing")
+
+EXTERNAL_API_TRACE_FILE_ENV_NAME = "EXTERNAL_API_TRACE_FILE"
+EXTERNAL_API_TRACE_COLLECTOR_ENV_NAME = "EXTERNAL_API_TRACE_COLLECTOR"
+
+# 传递 trace_id 的请求头
+TRACE_HEADER = "X-Request-Id"
+
+SPAN_STATUS_OK = "ok"
+SPAN_STATUS_ERROR = "error"
+SPAN_STATUS_CANCELLED = "cancelled"
+
+
+class SpanExporter(ABC):
+    """
+    span 导出器基类，export 在 trace 结束的线程（通常是事件循环线程）中同步调用，
+    实现需要线程安全且不能阻塞，涉及 I/O 的导出器继承 _QueuedSpanExporter 在后台线程中写出
+    """
+
+    @abstractmethod
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        """
+        导出一条 trace 的全部 span
+
+        Args:
+            spans: Span.to_dict() 的列表，按结束时间排序
+        """
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _QueuedSpanExporter(SpanExporter):
+    """
+    export 只把 span 放入队列，由后台线程调用 _write 写出，不阻塞结束 span 的事件循环；队列满时丢弃并计数
+    """
+
+    def __init__(self, name: str, timeout: float = 5.0, max_queue: int = 1000):
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += len(spans)
+
+    @abstractmethod
+    def _write(self, spans: List[Dict[str, Any]]) -> None:
+        pass
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            try:
+                if spans is None:
+                    return
+                self._write(spans)
+            except Exception as e:
+                logger.warning(f"{type(self).__name__} failed to export {len(spans or [])} spans: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """等待已放入队列的 span 全部写出"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """写出队列中剩余的 span 后停止后台线程"""
+        self._queue.put(None)
+        self._thread.join(timeout=self.timeout)
+
+
+class FileSpanExporter(_QueuedSpanExporter):
+    """
+    以 JSON Lines 追加写入本地文件，每行一个 span，在后台线程中写入
+    """
+
+    def __init__(self, path: str, max_queue: int = 1000):
+        self.path = path
+        super().__init__("span-file-exporter", max_queue=max_queue)
+
+    def _write(self, spans: List[Dict[str, Any]]) -> None:
+        data = b"".join(codec.dumps(span) + b"\n" for span in spans)
+        with open(self.path, "ab") as f:
+            f.write(data)
+
+
+class HttpSpanExporter(_QueuedSpanExporter):
+    """
+    在后台线程中把 span POST 到采集端，请求体为 {"spans": [...]}，发送失败只记录日志
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0, max_queue: int = 1000):
+        self.url = url
+        super().__init__("span-exporter", timeout=timeout, max_queue=max_queue)
+
+    def _write(self, spans: List[Dict[str, Any]]) -> None:
+        request = urllib.request.Request(
+            self.url, data=codec.dumps({"spans": spans}), headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class _Trace:
+    __slots__ = ("open", "spans")
+
+    def __init__(self):
+        self.open = 0
+        self.spans: List["Span"] = []
+
+
+class Span:
+    """
+    一个计时区间，name 之外的信息记录在 attributes 中，各阶段耗时（秒）记录在 phases 中
+    """
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start_time", "duration", "status", "attributes", "phases", "_start", "_trace")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], trace: _Trace, attributes: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.start_time = time.time()
+        self.duration: Optional[float] = None
+        self.status = SPAN_STATUS_OK
+        self.attributes = attributes
+        self.phases: Dict[str, float] = {}
+        self._start = time.perf_counter()
+        self._trace = trace
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """累加一个阶段的耗时，同名阶段（如多次重试等待）合并"""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+            "phases": self.phases,
+        }
+
+
+_exporter: Optional[SpanExporter] = None
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("external_api_span", default=None)
+# trace() 指定的 trace_id，其中还没有 span
+_current_trace_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("external_api_trace_id", default=None)
+_lock = threading.Lock()
+
+
+def set_exporter(exporter: Optional[SpanExporter]) -> None:
+    """
+    设置 span 导出器，为 None 时关闭追踪；原导出器会被关闭
+    """
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.close()
+
+
+def _exporter_from_env() -> Optional[SpanExporter]:
+    path = os.getenv(EXTERNAL_API_TRACE_FILE_ENV_NAME)
+    if path:
+        return FileSpanExporter(path)
+    url = os.getenv(EXTERNAL_API_TRACE_COLLECTOR_ENV_NAME)
+    if url:
+        return HttpSpanExporter(url)
+    return None
+
+
+def enabled() -> bool:
+    return _exporter is not None
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """当前 trace 的 trace_id，不在 trace 中时为 None"""
+    current = _current_span.get()
+    return current.trace_id if current is not None else _current_trace_id.get()
+
+
+def start_span(name: str, trace_id: Optional[str] = None, **attributes: Any) -> Optional[Span]:
+    """
+    开始一个 span，父 span 为当前 span；需要配合 end_span 使用，通常用 span() 代替
+
+    Args:
+        name: span 名称
+        trace_id: 没有父 span 时使用的 trace_id，为空时使用 trace() 指定的值或新生成一个
+        attributes: 初始属性
+
+    Returns:
+        Optional[Span]: 未开启追踪时为 None
+    """
+    if _exporter is None:
+        return None
+    parent = _current_span.get()
+    if parent is not None:
+        trace, trace_id, parent_id = parent._trace, parent.trace_id, parent.span_id
+    else:
+        trace, trace_id, parent_id = _Trace(), trace_id or _current_trace_id.get() or uuid.uuid4().hex, None
+    with _lock:
+        trace.open += 1
+    return Span(name, trace_id, parent_id, trace, attributes)
+
+
+def end_span(span: Span, status: Optional[str] = None) -> None:
+    """
+    结束 span，trace 中所有 span 都结束后导出整条 trace
+
+    Args:
+        span: start_span 返回的 span
+        status: 结束状态，为空时保持 span.status（默认 ok）
+    """
+    span.duration = time.perf_counter() - span._start
+    if status is not None:
+        span.status = status
+    trace = span._trace
+    with _lock:
+        trace.spans.append(span)
+        trace.open -= 1
+        finished = []
+        if trace.open == 0:
+            # 之后结束的 span（如比父 span 活得更久的任务）单独导出
+            finished, trace.spans = trace.spans, []
+    exporter = _exporter
+    if finished and exporter is not None:
+        try:
+            exporter.export([s.to_dict() for s in finished])
+        except Exception as e:
+            logger.warning(f"Failed to export trace {span.trace_id}: {e}")
+
+
+@contextlib.contextmanager
+def span(name: str, trace_id: Optional[str] = None, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    在 with 块中开启 span 并设为当前 span，抛出异常时状态为 error，取消时为 cancelled；
+    正常结束时保持 span.status，调用方可以把返回了错误结果的 span 标记为 error
+
+    Args:
+        name: span 名称
+        trace_id: 参见 start_span
+        attributes: 初始属性
+
+    Returns:
+        Iterator[Optional[Span]]: 未开启追踪时为 None
+    """
+    s = start_span(name, trace_id, **attributes)
+    if s is None:
+        yield None
+        return
+    token = _current_span.set(s)
+    status = None
+    try:
+        yield s
+    except asyncio.CancelledError:
+        status = SPAN_STATUS_CANCELLED
+        raise
+    except BaseException as e:
+        status = SPAN_STATUS_ERROR
+        s.set_attribute("error", f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        _current_span.reset(token)
+        end_span(s, status)
+
+
+@contextlib.contextmanager
+def trace(trace_id: str) -> Iterator[None]:
+    """
+    在 with 块中使用指定的 trace_id，其中开启的顶层 span 都属于这条 trace，
+    例如 function server 执行 FunctionProxy 发来的请求时使用请求中的 request_id
+
+    Args:
+        trace_id: trace_id，通常是 FunctionProxy 的 request_id
+    """
+    token = _current_trace_id.set(trace_id)
+    try:
+        yield
+    finally:
+        _current_trace_id.reset(token)
+
+
+set_exporter(_exporter_from_env())
@@ -0,0 +1,375 @@
+"""
+可插拔的 HTTP 传输层
+
+所有数据源都经由同一个 external-api 代理访问上游，仅 X-Original-Host 不同，
+因此请求统一走 Transport，由 ApiClient 决定底层实现:
+- http1: aiohttp + keep-alive 连接池（默认）
+- http2: httpx 的 HTTP/2 多路复用连接，所有并发请求共享同一条连接；需要 h2，即 httpx[http2]
+
+传输层统一使用 aiohttp 的异常类型（asyncio.TimeoutError / aiohttp.ClientError），
+数据源中已有的异常处理无需关心底层实现
+"""
+
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from . import codec
+from .session_pool import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    SessionPool,
+    get_default_session_pool,
+)
+
+logger = logging.getLogger("transport")
+
+TRANSPORT_HTTP1 = "http1"
+TRANSPORT_HTTP2 = "http2"
+
+
+class HttpResponse:
+    """
+    已读取完整响应体的 HTTP 响应，屏蔽不同传输层实现的差异
+    """
+
+    __slots__ = ("method", "url", "status", "reason", "headers", "content", "http_version")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        reason: str,
+        headers: Mapping[str, str],
+        content: bytes,
+        http_version: str = "HTTP/1.1",
+    ):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.content = content
+        self.http_version = http_version
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """以文本形式返回响应体"""
+        return self.content.decode(encoding, errors="replace")
+
+    def json(self) -> Any:
+        """解析 JSON 响应体，不校验 Content-Type；响应体是再次编码为字符串的 JSON 时再解码一次，参见 codec.loads_payload"""
+        return codec.loads_payload(self.content)
+
+    def raise_for_status(self) -> None:
+        """
+        状态码 >= 400 时抛出 aiohttp.ClientResponseError，与 aiohttp 的行为保持一致
+
+        Raises:
+            aiohttp.ClientResponseError: 响应状态码表示失败
+        """
+        if self.status < 400:
+            return
+        url = URL(self.url)
+        request_info = aiohttp.RequestInfo(url, self.method, CIMultiDictProxy(CIMultiDict()), url)
+        raise aiohttp.ClientResponseError(
+            request_info,
+            (),
+            status=self.status,
+            message=self.reason,
+            headers=self.headers,
+        )
+
+
+def encode_json_body(body: Any, headers: Optional[Dict[str, str]]) -> Tuple[bytes, Dict[str, str]]:
+    """
+    使用 codec 编码 JSON 请求体，并补充 Content-Type
+    """
+    headers = dict(headers) if headers else {}
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["Content-Type"] = "application/json"
+    return codec.dumps(body), headers
+
+
+class Transport(ABC):
+    """
+    HTTP 传输层基类
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        """
+        发送请求并读取完整响应体
+
+        Args:
+            method: HTTP 方法
+            url: 请求地址
+            headers: 请求头
+            params: query 参数
+            json: JSON 请求体
+            data: 原始请求体
+            timeout: 总超时时间（秒）
+
+        Returns:
+            HttpResponse: 响应
+
+        Raises:
+            asyncio.TimeoutError: 请求超时
+            aiohttp.ClientError: 连接或协议错误
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        关闭传输层持有的所有连接
+        """
+        pass
+
+    @abstractmethod
+    async def close_current_loop(self) -> None:
+        """
+        只关闭当前事件循环上的连接，其他事件循环上的请求不受影响
+        """
+        pass
+
+
+class AiohttpTransport(Transport):
+    """
+    基于 aiohttp 连接池的 HTTP/1.1 传输层
+    """
+
+    name = TRANSPORT_HTTP1
+
+    def __init__(self, session_pool: SessionPool):
+        self.session_pool = session_pool
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        session = self.session_pool.get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        if json is not None:
+            data, headers = encode_json_body(json, headers)
+        async with session.request(
+            method, url, headers=headers, params=params, data=data, timeout=client_timeout
+        ) as response:
+            content = await response.read()
+            return HttpResponse(
+                method=method,
+                url=str(response.url),
+                status=response.status,
+                reason=response.reason or "",
+                headers=response.headers,
+                content=content,
+                http_version=f"HTTP/{response.version.major}.{response.version.minor}" if response.version else "HTTP/1.1",
+            )
+
+    async def close(self) -> None:
+        await self.session_pool.close()
+
+    async def close_current_loop(self) -> None:
+        await self.session_pool.close_current()
+
+
+class HttpxTransport(Transport):
+    """
+    基于 httpx 的传输层，http2=True 时所有并发请求复用同一条 HTTP/2 连接
+    需要安装 h2（pip install "httpx[http2]"）
+
+    httpx.AsyncClient 同样绑定事件循环，因此按事件循环各持有一个 client
+    """
+
+    name = TRANSPORT_HTTP2
+
+    def __init__(
+        self,
+        http2: bool = True,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("HttpxTransport requires httpx, please install it with `pip install httpx[http2]`") from e
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise ImportError("HTTP/2 transport requires h2, please install it with `pip install httpx[http2]`") from e
+
+        self._httpx = httpx
+        self.http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=limit,
+            max_keepalive_connections=limit_per_host,
+            keepalive_expiry=keepalive_timeout,
+        )
+        self._clients: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._discard_dead_clients()
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._httpx.AsyncClient(http2=self.http2, limits=self._limits, trust_env=True)
+                self._clients[loop] = client
+            return client
+
+    def _discard_dead_clients(self) -> None:
+        """
+        丢弃所属事件循环已经关闭的 client（例如每次调用都使用 asyncio.run 的场景）
+        httpx 只提供异步的 aclose，事件循环关闭后无法再关闭，只能丢弃引用，连接随循环的传输一起释放
+        """
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            client = self._clients.pop(loop)
+            if not client.is_closed:
+                logger.debug("事件循环已关闭，无法关闭其 httpx client，已直接丢弃")
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        httpx = self._httpx
+        client = self._get_client()
+        content = None
+        if json is not None:
+            data, headers = encode_json_body(json, headers)
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+        try:
+            response = await client.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                data=data,
+                content=content,
+                timeout=timeout,
+            )
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise aiohttp.ClientConnectionError(str(e)) from e
+
+        return HttpResponse(
+            method=method,
+            url=str(response.url),
+            status=response.status_code,
+            reason=response.reason_phrase,
+            headers=response.headers,
+            content=response.content,
+            http_version=response.http_version,
+        )
+
+    async def close_current_loop(self) -> None:
+        with self._lock:
+            self._discard_dead_clients()
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    async def close(self) -> None:
+        """
+        关闭所有 client
+        当前事件循环的 client 直接关闭，其他仍在运行的事件循环的 client 投递到对应循环中关闭
+        """
+        current_loop = asyncio.get_running_loop()
+        with self._lock:
+            self._discard_dead_clients()
+            clients = list(self._clients.items())
+            self._clients.clear()
+        for loop, client in clients:
+            if client.is_closed:
+                continue
+            if loop is current_loop:
+                await client.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+            else:
+                # 与 SessionPool.close 一致: 无法在其他未运行的循环上 await aclose
+                logger.warning("事件循环未运行，无法关闭其 httpx client，已直接丢弃")
+
+
+def create_transport(
+    kind: str = TRANSPORT_HTTP1,
+    limit: int = DEFAULT_CONNECTION_LIMIT,
+    limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+) -> Transport:
+    """
+    根据名称创建传输层
+
+    Args:
+        kind: 传输层类型，http1 或 http2
+        limit: 最大连接数
+        limit_per_host: 同一 host 的最大连接数
+        keepalive_timeout: 空闲连接的保活时间（秒）
+
+    Returns:
+        Transport: 传输层实例
+
+    Raises:
+        ValueError: 未知的传输层类型
+    """
+    if kind == TRANSPORT_HTTP1:
+        return AiohttpTransport(SessionPool(limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout))
+    if kind == TRANSPORT_HTTP2:
+        return HttpxTransport(http2=True, limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout)
+    raise ValueError(f"Unknown transport: {kind}")
+
+
+_default_transport: Optional[Transport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    获取进程级默认传输层，供未被 ApiClient 绑定传输层的数据源使用
+
+    Returns:
+        Transport: 基于默认连接池的 HTTP/1.1 传输层
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:  # Double-check
+                _default_transport = AiohttpTransport(get_default_session_pool())
+    return _default_transport
@@ -6,9 +6,8 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from .base import BaseAPI
+from .cache import CACHE_TTL_DAY, cached
 
 logger = logging.getLogger("tripadvisor_official_source")
 
@@ -36,10 +35,9 @@ class TripAdvisorSource(BaseAPI):
         if params is None:
             params = {}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("GET", url, headers=self.headers, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
 
     @property
     def source_name(self) -> str:
@@ -177,6 +175,7 @@ class TripAdvisorSource(BaseAPI):
             logger.error(f"Error searching nearby locations: {e}")
             return {"success": False, "error": str(e)}
 
+    @cached(ttl=CACHE_TTL_DAY)
     async def get_location_details(
         self,
         locationId: int,
@@ -359,6 +358,7 @@ class TripAdvisorSource(BaseAPI):
             logger.error(f"Error getting location reviews: {e}")
             return {"success": False, "error": str(e)}
 
+    @cached(ttl=CACHE_TTL_DAY)
     async def get_location_photos(
         self,
         locationId: int,
@@ -3,14 +3,14 @@ Twitter data source implementation
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Set
 
 import aiohttp
 
 from .base import BaseAPI
+from .models import OUTPUT_FORMAT_RECORDS, ReferencedTweet, Tweet, TweetMetrics, TwitterUser, TwitterUserMetrics, check_output_format
 
 logger = logging.getLogger("twitter_source")
 
@@ -147,16 +147,11 @@ class TwitterSource(BaseAPI):
 
             request_url = f"{self.proxy_url}/search/search"
 
-            # 使用aiohttp发送异步请求
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                    response.raise_for_status()
-                    # 解析响应
-                    data = await response.json(content_type=None)
-
-            # API返回的是JSON字符串，需要先解析
-            if isinstance(data, str):
-                data = json.loads(data)
+            # 发送异步请求
+            response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+            response.raise_for_status()
+            # 解析响应
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
@@ -214,6 +209,102 @@ class TwitterSource(BaseAPI):
             logger.exception(e)
             return {"success": False, "error": error_msg}
 
+    async def iter_tweets(
+        self,
+        query: str,
+        max_items: Optional[int] = None,
+        page_size: int = 20,
+        lang: Optional[str] = None,
+        min_retweets: Optional[int] = None,
+        min_likes: Optional[int] = None,
+        min_replies: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over tweet search results page by page, following the pagination cursor automatically.
+        The next page is fetched while the current page is being consumed, tweets already yielded are skipped.
+        A failed page ends the iteration with RuntimeError, tweets of earlier pages have already been yielded;
+        use search_tweets with cursor to retry a page instead.
+
+        Args:
+            query (str): Search keyword, e.g. "Tesla" or "#TSLA"
+            max_items (Optional[int]): Maximum number of tweets to yield, default is None for all results
+            page_size (int): Number of tweets requested per page, at most 100, default is 20
+            lang (Optional[str]): Language code, zh for Chinese, en for English, default is None
+            min_retweets (Optional[int]): Minimum number of retweets, default is None
+            min_likes (Optional[int]): Minimum number of likes, default is None
+            min_replies (Optional[int]): Minimum number of replies, default is None
+            start_date (Optional[str]): Start date, format: YYYY-MM-DD, default is None
+            end_date (Optional[str]): End date, format: YYYY-MM-DD, default is None
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: Async iterator of tweets, each tweet has the same format as in search_tweets
+
+        Raises:
+            RuntimeError: A page request failed, the message contains the error of search_tweets
+
+        Example:
+            >>> async for tweet in client.twitter.iter_tweets("Tesla", max_items=1000):
+            ...     print(tweet["id"], tweet["text"])
+        """
+        if max_items is not None and max_items <= 0:
+            return
+
+        def fetch(cursor: Optional[str]) -> "asyncio.Task[Dict[str, Any]]":
+            return asyncio.ensure_future(
+                self.search_tweets(
+                    query=query,
+                    limit=page_size,
+                    lang=lang,
+                    min_retweets=min_retweets,
+                    min_likes=min_likes,
+                    min_replies=min_replies,
+                    start_date=start_date,
+                    end_date=end_date,
+                    cursor=cursor,
+                )
+            )
+
+        # 只保存已返回的推文 ID，推文本身不在内存中累积
+        seen_ids: Set[str] = set()
+        yielded = 0
+        next_page: Optional["asyncio.Task[Dict[str, Any]]"] = fetch(None)
+        try:
+            while next_page is not None:
+                result = await next_page
+                next_page = None
+                if not result["success"]:
+                    raise RuntimeError(result["error"])
+
+                tweets = result["data"]["tweets"]
+                cursor = result["data"]["cursor"]
+                # 本页可能已满足 max_items 时不预取，避免多余的请求
+                if cursor and tweets and (max_items is None or yielded + len(tweets) < max_items):
+                    next_page = fetch(cursor)
+
+                new_count = 0
+                for tweet in tweets:
+                    if tweet["id"] in seen_ids:
+                        continue
+                    seen_ids.add(tweet["id"])
+                    new_count += 1
+                    yield tweet
+                    yielded += 1
+                    if max_items is not None and yielded >= max_items:
+                        return
+
+                if new_count == 0:
+                    # 整页都是重复推文，说明游标没有前进
+                    return
+                if next_page is None and cursor:
+                    # 去重后数量不足 max_items，继续获取下一页
+                    next_page = fetch(cursor)
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
+
     async def get_user_info(self, username: str, user_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get detailed information about a Twitter user.
@@ -272,22 +363,17 @@ class TwitterSource(BaseAPI):
             if user_id:
                 params["user_id"] = user_id
 
-            # 使用aiohttp发送异步请求
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                    response.raise_for_status()
-                    # 解析响应
-                    data = await response.json(content_type=None)
-
-            # 解析响应数据
-            if isinstance(data, str):
-                data = json.loads(data)
+            # 发送异步请求
+            response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+            response.raise_for_status()
+            # 解析响应
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
 
             # 构建返回数据
-            return {"success": True, "data": self._parse_user_info(data)}
+            return {"success": True, "data": self._parse_user_info(data).to_dict()}
 
         except asyncio.TimeoutError:
             error_msg = f"Request timeout (timeout={self._timeout}s)"
@@ -304,7 +390,13 @@ class TwitterSource(BaseAPI):
             return {"success": False, "error": error_msg}
 
     async def get_user_tweets(
-        self, username: str, limit: int = 10, user_id: Optional[str] = None, include_replies: bool = False, include_pinned: bool = False
+        self,
+        username: str,
+        limit: int = 10,
+        user_id: Optional[str] = None,
+        include_replies: bool = False,
+        include_pinned: bool = False,
+        output_format: str = OUTPUT_FORMAT_RECORDS,
     ) -> Dict[str, Any]:
         """
         Get a list of tweets from a Twitter user.
@@ -315,6 +407,8 @@ class TwitterSource(BaseAPI):
             user_id (Optional[str]): Twitter user ID, default is None, if provided user_id, username will be ignored
             include_replies (bool): Whether to include reply tweets, default is False
             include_pinned (bool): Whether to include pinned tweets, default is False
+            output_format (str): Format of "tweets", options: records|models, default: records.
+                models returns compact Tweet objects (see models.py), tweet.to_dict() gives the records format.
 
         Returns:
             Dict[str, Any]: Dictionary containing user tweet list, e.g.
@@ -369,6 +463,8 @@ class TwitterSource(BaseAPI):
         #     ...     print(f"Failed to get tweets: {result['error']}")
         # """
         try:
+            check_output_format(output_format)
+
             # 构建请求URL
             request_url = f"{self.proxy_url}/user/tweets"
 
@@ -383,16 +479,11 @@ class TwitterSource(BaseAPI):
             if user_id:
                 params["user_id"] = user_id
 
-            # 使用aiohttp发送异步请求
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                    response.raise_for_status()
-                    # 解析响应
-                    data = await response.json(content_type=None)
-
-            # 解析响应数据
-            if isinstance(data, str):
-                data = json.loads(data)
+            # 发送异步请求
+            response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+            response.raise_for_status()
+            # 解析响应
+            data = response.json()
 
             if not isinstance(data, dict):
                 raise ValueError(f"Invalid API response format: {data}")
@@ -403,6 +494,8 @@ class TwitterSource(BaseAPI):
             tweets = []
             for result in data["results"]:
                 tweet = self._parse_tweet_with_ref(result)
+                if output_format == OUTPUT_FORMAT_RECORDS:
+                    tweet = tweet.to_dict()
 
                 tweets.append(tweet)
 
@@ -436,31 +529,31 @@ class TwitterSource(BaseAPI):
         except Exception:
             return date_str
 
-    def _parse_user_info(self, data: dict[str, Any]) -> dict[str, Any]:
-        return {
-            "id": str(data.get("user_id")),
-            "username": data.get("username"),
-            "name": data.get("name"),
-            "created_at": self._format_date(data.get("creation_date")),
-            "description": data.get("description"),
-            "location": data.get("location"),
-            "url": data.get("external_url"),
-            "profile_image_url": data.get("profile_pic_url"),
-            "profile_banner_url": data.get("profile_banner_url"),
-            "public_metrics": {
-                "followers_count": data.get("follower_count", 0),
-                "following_count": data.get("following_count", 0),
-                "tweet_count": data.get("number_of_tweets", 0),
-                "listed_count": data.get("listed_count", 0),
-                "like_count": data.get("favourites_count", 0),
-            },
-            "verified": data.get("is_verified", False),
-            "blue_verified": data.get("is_blue_verified", False),
-            "private": data.get("is_private", False),
-            "bot": data.get("bot", False),
-        }
-
-    def _parse_tweet_without_ref(self, result: dict[str, Any]) -> dict[str, Any]:
+    def _parse_user_info(self, data: dict[str, Any]) -> TwitterUser:
+        return TwitterUser(
+            id=str(data.get("user_id")),
+            username=data.get("username"),
+            name=data.get("name"),
+            created_at=self._format_date(data.get("creation_date")),
+            description=data.get("description"),
+            location=data.get("location"),
+            url=data.get("external_url"),
+            profile_image_url=data.get("profile_pic_url"),
+            profile_banner_url=data.get("profile_banner_url"),
+            public_metrics=TwitterUserMetrics(
+                followers_count=data.get("follower_count", 0),
+                following_count=data.get("following_count", 0),
+                tweet_count=data.get("number_of_tweets", 0),
+                listed_count=data.get("listed_count", 0),
+                like_count=data.get("favourites_count", 0),
+            ),
+            verified=data.get("is_verified", False),
+            blue_verified=data.get("is_blue_verified", False),
+            private=data.get("is_private", False),
+            bot=data.get("bot", False),
+        )
+
+    def _parse_tweet_without_ref(self, result: dict[str, Any]) -> Tweet:
         media_urls = []
         if result.get("media_url"):
             if isinstance(result["media_url"], list):
@@ -476,46 +569,40 @@ class TwitterSource(BaseAPI):
             elif result["video_url"]:
                 video_urls.append(result["video_url"])
 
-        tweet = {
-            "id": str(result.get("tweet_id")),
-            "created_at": self._format_date(result.get("creation_date")),
-            "text": result.get("text", ""),
-            "language": result.get("language"),
-            "media_urls": media_urls,
-            "video_urls": video_urls,
-            "public_metrics": {
-                "retweet_count": result.get("retweet_count", 0),
-                "reply_count": result.get("reply_count", 0),
-                "like_count": result.get("favorite_count", 0),
-                "quote_count": result.get("quote_count", 0),
-                "view_count": result.get("views", 0),
-                "bookmark_count": result.get("bookmark_count", 0),
-            },
-            "user": self._parse_user_info(result.get("user", {})),
-        }
-
-        return tweet
-
-    def _parse_tweet_with_ref(self, result: dict[str, Any]) -> dict[str, Any]:
+        return Tweet(
+            id=str(result.get("tweet_id")),
+            created_at=self._format_date(result.get("creation_date")),
+            text=result.get("text", ""),
+            language=result.get("language"),
+            media_urls=media_urls,
+            video_urls=video_urls,
+            public_metrics=TweetMetrics(
+                retweet_count=result.get("retweet_count", 0),
+                reply_count=result.get("reply_count", 0),
+                like_count=result.get("favorite_count", 0),
+                quote_count=result.get("quote_count", 0),
+                view_count=result.get("views", 0),
+                bookmark_count=result.get("bookmark_count", 0),
+            ),
+            user=self._parse_user_info(result.get("user", {})),
+        )
+
+    def _parse_tweet_with_ref(self, result: dict[str, Any]) -> Tweet:
         """Parse tweet data"""
 
         tweet = self._parse_tweet_without_ref(result)
 
         # 处理引用推文
-        referenced_tweets: dict[str, Any] = {}
         if result.get("in_reply_to_status_id"):
-            referenced_tweets = {"type": "reply", "id": str(result.get("in_reply_to_status_id", ""))}
+            tweet.referenced_tweets = ReferencedTweet(type="reply", id=str(result.get("in_reply_to_status_id", "")))
         elif result.get("retweet_tweet_id") and result.get("retweet_status"):
             retweet = result.get("retweet_status", {})
-            referenced_tweets = {"type": "retweet", **self._parse_tweet_without_ref(retweet)}
+            tweet.referenced_tweets = ReferencedTweet(type="retweet", tweet=self._parse_tweet_without_ref(retweet))
             if retweet.get("quoted_status"):
                 quoted = retweet.get("quoted_status", {})
-                referenced_tweets["quoted_status"] = {"type": "quote", **self._parse_tweet_without_ref(quoted)}
+                tweet.referenced_tweets.quoted_status = ReferencedTweet(type="quote", tweet=self._parse_tweet_without_ref(quoted))
         elif result.get("quoted_status_id") and result.get("quoted_status"):
             quoted = result.get("quoted_status", {})
-            referenced_tweets = {"type": "quote", **self._parse_tweet_without_ref(quoted)}
-
-        if referenced_tweets:
-            tweet["referenced_tweets"] = referenced_tweets
+            tweet.referenced_tweets = ReferencedTweet(type="quote", tweet=self._parse_tweet_without_ref(quoted))
 
         return tweet
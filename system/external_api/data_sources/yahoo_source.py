@@ -4,15 +4,26 @@ Yahoo Finance data source implementation
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import aiohttp
 
 from .base import BaseAPI
+from .cache import CACHE_TTL_HOUR, cached
 
 logger = logging.getLogger("yahoo_finance_source")
 
+# get_multiple_stocks_price 同时进行的 get_stock_price 请求数上限
+DEFAULT_FAN_OUT_CONCURRENCY = 8
+
+# get_stock_price 的返回格式
+OUTPUT_FORMAT_RECORDS = "records"
+OUTPUT_FORMAT_NUMPY = "numpy"
+OUTPUT_FORMAT_PANDAS = "pandas"
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
 
 class YahooFinanceSource(BaseAPI):
     """Yahoo Finance API data source implementation"""
@@ -32,6 +43,7 @@ class YahooFinanceSource(BaseAPI):
             "X-Biz-Id": "matrix-agent",
             "X-Request-Timeout": str(config["timeout"] - 5),
         }
+        self._fan_out_concurrency = config.get("fan_out_concurrency", DEFAULT_FAN_OUT_CONCURRENCY)
 
     @property
     def source_name(self) -> str:
@@ -60,6 +72,7 @@ class YahooFinanceSource(BaseAPI):
         end_date: str,
         interval: str = "1d",
         events: str = "",
+        output_format: str = OUTPUT_FORMAT_RECORDS,
     ) -> Dict[str, Any]:
         """Get stock price data. Please set start_date, end_date, interval reasonably to avoid getting too much data,
         which could cause request timeout or performance issues.
@@ -70,6 +83,11 @@ class YahooFinanceSource(BaseAPI):
             end_date: End date in YYYY-MM-DD format
             interval: Time interval, options: 1m|2m|5m|15m|30m|60m|1d|1wk|1mo, default: 1d
             events: Event type, options: capitalGain|div|split|earn|history, default: empty
+            output_format: Format of "prices", options: records|numpy|pandas, default: records.
+                records: list of dicts as shown below;
+                numpy: dict of NumPy arrays with keys date (datetime64[D]), open, high, low, close, volume;
+                pandas: pandas DataFrame indexed by date with columns open, high, low, close, volume.
+                numpy / pandas are recommended for long intraday ranges
 
         Returns:
             Dict[str, Any]: Dictionary containing stock price data, e.g.
@@ -99,6 +117,9 @@ class YahooFinanceSource(BaseAPI):
             }
         """
         try:
+            if output_format not in (OUTPUT_FORMAT_RECORDS, OUTPUT_FORMAT_NUMPY, OUTPUT_FORMAT_PANDAS):
+                raise ValueError(f"Unsupported output_format: {output_format}")
+
             # Convert date string to timestamp
             start_timestamp = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
             end_timestamp = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
@@ -124,12 +145,11 @@ class YahooFinanceSource(BaseAPI):
 
             request_url = f"{self.proxy_url}/stock/v3/get-chart"
 
-            # Send request using aiohttp
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                    response.raise_for_status()
-                    # Parse the response
-                    data = await response.json()
+            # Send request
+            response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+            response.raise_for_status()
+            # Parse the response
+            data = response.json()
 
             # Check if there is an error in API response
             if data.get("chart", {}).get("error"):
@@ -140,6 +160,15 @@ class YahooFinanceSource(BaseAPI):
             timestamps = chart_data["timestamp"]
             quote = chart_data["indicators"]["quote"][0]
 
+            if output_format == OUTPUT_FORMAT_NUMPY:
+                return {"success": True, "data": {"symbol": symbol, "prices": self._build_price_columns(timestamps, quote)}}
+            if output_format == OUTPUT_FORMAT_PANDAS:
+                import pandas as pd
+
+                columns = self._build_price_columns(timestamps, quote)
+                prices_df = pd.DataFrame({name: columns[name] for name in PRICE_COLUMNS}, index=pd.Index(columns["date"], name="date"))
+                return {"success": True, "data": {"symbol": symbol, "prices": prices_df}}
+
             # Build price data list
             prices = []
             for i, timestamp in enumerate(timestamps):
@@ -168,6 +197,31 @@ class YahooFinanceSource(BaseAPI):
             logger.exception(e)
             return {"success": False, "error": f"Unknown error: {str(e)}"}
 
+    @staticmethod
+    def _build_price_columns(timestamps: List[int], quote: Dict[str, List[Any]]) -> Dict[str, Any]:
+        """Build columnar price data directly from the parallel arrays returned by Yahoo
+
+        Args:
+            timestamps: Bar timestamps (seconds)
+            quote: Quote arrays keyed by open / high / low / close / volume
+
+        Returns:
+            Dict[str, Any]: NumPy arrays keyed by date / open / high / low / close / volume,
+            missing prices are NaN, volume is int64 unless it contains missing values
+        """
+        import numpy as np
+
+        ts = np.asarray(timestamps, dtype=np.int64)
+        # Dates follow the local time zone like the records format, with the UTC offset of each bar so ranges across a DST change match
+        offsets = np.fromiter((time.localtime(t).tm_gmtoff for t in ts.tolist()), dtype=np.int64, count=len(ts))
+        columns: Dict[str, Any] = {"date": (ts + offsets).astype("datetime64[s]").astype("datetime64[D]")}
+        for name in PRICE_COLUMNS:
+            values = np.asarray(quote[name], dtype=np.float64)
+            if name == "volume" and not np.isnan(values).any():
+                values = values.astype(np.int64)
+            columns[name] = values
+        return columns
+
     async def get_stock_news(self, symbol: str, region: str = "US", snippet_count: int = 10) -> Dict[str, Any]:
         """获取股票相关的新闻数据
         Args:
@@ -204,57 +258,57 @@ class YahooFinanceSource(BaseAPI):
 
             # 发送POST请求
             try:
-                async with aiohttp.ClientSession(trust_env=True) as session:
-                    # 使用POST请求，并设置空数据体
-                    async with session.post(
-                        request_url,
-                        headers=self.headers,
-                        params=params,
-                        data="",  # load_more 逻辑，先不适配
-                        timeout=self._timeout,
-                    ) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                        # 提取并处理新闻数据 - 根据实际响应格式调整
-                        stream_items = []
-                        # 检查响应结构中的main.stream路径
-                        if data.get("data") and data["data"].get("main") and data["data"]["main"].get("stream"):
-                            stream_items = data["data"]["main"]["stream"]
-
-                        # 转换为简化的新闻对象列表
-                        simple_news = []
-                        for stream_item in stream_items:
-                            content = stream_item.get("content", {})
-                            if not content:
-                                continue
-
-                            # 获取链接
-                            link = ""
-                            click_through_url = content.get("clickThroughUrl", {})
-                            if click_through_url and click_through_url.get("url"):
-                                link = click_through_url["url"]
-
-                            # 获取发布者
-                            publisher = ""
-                            if content.get("provider") and content["provider"].get("displayName"):
-                                publisher = content["provider"]["displayName"]
-
-                            # 创建简化的新闻项
-                            news_item = {
-                                "title": content.get("title", ""),
-                                "publisher": publisher,
-                                "publish_date": content.get("pubDate", ""),
-                                "link": link,
-                                "uuid": content.get("id", ""),
-                                "content_type": content.get("contentType", ""),
-                                "thumbnail": self._extract_thumbnail(content.get("thumbnail", {})),
-                                "tickers": self._extract_tickers(content.get("finance", {})),
-                            }
-                            simple_news.append(news_item)
-
-                        # 返回结构化的新闻列表
-                        return {"success": True, "data": {"symbol": symbol, "simple_news": simple_news}}
+                # 使用POST请求，并设置空数据体
+                response = await self._request(
+                    "POST",
+                    request_url,
+                    headers=self.headers,
+                    params=params,
+                    data="",  # load_more 逻辑，先不适配
+                    timeout=self._timeout,
+                )
+                response.raise_for_status()
+                data = response.json()
+
+                # 提取并处理新闻数据 - 根据实际响应格式调整
+                stream_items = []
+                # 检查响应结构中的main.stream路径
+                if data.get("data") and data["data"].get("main") and data["data"]["main"].get("stream"):
+                    stream_items = data["data"]["main"]["stream"]
+
+                # 转换为简化的新闻对象列表
+                simple_news = []
+                for stream_item in stream_items:
+                    content = stream_item.get("content", {})
+                    if not content:
+                        continue
+
+                    # 获取链接
+                    link = ""
+                    click_through_url = content.get("clickThroughUrl", {})
+                    if click_through_url and click_through_url.get("url"):
+                        link = click_through_url["url"]
+
+                    # 获取发布者
+                    publisher = ""
+                    if content.get("provider") and content["provider"].get("displayName"):
+                        publisher = content["provider"]["displayName"]
+
+                    # 创建简化的新闻项
+                    news_item = {
+                        "title": content.get("title", ""),
+                        "publisher": publisher,
+                        "publish_date": content.get("pubDate", ""),
+                        "link": link,
+                        "uuid": content.get("id", ""),
+                        "content_type": content.get("contentType", ""),
+                        "thumbnail": self._extract_thumbnail(content.get("thumbnail", {})),
+                        "tickers": self._extract_tickers(content.get("finance", {})),
+                    }
+                    simple_news.append(news_item)
+
+                # 返回结构化的新闻列表
+                return {"success": True, "data": {"symbol": symbol, "simple_news": simple_news}}
 
             except asyncio.TimeoutError:
                 error_msg = f"请求超时 (timeout={self._timeout}秒)"
@@ -315,6 +369,7 @@ class YahooFinanceSource(BaseAPI):
                     tickers.append(ticker_data["symbol"])
         return tickers
 
+    @cached(ttl=CACHE_TTL_HOUR)
     async def get_stock_info(self, symbol: str) -> Dict[str, Any]:
         """Get basic stock information
 
@@ -356,10 +411,9 @@ class YahooFinanceSource(BaseAPI):
 
             # Send request
             try:
-                async with aiohttp.ClientSession(trust_env=True) as session:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        response.raise_for_status()
-                        data = await response.json()
+                response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+                response.raise_for_status()
+                data = response.json()
 
             except asyncio.TimeoutError:
                 error_msg = f"Request timeout (timeout={self._timeout}s)"
@@ -416,8 +470,10 @@ class YahooFinanceSource(BaseAPI):
         end_date: str,
         interval: str = "1d",
         events: str = "",
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Get price data for multiple stocks
+        """Get price data for multiple stocks. Stocks are fetched concurrently, results keep the order of symbols
 
         Args:
             symbols(List[str]): Stock code list
@@ -425,6 +481,8 @@ class YahooFinanceSource(BaseAPI):
             end_date(str): End date in YYYY-MM-DD format
             interval(str): Time interval, options: 1m|2m|5m|15m|30m|60m|1d|1wk|1mo, default: 1d
             events(str): Event type, options: capitalGain|div|split|earn|history, default: empty
+            max_concurrency(Optional[int]): Maximum number of stocks fetched at the same time, default: 8
+            deadline(Optional[float]): Overall time limit in seconds for the whole batch, stocks not finished by then are reported in failed_symbols, default: no limit
 
         Returns:
             Dict[str, Any]: Dictionary containing stock price data, e.g.
@@ -468,22 +526,44 @@ class YahooFinanceSource(BaseAPI):
         try:
             stocks_data = []
             failed_symbols = []
+            semaphore = asyncio.Semaphore(max_concurrency or self._fan_out_concurrency)
 
-            # Iterate over stock code list to get data for each stock
-            for symbol in symbols:
-                try:
-                    result = await self.get_stock_price(
+            async def fetch(symbol: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.get_stock_price(
                         symbol=symbol, start_date=start_date, end_date=end_date, interval=interval, events=events
                     )
-                    if result["success"]:
-                        stocks_data.append(result["data"])
-                    else:
-                        failed_symbols.append((symbol, result["error"]))
-                        logger.warning(f"Failed to get data for stock {symbol}: {result['error']}")
-                except Exception as e:
+
+            # Fetch all stocks concurrently, bounded by the semaphore
+            tasks = [asyncio.ensure_future(fetch(symbol)) for symbol in symbols]
+            pending = set()
+            try:
+                if tasks:
+                    _, pending = await asyncio.wait(tasks, timeout=deadline)
+            finally:
+                # Cancel stocks not finished by the deadline (or all of them if this call is cancelled)
+                unfinished = [task for task in tasks if not task.done()]
+                for task in unfinished:
+                    task.cancel()
+                await asyncio.gather(*unfinished, return_exceptions=True)
+
+            # Collect results in the order of the stock code list
+            for symbol, task in zip(symbols, tasks):
+                if task in pending:
+                    failed_symbols.append((symbol, f"Deadline exceeded (deadline={deadline}s)"))
+                    logger.warning(f"Deadline exceeded while getting data for stock {symbol}")
+                    continue
+                e = task.exception()
+                if e is not None:
                     failed_symbols.append((symbol, str(e)))
-                    logger.error(f"Error occurred while getting data for stock {symbol}: {str(e)}")
-                    logger.exception(e)
+                    logger.error(f"Error occurred while getting data for stock {symbol}: {str(e)}", exc_info=e)
+                    continue
+                result = task.result()
+                if result["success"]:
+                    stocks_data.append(result["data"])
+                else:
+                    failed_symbols.append((symbol, result["error"]))
+                    logger.warning(f"Failed to get data for stock {symbol}: {result['error']}")
 
             # If all stocks fail to get data
             if len(failed_symbols) == len(symbols):
@@ -568,16 +648,15 @@ class YahooFinanceSource(BaseAPI):
             params = {"symbol": symbol}
 
             # Send request
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                try:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        # Check response status
-                        response.raise_for_status()
-                        data = await response.json()
-                except asyncio.TimeoutError:
-                    return {"success": False, "error": f"Request timeout (timeout={self._timeout}s)"}
-                except aiohttp.ClientError as e:
-                    return {"success": False, "error": f"HTTP request error: {str(e)}"}
+            try:
+                response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+                # Check response status
+                response.raise_for_status()
+                data = response.json()
+            except asyncio.TimeoutError:
+                return {"success": False, "error": f"Request timeout (timeout={self._timeout}s)"}
+            except aiohttp.ClientError as e:
+                return {"success": False, "error": f"HTTP request error: {str(e)}"}
 
             # Check if there is an error in API response
             if data.get("finance", {}).get("error"):
@@ -634,6 +713,7 @@ class YahooFinanceSource(BaseAPI):
             logger.exception(e)
             return {"success": False, "error": str(e)}
 
+    @cached(ttl=CACHE_TTL_HOUR)
     async def get_stock_statistics(self, symbol: str, region: Optional[str] = None, lang: Optional[str] = None) -> Dict[str, Any]:
         """Get stock statistics data, including valuation metrics, financial ratios, and shareholder information
 
@@ -709,16 +789,15 @@ class YahooFinanceSource(BaseAPI):
                 params["lang"] = lang
 
             # Send request
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                try:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        # Check response status
-                        response.raise_for_status()
-                        data = await response.json()
-                except asyncio.TimeoutError:
-                    return {"success": False, "error": f"Request timeout (timeout={self._timeout}s)"}
-                except aiohttp.ClientError as e:
-                    return {"success": False, "error": f"HTTP request error: {str(e)}"}
+            try:
+                response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+                # Check response status
+                response.raise_for_status()
+                data = response.json()
+            except asyncio.TimeoutError:
+                return {"success": False, "error": f"Request timeout (timeout={self._timeout}s)"}
+            except aiohttp.ClientError as e:
+                return {"success": False, "error": f"HTTP request error: {str(e)}"}
 
             # Check if there is an error in API response
             if data.get("quoteSummary", {}).get("error"):
@@ -772,6 +851,7 @@ class YahooFinanceSource(BaseAPI):
             logger.exception(e)
             return {"success": False, "error": str(e)}
 
+    @cached(ttl=CACHE_TTL_HOUR)
     async def get_financial_data(self, symbol: str) -> Dict[str, Any]:
         """Get stock financial data
 
@@ -852,10 +932,9 @@ class YahooFinanceSource(BaseAPI):
 
             # Send request
             try:
-                async with aiohttp.ClientSession(trust_env=True) as session:
-                    async with session.get(request_url, headers=self.headers, params=params, timeout=self._timeout) as response:
-                        response.raise_for_status()
-                        data = await response.json()
+                response = await self._request("GET", request_url, headers=self.headers, params=params, timeout=self._timeout)
+                response.raise_for_status()
+                data = response.json()
 
             except asyncio.TimeoutError:
                 error_msg = f"Request timeout (timeout={self._timeout}s)"
@@ -1,18 +1,76 @@
 import asyncio
-import json
+import codecs
+import copy
+import hashlib
+import logging
 import os
+import threading
+import time
 import uuid
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, cast
 
 import aiohttp
 from pydantic import BaseModel
 
+from external_api.data_sources import codec, tracing
+from external_api.data_sources.session_pool import SessionPool
+
 ENV_AGENT_NAME = "AGENT_NAME"
 ENV_FUNC_SERVER_PORT = "FUNC_SERVER_PORT"
+# 设置后通过 Unix domain socket 访问 function server，而不是 localhost TCP
+ENV_FUNC_SERVER_SOCKET = "FUNC_SERVER_SOCKET"
+# 设置后（秒）按该间隔轮询 mcp_function_list.json，变化时热加载到 external_api 模块中
+ENV_FUNC_LIST_WATCH_INTERVAL = "FUNC_LIST_WATCH_INTERVAL"
 MCP_FUNCTION_LIST_JSON_FILE = "mcp_function_list.json"
 
+logger = logging.getLogger("function_utils")
+
 SERVER_PORT = 12306
 PROXY_TIMEOUT = 3600
+# function server 只有一个 host，连接上限即为到 function server 的并发上限
+FUNC_SERVER_CONNECTION_LIMIT = 100
+# 流式调用时 function server 以 NDJSON 逐行返回部分结果与最终结果
+STREAM_CONTENT_TYPE = "application/x-ndjson"
+
+# 按 socket 路径区分的连接池，空字符串表示 TCP
+_session_pools: Dict[str, SessionPool] = {}
+_session_pools_lock = threading.Lock()
+
+
+def get_function_session_pool(socket_path: str = "") -> SessionPool:
+    """
+    获取访问 function server 的共享连接池
+
+    Args:
+        socket_path: Unix domain socket 路径，为空时使用 TCP 连接
+
+    Returns:
+        SessionPool: 共享连接池，每个事件循环一个 session
+    """
+    pool = _session_pools.get(socket_path)
+    if pool is None:
+        with _session_pools_lock:
+            pool = _session_pools.get(socket_path)
+            if pool is None:  # Double-check
+                if socket_path:
+                    # 本地 socket 不应经过环境变量中配置的 HTTP 代理
+                    pool = SessionPool(
+                        connector_factory=lambda: aiohttp.UnixConnector(path=socket_path, limit=FUNC_SERVER_CONNECTION_LIMIT),
+                        trust_env=False,
+                    )
+                else:
+                    pool = SessionPool(limit=FUNC_SERVER_CONNECTION_LIMIT, limit_per_host=FUNC_SERVER_CONNECTION_LIMIT)
+                _session_pools[socket_path] = pool
+    return pool
+
+
+async def close_function_session_pools() -> None:
+    """关闭所有访问 function server 的连接池"""
+    with _session_pools_lock:
+        pools = list(_session_pools.values())
+        _session_pools.clear()
+    for pool in pools:
+        await pool.close()
 
 
 class ToolResult(BaseModel):
@@ -22,8 +80,15 @@ class ToolResult(BaseModel):
     is_error: bool
 
 
+class ToolResultChunk(BaseModel):
+    """流式调用中的部分结果"""
+
+    message: str
+
+
 class FunctionProxy:
     def __init__(self, function_info: Dict[str, Any]):
+        self.function_info = function_info
         self.name: str = function_info["name"]
         self.origin_name: str | None = function_info.get("origin_name", None)
         self.params: List[Dict[str, Any]] = function_info["parameters"]
@@ -31,14 +96,18 @@ class FunctionProxy:
         self.params_len = len(self.params)
         self.agent_name: str = os.environ.get(ENV_AGENT_NAME, "")
         self.server_port = SERVER_PORT
+        self.socket_path: str = os.environ.get(ENV_FUNC_SERVER_SOCKET, "")
         self.timeout: int = PROXY_TIMEOUT
 
     def get_server_url(self):
+        if self.socket_path:
+            # 走 Unix domain socket 时 host 仅用于构造 URL
+            return "http://localhost"
         if self.server_port == 0:
             raise Exception("PORT is not set, please set it in the environment variable")
         return f"http://localhost:{self.server_port}"
 
-    async def __call__(self, *args, **kwargs) -> ToolResult:
+    def _build_request(self, *args, **kwargs) -> Dict[str, Any]:
         call_params = kwargs.copy()
         args_len = len(args)
 
@@ -50,7 +119,7 @@ class FunctionProxy:
                 if i < self.params_len:
                     call_params[self.params[i]["name"]] = args[i]
 
-        request = {
+        return {
             "request_id": str(uuid.uuid4()),
             "function_name": self.origin_name or self.name,
             "function_kind": self.kind,
@@ -58,32 +127,75 @@ class FunctionProxy:
             "parameters": call_params,
         }
 
+    async def __call__(self, *args, **kwargs) -> ToolResult:
+        request = self._build_request(*args, **kwargs)
+
         # 发出请求前的拦截
         tool_result = self._intercept_request(self.name, request)
         if tool_result is not None:
             return tool_result
 
+        return await self._execute(request)
+
+    def stream(self, *args, **kwargs) -> "ToolResultStream":
+        """
+        流式调用，参数与直接调用相同；function server 返回的部分结果到达即可处理，不必等待整个工具结束，
+        参见 ToolResultStream
+        """
+        request = self._build_request(*args, **kwargs)
+        return ToolResultStream(self, request, self._intercept_request(self.name, request))
+
+    async def _execute(self, request: Dict[str, Any]) -> ToolResult:
+        # request_id 作为 trace_id，并通过 X-Request-Id 传给 function server
+        with tracing.span(
+            f"function.{self.name}", trace_id=request["request_id"], request_id=request["request_id"], function_kind=self.kind
+        ) as span:
+            tool_result = await self._post(request, span)
+            if span is not None and tool_result.is_error:
+                span.status = tracing.SPAN_STATUS_ERROR
+            return tool_result
+
+    async def _post(self, request: Dict[str, Any], span: Optional[tracing.Span]) -> ToolResult:
         timeout = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-            try:
-                async with session.post(f"{self.get_server_url()}/execute", json=request) as response:
-                    if response.status != 200:
-                        return ToolResult(is_error=True, message=f"Function call failed: {await response.text()}")
-
-                    result = await response.json()
-                    if result.get("is_error", False):
-                        return ToolResult(is_error=True, message=result.get("message", "Unknown error"))
-
-                    tool_result = ToolResult(is_error=False, message=result.get("message", "succeed"))
-                    return self._intercept_response(self.name, request, tool_result)
-            except asyncio.TimeoutError:
-                error_msg = f"Timeout when calling function {self.name}"
-                return ToolResult(is_error=True, message=error_msg)
-            except Exception as e:
-                import traceback
+        session = get_function_session_pool(self.socket_path).get_session()
+        try:
+            start = time.perf_counter()
+            data = codec.dumps(request)
+            if span is not None:
+                span.add_phase("encode", time.perf_counter() - start)
+                start = time.perf_counter()
+            async with session.post(
+                f"{self.get_server_url()}/execute",
+                data=data,
+                headers={"Content-Type": "application/json", tracing.TRACE_HEADER: request["request_id"]},
+                timeout=timeout,
+            ) as response:
+                if response.status != 200:
+                    return ToolResult(is_error=True, message=f"Function call failed: {await response.text()}")
+
+                body = await response.read()
+                if span is not None:
+                    span.add_phase("request", time.perf_counter() - start)
+                    start = time.perf_counter()
+                result = codec.loads(body)
+                if span is not None:
+                    span.add_phase("decode", time.perf_counter() - start)
+                return self._parse_result(request, result)
+        except asyncio.TimeoutError:
+            error_msg = f"Timeout when calling function {self.name}"
+            return ToolResult(is_error=True, message=error_msg)
+        except Exception as e:
+            import traceback
+
+            error_msg = f"Error: {str(e)}\nTraceback:\n{traceback.format_exc()}"
+            return ToolResult(is_error=True, message=error_msg)
 
-                error_msg = f"Error: {str(e)}\nTraceback:\n{traceback.format_exc()}"
-                return ToolResult(is_error=True, message=error_msg)
+    def _parse_result(self, request: Dict[str, Any], result: Dict[str, Any]) -> ToolResult:
+        if result.get("is_error", False):
+            return ToolResult(is_error=True, message=result.get("message", "Unknown error"))
+
+        tool_result = ToolResult(is_error=False, message=result.get("message", "succeed"))
+        return self._intercept_response(self.name, request, tool_result)
 
     def _intercept_request(self, function_name: str, request: Dict[str, Any]) -> Optional[ToolResult]:
         if self.kind == "agent" and self.agent_name and "planner" not in self.agent_name:
@@ -97,14 +209,388 @@ class FunctionProxy:
         return result
 
 
+async def _iter_lines(content: aiohttp.StreamReader) -> AsyncIterator[bytes]:
+    # 不使用 StreamReader 的按行读取，它对单行长度有上限，而最终结果可能很大
+    buffer = bytearray()
+    async for data in content.iter_any():
+        scan = len(buffer)
+        buffer += data
+        start = 0
+        while (end := buffer.find(b"\n", scan)) != -1:
+            yield bytes(buffer[start:end])
+            start = scan = end + 1
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
+
+
+class ToolResultStream:
+    """
+    FunctionProxy.stream 的返回值，async for 逐个得到 ToolResultChunk，迭代结束后 result 为最终的 ToolResult；
+    也可以用 await final() 跳过剩余的部分结果直接得到最终结果，提前结束时调用 aclose() 关闭连接。
+    请求仍然 POST /execute，Accept 头中优先要求 application/x-ndjson，按响应的 Content-Type 读取:
+    - application/x-ndjson: 每行一个 JSON 对象，{"type": "partial", "message": ...} 为部分结果，
+      其余行（通常是最后一行）与非流式响应相同，作为最终结果；部分结果不在内存中累积
+    - application/json: 不支持流式的 function server，没有部分结果，整个响应即最终结果
+    - 其他（如 text/plain 分块传输）: 每个到达的文本块作为部分结果，最终结果为全部文本
+    """
+
+    def __init__(self, proxy: FunctionProxy, request: Dict[str, Any], intercepted: Optional[ToolResult] = None):
+        self.request_id: str = request["request_id"]
+        self.result: Optional[ToolResult] = intercepted
+        self._proxy = proxy
+        self._request = request
+        self._iterator = self._iterate(proxy, request) if intercepted is None else None
+
+    def __aiter__(self) -> "ToolResultStream":
+        return self
+
+    async def __anext__(self) -> ToolResultChunk:
+        if self._iterator is None:
+            raise StopAsyncIteration
+        return await self._iterator.__anext__()
+
+    async def final(self) -> ToolResult:
+        """
+        读取剩余的部分结果并返回最终结果
+
+        Returns:
+            ToolResult: 最终结果，调用失败或流中没有最终结果时 is_error 为 True
+        """
+        async for _ in self:
+            pass
+        return cast(ToolResult, self.result)
+
+    async def aclose(self) -> None:
+        """提前结束读取并关闭连接，此时还没有最终结果则 result 为错误结果"""
+        if self._iterator is not None:
+            await self._iterator.aclose()
+        if self.result is None:
+            self.result = ToolResult(is_error=True, message=f"Stream of function {self._proxy.name} closed before the result")
+
+    async def _iterate(self, proxy: FunctionProxy, request: Dict[str, Any]) -> AsyncIterator[ToolResultChunk]:
+        # 异步生成器在调用方的上下文中执行，因此不把 span 设为当前 span
+        span = tracing.start_span(
+            f"function.{proxy.name}", trace_id=self.request_id, request_id=self.request_id, function_kind=proxy.kind, stream=True
+        )
+        status = None
+        chunks = 0
+        timeout = aiohttp.ClientTimeout(total=proxy.timeout)
+        session = get_function_session_pool(proxy.socket_path).get_session()
+        try:
+            start = time.perf_counter()
+            async with session.post(
+                f"{proxy.get_server_url()}/execute",
+                data=codec.dumps(request),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": f"{STREAM_CONTENT_TYPE}, application/json",
+                    tracing.TRACE_HEADER: self.request_id,
+                },
+                timeout=timeout,
+            ) as response:
+                if span is not None:
+                    span.add_phase("request", time.perf_counter() - start)
+                    start = time.perf_counter()
+                if response.status != 200:
+                    self.result = ToolResult(is_error=True, message=f"Function call failed: {await response.text()}")
+                elif response.content_type == STREAM_CONTENT_TYPE:
+                    async for line in _iter_lines(response.content):
+                        if not line.strip():
+                            continue
+                        event = codec.loads(line)
+                        if event.get("type") == "partial":
+                            chunks += 1
+                            yield ToolResultChunk(message=event.get("message", ""))
+                        else:
+                            self.result = proxy._parse_result(request, event)
+                    if self.result is None:
+                        self.result = ToolResult(is_error=True, message=f"Stream of function {proxy.name} ended without a result")
+                elif response.content_type == "application/json":
+                    self.result = proxy._parse_result(request, codec.loads(await response.read()))
+                else:
+                    decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+                    parts = []
+                    async for data in response.content.iter_any():
+                        text = decoder.decode(data)
+                        if text:
+                            parts.append(text)
+                            chunks += 1
+                            yield ToolResultChunk(message=text)
+                    parts.append(decoder.decode(b"", final=True))
+                    self.result = proxy._parse_result(request, {"is_error": False, "message": "".join(parts)})
+        except (asyncio.CancelledError, GeneratorExit):
+            status = tracing.SPAN_STATUS_CANCELLED
+            raise
+        except asyncio.TimeoutError:
+            self.result = ToolResult(is_error=True, message=f"Timeout when calling function {proxy.name}")
+        except Exception as e:
+            import traceback
+
+            self.result = ToolResult(is_error=True, message=f"Error: {str(e)}\nTraceback:\n{traceback.format_exc()}")
+        finally:
+            if span is not None:
+                span.add_phase("stream", time.perf_counter() - start)
+                span.set_attribute("chunks", chunks)
+                if status is None and (self.result is None or self.result.is_error):
+                    status = tracing.SPAN_STATUS_ERROR
+                tracing.end_span(span, status)
+
+
+class FunctionCall(NamedTuple):
+    """execute_batch 中的一次调用，等价于 proxy(*args, **kwargs)"""
+
+    proxy: FunctionProxy
+    args: Tuple[Any, ...] = ()
+    kwargs: Optional[Dict[str, Any]] = None
+
+
+async def execute_batch(calls: Sequence[FunctionCall]) -> List[ToolResult]:
+    """
+    在一次请求中执行多个工具调用，省去逐个调用时每次 POST /execute 的请求与 JSON 信封开销
+    - 参数无法组装成请求的调用（如 mcp 调用缺少参数 dict）不发送，在对应位置返回错误结果
+    - 被 _intercept_request 拦截的调用不发送，直接返回拦截结果，与逐个调用一致
+    - 其余调用按 function server 地址分组，每组一个 POST /execute_batch，各组并发发送；
+      请求体为 {"batch_id": ..., "requests": [与 /execute 相同的请求, ...]}，
+      响应体为 {"results": [与 /execute 相同的响应, ...]}，与 requests 一一对应
+    - function server 不支持 /execute_batch（404 / 405）时回退为并发逐个调用 /execute
+    - 开启追踪时每组记录一个 function.batch span，trace_id 即 batch_id
+
+    Args:
+        calls: 调用列表
+
+    Returns:
+        List[ToolResult]: 与 calls 顺序一致的结果，每个调用单独报告错误，
+            整组请求失败（超时、连接错误、响应格式错误等）时该组每个调用都返回错误
+    """
+    results: List[Optional[ToolResult]] = [None] * len(calls)
+    groups: Dict[Tuple[str, str], List[Tuple[int, FunctionProxy, Dict[str, Any]]]] = {}
+    for i, call in enumerate(calls):
+        proxy = call.proxy
+        try:
+            request = proxy._build_request(*call.args, **(call.kwargs or {}))
+        except Exception as e:
+            results[i] = ToolResult(is_error=True, message=f"Invalid arguments for function {proxy.name}: {type(e).__name__}: {e}")
+            continue
+        tool_result = proxy._intercept_request(proxy.name, request)
+        if tool_result is not None:
+            results[i] = tool_result
+            continue
+        try:
+            server_url = proxy.get_server_url()
+        except Exception as e:
+            results[i] = ToolResult(is_error=True, message=f"Error: {str(e)}")
+            continue
+        groups.setdefault((proxy.socket_path, server_url), []).append((i, proxy, request))
+
+    async def run_group(socket_path: str, server_url: str, items: List[Tuple[int, FunctionProxy, Dict[str, Any]]]) -> None:
+        if len(items) == 1:
+            _, proxy, request = items[0]
+            group_results = [await proxy._execute(request)]
+        else:
+            group_results = await _execute_batch_group(socket_path, server_url, items)
+        for (i, _, _), tool_result in zip(items, group_results):
+            results[i] = tool_result
+
+    await asyncio.gather(*(run_group(socket_path, server_url, items) for (socket_path, server_url), items in groups.items()))
+    return cast(List[ToolResult], results)
+
+
+async def _execute_batch_group(
+    socket_path: str, server_url: str, items: List[Tuple[int, FunctionProxy, Dict[str, Any]]]
+) -> List[ToolResult]:
+    batch_id = str(uuid.uuid4())
+    with tracing.span(
+        "function.batch",
+        trace_id=batch_id,
+        batch_id=batch_id,
+        size=len(items),
+        request_ids=[request["request_id"] for _, _, request in items],
+    ) as span:
+        group_results = await _post_batch(socket_path, server_url, batch_id, items, span)
+        if span is not None:
+            errors = sum(1 for tool_result in group_results if tool_result.is_error)
+            span.set_attribute("errors", errors)
+            if errors == len(group_results):
+                span.status = tracing.SPAN_STATUS_ERROR
+        return group_results
+
+
+async def _post_batch(
+    socket_path: str,
+    server_url: str,
+    batch_id: str,
+    items: List[Tuple[int, FunctionProxy, Dict[str, Any]]],
+    span: Optional[tracing.Span],
+) -> List[ToolResult]:
+    timeout = aiohttp.ClientTimeout(total=max(proxy.timeout for _, proxy, _ in items))
+    session = get_function_session_pool(socket_path).get_session()
+    try:
+        start = time.perf_counter()
+        data = codec.dumps({"batch_id": batch_id, "requests": [request for _, _, request in items]})
+        if span is not None:
+            span.add_phase("encode", time.perf_counter() - start)
+            start = time.perf_counter()
+        async with session.post(
+            f"{server_url}/execute_batch",
+            data=data,
+            headers={"Content-Type": "application/json", tracing.TRACE_HEADER: batch_id},
+            timeout=timeout,
+        ) as response:
+            if response.status in (404, 405):
+                fallback = True
+            elif response.status != 200:
+                error_msg = f"Function call failed: {await response.text()}"
+                return [ToolResult(is_error=True, message=error_msg) for _ in items]
+            else:
+                fallback = False
+                body = await response.read()
+                if span is not None:
+                    span.add_phase("request", time.perf_counter() - start)
+                    start = time.perf_counter()
+                result = codec.loads(body)
+                if span is not None:
+                    span.add_phase("decode", time.perf_counter() - start)
+    except asyncio.TimeoutError:
+        return [ToolResult(is_error=True, message=f"Timeout when calling function {proxy.name}") for _, proxy, _ in items]
+    except Exception as e:
+        import traceback
+
+        error_msg = f"Error: {str(e)}\nTraceback:\n{traceback.format_exc()}"
+        return [ToolResult(is_error=True, message=error_msg) for _ in items]
+
+    if fallback:
+        if span is not None:
+            span.set_attribute("fallback", True)
+        return list(await asyncio.gather(*(proxy._execute(request) for _, proxy, request in items)))
+
+    item_results = result.get("results") if isinstance(result, dict) else None
+    if not isinstance(item_results, list) or len(item_results) != len(items):
+        error_msg = f"Invalid batch response: expected {len(items)} results"
+        return [ToolResult(is_error=True, message=error_msg) for _ in items]
+
+    group_results = []
+    for (_, proxy, request), item_result in zip(items, item_results):
+        if isinstance(item_result, dict):
+            group_results.append(proxy._parse_result(request, item_result))
+        else:
+            group_results.append(ToolResult(is_error=True, message=f"Invalid result for function {proxy.name}"))
+    return group_results
+
+
+class _FunctionListCacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    function_list: List[Any]
+    proxies: Dict[str, FunctionProxy]
+
+
+# 按绝对路径缓存的 function list
+_function_list_cache: Dict[str, _FunctionListCacheEntry] = {}
+_function_list_cache_lock = threading.Lock()
+
+
 def load_function_proxys(file_path: str) -> tuple[List[Dict[str, Any]], Dict[str, FunctionProxy]]:
-    # 加载 function_list.json 并创建 function proxies
-    with open(file_path, "r", encoding="utf-8") as f:
-        function_list = json.load(f)
+    """
+    加载 function list 并创建 FunctionProxy，结果按文件缓存:
+    - 文件的 mtime 与大小不变时直接返回缓存
+    - 变化时比较内容的 sha256，内容不变（如只是 touch）时不重新解析
+    - 内容变化时重新解析，未改变的函数复用原来的 FunctionProxy，只为新增或改变的函数创建新的
+
+    Args:
+        file_path: function list 文件路径
+
+    Returns:
+        tuple[List[Dict[str, Any]], Dict[str, FunctionProxy]]: (function list, {函数名: FunctionProxy})，
+            function list 是缓存的深拷贝、字典是新的容器，调用方可以修改；每个 FunctionProxy 持有自己的 function_info 副本
+    """
+    path = os.path.abspath(file_path)
+    with _function_list_cache_lock:
+        entry = _function_list_cache.get(path)
+        stat = os.stat(path)
+        if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+            with open(path, "rb") as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if entry is not None and entry.digest == digest:
+                entry = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            else:
+                function_list = codec.loads(data)
+                previous = entry.proxies if entry is not None else {}
+                # 与缓存中的函数定义比较，而不是与可能被调用方修改过的 proxy.function_info 比较
+                previous_infos = _function_infos(entry.function_list) if entry is not None else {}
+                proxies = {}
+                for name, function_info in _function_infos(function_list).items():
+                    proxy = previous.get(name)
+                    if proxy is None or previous_infos.get(name) != function_info:
+                        proxy = FunctionProxy(copy.deepcopy(function_info))
+                    proxies[name] = proxy
+                entry = _FunctionListCacheEntry(stat.st_mtime_ns, stat.st_size, digest, function_list, proxies)
+            _function_list_cache[path] = entry
+    # 缓存中的函数定义不与调用方共享，返回深拷贝
+    return copy.deepcopy(entry.function_list), dict(entry.proxies)
+
 
-    proxies = {}
-    for function_info in function_list:
-        if isinstance(function_info, dict) and "name" in function_info:
-            proxies[function_info["name"]] = FunctionProxy(function_info)
+def _function_infos(function_list: List[Any]) -> Dict[str, Dict[str, Any]]:
+    return {info["name"]: info for info in function_list if isinstance(info, dict) and "name" in info}
 
-    return function_list, proxies
+
+class FunctionListWatcher:
+    """
+    在后台线程中轮询 function list 文件，内容变化时通过 on_change 通知新增或改变的 FunctionProxy 与被删除的函数名，
+    长期运行的 agent 进程不必重启即可使用新的函数。on_change 在后台线程中调用
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        on_change: Callable[[Dict[str, FunctionProxy], List[str]], None],
+        interval: float = 2.0,
+    ):
+        self.file_path = file_path
+        self.on_change = on_change
+        self.interval = interval
+        self.reload_count = 0
+        _, self._proxies = load_function_proxys(file_path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> bool:
+        """
+        检查一次文件，有变化时调用 on_change
+
+        Returns:
+            bool: 函数是否有变化
+        """
+        _, proxies = load_function_proxys(self.file_path)
+        changed = {name: proxy for name, proxy in proxies.items() if self._proxies.get(name) is not proxy}
+        removed = [name for name in self._proxies if name not in proxies]
+        self._proxies = proxies
+        if not changed and not removed:
+            return False
+        self.reload_count += 1
+        self.on_change(changed, removed)
+        return True
+
+    def start(self) -> "FunctionListWatcher":
+        """开始轮询，stop() 之后可以再次调用"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="function-list-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                # 文件写到一半或被删除时跳过，下次轮询再试
+                logger.warning(f"Failed to reload function list {self.file_path}: {e}")
@@ -0,0 +1,103 @@
+import asyncio
+import inspect
+from typing import Any, Dict, Optional
+
+from external_api.data_sources import cache as cache_module
+from external_api.data_sources.base import BaseAPI
+from external_api.data_sources.cache import ResponseCache, cached, make_call_key
+
+
+class _Source(BaseAPI):
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.calls = 0
+        self.success = True
+
+    @property
+    def source_name(self) -> str:
+        return "test"
+
+    def get_api_info(self) -> Dict[str, Any]:
+        return {"name": "test", "description": ""}
+
+    @cached(ttl=60)
+    async def lookup(self, symbol: str, region: str = "US") -> Dict[str, Any]:
+        self.calls += 1
+        if not self.success:
+            return {"success": False, "error": "upstream error"}
+        return {"success": True, "data": {"symbol": symbol, "region": region}}
+
+
+def _source(maxsize: int = 16) -> _Source:
+    source = _Source()
+    source.bind_response_cache(ResponseCache(maxsize=maxsize))
+    return source
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(maxsize=4)
+    cache.set("key", {"value": 1}, ttl=10)
+
+    now[0] += 9.9
+    assert cache.get("m", "key") == (True, {"value": 1})
+    now[0] += 0.1
+    assert cache.get("m", "key") == (False, None)
+    assert cache.get_stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted_at_maxsize():
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("m", "a")  # a 变为最近使用
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("m", "b") == (False, None)
+    assert cache.get("m", "a") == (True, 1)
+    assert cache.get("m", "c") == (True, 3)
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_failed_results_are_not_cached():
+    source = _source()
+    source.success = False
+    assert asyncio.run(source.lookup("AAPL"))["success"] is False
+    assert asyncio.run(source.lookup("AAPL"))["success"] is False
+    assert source.calls == 2
+
+    source.success = True
+    assert asyncio.run(source.lookup("AAPL"))["success"] is True
+    assert asyncio.run(source.lookup("AAPL"))["success"] is True
+    assert source.calls == 3
+
+
+def test_positional_keyword_and_default_arguments_share_a_key():
+    source = _source()
+    asyncio.run(source.lookup("AAPL"))
+    asyncio.run(source.lookup(symbol="AAPL"))
+    asyncio.run(source.lookup("AAPL", "US"))
+    asyncio.run(source.lookup(region="US", symbol="AAPL"))
+    assert source.calls == 1
+
+    asyncio.run(source.lookup("AAPL", region="HK"))
+    assert source.calls == 2
+
+
+def test_unserialisable_arguments_are_not_keyed():
+    async def fn(value: Any, option: int = 1) -> None:
+        pass
+
+    signature = inspect.signature(fn)
+    assert make_call_key("test.fn", signature, ({"b": 1, "a": [1, 2]},), {}) == make_call_key(
+        "test.fn", signature, (), {"value": {"a": [1, 2], "b": 1}, "option": 1}
+    )
+    assert make_call_key("test.fn", signature, (object(),), {}) is None
+    assert make_call_key("test.fn", signature, ({1, 2},), {}) is None
+    assert make_call_key("test.fn", signature, (), {"unknown": 1}) is None
+
+    source = _source()
+    asyncio.run(source.lookup(object()))
+    asyncio.run(source.lookup(object()))
+    assert source.calls == 2
+    assert source._get_response_cache().get_stats()["size"] == 0
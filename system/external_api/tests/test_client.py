@@ -0,0 +1,39 @@
+import pytest
+
+from external_api.data_sources import client as client_module
+from external_api.data_sources.base import BaseAPI
+from external_api.data_sources.twitter_source import TwitterSource
+
+
+@pytest.fixture
+def client():
+    # 独立于 get_client() 单例的 ApiClient，不影响其他测试
+    client = object.__new__(client_module.ApiClient)
+    client.__init__()
+    return client
+
+
+def test_source_proxy_is_transparent_to_isinstance(client):
+    proxy = client.twitter
+    assert isinstance(proxy, TwitterSource)
+    assert isinstance(proxy, BaseAPI)
+    assert proxy.__class__ is TwitterSource
+    assert type(proxy) is client_module._SourceProxy
+
+
+def test_source_proxy_reads_and_writes_source_attributes(client):
+    proxy = client.twitter
+    source = client._get_source("twitter")
+    assert proxy.source_name == "twitter"
+    assert proxy.headers is source.headers
+    assert "search_tweets" in dir(proxy)
+
+    proxy.proxy_url = "http://other-proxy"
+    assert source.proxy_url == "http://other-proxy"
+    assert proxy.proxy_url == "http://other-proxy"
+
+
+def test_source_proxy_still_dispatches_coroutine_methods(client):
+    proxy = client.twitter
+    assert proxy.search_tweets is proxy.search_tweets
+    assert proxy.search_tweets.__wrapped__ == client._get_source("twitter").search_tweets
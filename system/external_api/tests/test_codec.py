@@ -0,0 +1,32 @@
+import math
+
+import pytest
+
+from external_api.data_sources import codec
+from external_api.data_sources.codec import CODEC_JSON, CODEC_MSGSPEC, CODEC_NAME, CODEC_ORJSON, get_codec
+
+NON_FINITE = [float("nan"), float("inf"), float("-inf")]
+
+
+def test_json_encodes_non_finite_floats_as_literals():
+    _, dumps = get_codec(CODEC_JSON)
+    assert dumps(NON_FINITE) == b"[NaN,Infinity,-Infinity]"
+
+
+@pytest.mark.parametrize("name", [CODEC_ORJSON, CODEC_MSGSPEC])
+def test_fast_backends_encode_non_finite_floats_as_null(name):
+    try:
+        _, dumps = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    assert dumps(NON_FINITE) == b"[null,null,null]"
+
+
+def test_dumps_non_finite_floats_follow_active_backend():
+    expected = b"[NaN,Infinity,-Infinity]" if CODEC_NAME == CODEC_JSON else b"[null,null,null]"
+    assert codec.dumps(NON_FINITE) == expected
+
+
+def test_loads_non_finite_literals_falls_back_to_json():
+    nan, inf, ninf = codec.loads(b"[NaN,Infinity,-Infinity]")
+    assert math.isnan(nan) and inf == math.inf and ninf == -math.inf
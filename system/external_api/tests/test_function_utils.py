@@ -0,0 +1,93 @@
+import asyncio
+import json
+import time
+
+from external_api.benchmarks.function_batch_bench import MockFunctionServer
+from external_api.function_utils import (
+    FunctionCall,
+    FunctionListWatcher,
+    FunctionProxy,
+    close_function_session_pools,
+    execute_batch,
+    load_function_proxys,
+)
+
+
+def test_execute_batch_reports_bad_calls_per_item():
+    async def main():
+        server = MockFunctionServer()
+        port = await server.start()
+        try:
+            proxy = FunctionProxy({"name": "read_file", "parameters": [{"name": "path"}]})
+            proxy.server_port = port
+            mcp = FunctionProxy({"name": "mcp_tool", "kind": "mcp", "parameters": []})
+            mcp.server_port = port
+            results = await execute_batch(
+                [
+                    FunctionCall(proxy, ("/tmp/a.txt",)),
+                    FunctionCall(mcp),  # mcp 调用缺少参数 dict
+                    FunctionCall(proxy, kwargs={"path": "/tmp/b.txt"}),
+                ]
+            )
+            return results, server.request_count
+        finally:
+            await close_function_session_pools()
+            await server.stop()
+
+    results, request_count = asyncio.run(main())
+    assert [r.is_error for r in results] == [False, True, False]
+    assert results[0].message == '{"path": "/tmp/a.txt"}'
+    assert "mcp_tool" in results[1].message and "IndexError" in results[1].message
+    assert results[2].message == '{"path": "/tmp/b.txt"}'
+    assert request_count == 1
+
+
+def _write_function_list(path, names):
+    with open(path, "w") as f:
+        json.dump([{"name": name, "parameters": []} for name in names], f)
+
+
+def test_function_list_watcher_restarts_after_stop(tmp_path):
+    path = str(tmp_path / "function_list.json")
+    _write_function_list(path, ["a"])
+    changes = []
+    watcher = FunctionListWatcher(path, lambda changed, removed: changes.append((sorted(changed), removed)), interval=0.01)
+
+    watcher.start()
+    watcher.stop()
+    watcher.start()
+    try:
+        assert watcher._thread is not None and watcher._thread.is_alive()
+        _write_function_list(path, ["a", "b"])
+        deadline = time.monotonic() + 5
+        while not changes and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+    assert changes == [(["b"], [])]
+
+
+def test_load_function_proxys_does_not_share_cached_definitions(tmp_path):
+    path = tmp_path / "functions.json"
+    path.write_text(json.dumps([{"name": "read_file", "parameters": [{"name": "path"}]}]))
+
+    function_list, proxies = load_function_proxys(str(path))
+    function_list[0]["parameters"].append({"name": "mode"})
+    proxies["read_file"].function_info["description"] = "changed"
+
+    function_list, reloaded = load_function_proxys(str(path))
+    assert function_list == [{"name": "read_file", "parameters": [{"name": "path"}]}]
+    assert reloaded["read_file"] is proxies["read_file"]
+
+
+def test_removed_functions_only_drop_installed_proxies():
+    import external_api
+
+    proxy = FunctionProxy({"name": "tmp_tool", "parameters": []})
+    external_api._apply_function_list_change({"tmp_tool": proxy}, [])
+    assert external_api.tmp_tool is proxy
+
+    external_api._apply_function_list_change({}, ["tmp_tool", "execute_batch"])
+    assert not hasattr(external_api, "tmp_tool")
+    assert external_api.execute_batch is execute_batch
+    assert "tmp_tool" not in external_api.__all__
@@ -0,0 +1,100 @@
+import asyncio
+from typing import List
+
+import aiohttp
+import pytest
+
+from external_api.benchmarks.mock_proxy import Fault, MockProxy
+from external_api.data_sources.hedging import HedgePolicy, Hedger
+
+FAST_HOST = "fast.example.com"
+SLOW_HOST = "slow.example.com"
+JITTER_HOST = "jitter.example.com"
+
+
+@pytest.fixture(scope="module")
+def proxy_url():
+    proxy = MockProxy(
+        faults={
+            FAST_HOST: Fault(latency=0.005),
+            SLOW_HOST: Fault(latency=0.1),
+            JITTER_HOST: Fault(latency=0.02, jitter=0.06),
+        },
+        seed=1,
+    )
+    url, _ = proxy.start_in_thread()
+    return url
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str, host: str, cancelled: List[str]) -> str:
+    try:
+        async with session.get(url, headers={"X-Original-Host": host}) as response:
+            await response.read()
+            return host
+    except asyncio.CancelledError:
+        cancelled.append(host)
+        raise
+
+
+def test_hedge_delay_is_the_configured_percentile(proxy_url):
+    async def main():
+        hedger = Hedger(HedgePolicy(percentile=0.9, min_delay=0.001, min_samples=20))
+        async with aiohttp.ClientSession() as session:
+            for _ in range(20):
+                assert hedger.get_stats().get("jitter", {}).get("delay") is None
+                await hedger.run("jitter", lambda: _fetch(session, proxy_url, JITTER_HOST, []))
+
+        samples = sorted(hedger._states["jitter"].latencies)
+        stats = hedger.get_stats()["jitter"]
+        assert stats["delay"] == samples[18]
+        assert 0.02 <= stats["delay"] < 0.5
+        assert stats["hedged"] == 0
+
+        # 分位耗时限制在 [min_delay, max_delay]
+        clamped = Hedger(HedgePolicy(min_delay=0.05, max_delay=0.08, min_samples=1))
+        clamped._get_state("fast").latencies.extend([0.001] * 10)
+        clamped._get_state("slow").latencies.extend([1.0] * 10)
+        assert clamped.get_stats()["fast"]["delay"] == 0.05
+        assert clamped.get_stats()["slow"]["delay"] == 0.08
+
+    asyncio.run(main())
+
+
+def test_hedges_stay_within_budget_ratio(proxy_url):
+    async def main():
+        hedger = Hedger(HedgePolicy(percentile=0.5, min_delay=0.01, min_samples=20, budget_ratio=0.25, budget_burst=100))
+        async with aiohttp.ClientSession() as session:
+            # 20 个快请求确定对冲延迟并积累 5 个对冲预算
+            for _ in range(20):
+                await hedger.run("search", lambda: _fetch(session, proxy_url, FAST_HOST, []))
+            # 之后的慢请求都超过对冲延迟，但对冲数受预算限制
+            for _ in range(12):
+                await hedger.run("search", lambda: _fetch(session, proxy_url, SLOW_HOST, []))
+
+        stats = hedger.get_stats()["search"]
+        assert stats["requests"] == 32
+        assert stats["hedged"] == 8
+        assert stats["skipped"] == 4
+        assert stats["hedged"] <= 0.25 * stats["requests"]
+
+    asyncio.run(main())
+
+
+def test_losing_request_is_cancelled(proxy_url):
+    async def main():
+        hedger = Hedger(HedgePolicy(min_delay=0.02, min_samples=1, budget_ratio=1.0))
+        cancelled: List[str] = []
+        async with aiohttp.ClientSession() as session:
+            await hedger.run("search", lambda: _fetch(session, proxy_url, FAST_HOST, []))
+
+            # 首发请求发往慢 host，对冲请求发往快 host
+            hosts = iter([SLOW_HOST, FAST_HOST])
+            winner = await hedger.run("search", lambda: _fetch(session, proxy_url, next(hosts), cancelled))
+            await asyncio.sleep(0)
+
+        assert winner == FAST_HOST
+        assert cancelled == [SLOW_HOST]
+        stats = hedger.get_stats()["search"]
+        assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import os
+from typing import Any, Dict
+
+import pytest
+
+from external_api.data_sources import client as client_module
+from external_api.data_sources.booking_source import BookingSource
+from external_api.data_sources.cache import ResponseCache
+from external_api.data_sources.models import OUTPUT_FORMAT_MODELS
+from external_api.data_sources.pinterest_source import PinterestSource
+from external_api.data_sources.scholar_source import ScholarSource
+from external_api.data_sources.transport import HttpResponse, Transport
+from external_api.data_sources.twitter_source import TwitterSource
+
+# 引入解析模型之前的代码对下面的上游响应生成的 records 输出，键名、键顺序与可选键都必须保持一致
+LEGACY_RECORDS_FILE = os.path.join(os.path.dirname(__file__), "data", "legacy_records.json")
+
+USER = {
+    "user_id": "44196397", "username": "elonmusk", "name": "Elon Musk",
+    "creation_date": "Tue Jun 02 20:12:29 +0000 2009", "description": "", "location": "",
+    "external_url": None, "profile_pic_url": "https://pbs.twimg.com/p.jpg", "profile_banner_url": None,
+    "follower_count": 100, "following_count": 7, "number_of_tweets": 40, "listed_count": 1,
+    "favourites_count": 5, "is_verified": False, "is_blue_verified": True, "is_private": False, "bot": False,
+}
+
+
+def _tweet(tweet_id, **extra):
+    return {
+        "tweet_id": tweet_id, "creation_date": "Thu Mar 13 18:08:35 +0000 2025", "text": f"tweet {tweet_id}",
+        "language": "en", "media_url": ["https://pbs.twimg.com/m.jpg"], "video_url": None,
+        "retweet_count": 1, "reply_count": 2, "favorite_count": 3, "quote_count": 4, "views": 5,
+        "bookmark_count": 6, "user": USER, **extra,
+    }
+
+
+USER_TWEETS = {
+    "results": [
+        _tweet("1"),
+        _tweet("2", in_reply_to_status_id=1),
+        _tweet("3", retweet_tweet_id="30", retweet_status=_tweet("30", quoted_status=_tweet("31"))),
+        _tweet("4", quoted_status_id="40", quoted_status=_tweet("40")),
+    ],
+    "continuation_token": "next",
+}
+
+PINS = {
+    "data": [
+        {
+            "id": "1", "title": "Room", "description": "", "alt_text": "", "auto_alt_text": "a room",
+            "images": {"orig": {"url": "https://i.pinimg.com/1.jpg"}}, "reaction_counts": {"1": 42},
+            "pinner": {"id": "9", "image_large_url": "https://i.pinimg.com/9.jpg", "follower_count": 12, "username": "u", "full_name": "U"},
+        },
+        {
+            "id": "2", "title": "Video", "images": {"original": {"url": "https://i.pinimg.com/2.jpg"}},
+            "videos": {"video_list": {"V_HLSV4": {"url": "https://v.pinimg.com/2.m3u8", "duration": 3000}, "V_720P": {"url": "https://v.pinimg.com/2.mp4"}}},
+            "pinner": {},
+        },
+    ],
+    "nextPageCursor": "next",
+}
+
+HOTEL = {
+    "status": True,
+    "message": "Success",
+    "data": {
+        "hotel_id": 1377073,
+        "hotel_name": "Hotel Sample",
+        "review_nr": 1532,
+        "facilities_block": {"facilities": [{"name": "Free WiFi"}, {"name": "Parking"}]},
+        "hotel_important_information_with_codes": [{"phrase": "Check-in from 15:00"}],
+        "rooms": {
+            "137707301": {
+                "photos": [{"url_max1280": "https://cf.bstatic.com/1.jpg"}],
+                "description": "Double room",
+                "bed_configurations": [{"bed_types": [{"name_with_count": "1 large double bed", "description": "Large double bed"}]}],
+            }
+        },
+    },
+}
+
+SCHOLAR = {"organic": [{"title": "Paper", "link": "https://example.org/1", "publicationInfo": "A - J, 2024", "year": 2024, "citedBy": 3, "id": "x"}, {"title": "Other"}]}
+
+
+class _PayloadTransport(Transport):
+    def __init__(self, payload: Dict[str, Any]):
+        self.body = json.dumps(payload).encode()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        return HttpResponse(method, url, 200, "OK", {}, self.body)
+
+    async def close(self) -> None:
+        pass
+
+    async def close_current_loop(self) -> None:
+        pass
+
+
+def _source(cls: type, payload: Dict[str, Any]) -> Any:
+    source = cls(client_module.config)
+    source.bind_transport(_PayloadTransport(payload))
+    source.bind_response_cache(ResponseCache(maxsize=0))
+    return source
+
+
+CALLS = {
+    "user_tweets": (TwitterSource, USER_TWEETS, "get_user_tweets", ("elonmusk",), {}, "tweets"),
+    "pins": (PinterestSource, PINS, "search_pins", ("room",), {"num": 2}, "pins"),
+    "hotel": (BookingSource, HOTEL, "search_hotel_details", ("1377073", "2025-06-01", "2025-06-02"), {}, None),
+    "scholar": (ScholarSource, SCHOLAR, "search_scholar", ("ml",), {"num_results": 2}, "papers"),
+}
+
+
+@pytest.fixture(scope="module")
+def legacy_records() -> Dict[str, Any]:
+    with open(LEGACY_RECORDS_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _call(name: str, **kwargs: Any) -> Dict[str, Any]:
+    cls, payload, method, args, call_kwargs, _ = CALLS[name]
+    return asyncio.run(getattr(_source(cls, payload), method)(*args, **call_kwargs, **kwargs))
+
+
+@pytest.mark.parametrize("name", list(CALLS))
+def test_records_match_legacy_output(name, legacy_records):
+    # 比较序列化结果，键顺序不同也视为不一致
+    assert json.dumps(_call(name)) == json.dumps(legacy_records[name])
+
+
+def test_booking_hotel_details_keep_the_double_wrap():
+    result = _call("hotel")
+    assert list(result) == ["success", "data"]
+    assert list(result["data"]) == ["success", "data"]
+    assert result["data"]["success"] is True
+    assert result["data"]["data"]["hotel_name"] == "Hotel Sample"
+
+
+@pytest.mark.parametrize("name", list(CALLS))
+def test_models_to_dict_round_trips_to_records(name, legacy_records):
+    result = _call(name, output_format=OUTPUT_FORMAT_MODELS)
+    key = CALLS[name][-1]
+    if key is None:
+        models = result["data"]["data"]
+        assert json.dumps(models.to_dict()) == json.dumps(legacy_records[name]["data"]["data"])
+    else:
+        models = result["data"][key]
+        assert json.dumps([model.to_dict() for model in models]) == json.dumps(legacy_records[name]["data"][key])
@@ -0,0 +1,138 @@
+import asyncio
+import types
+from typing import List, Tuple
+
+import pytest
+
+from external_api.data_sources import ratelimit
+from external_api.data_sources.ratelimit import RateLimit, RateLimiter, TokenBucket
+
+
+class _FakeClock:
+    """替换 ratelimit 模块的 time.monotonic 与 asyncio.sleep，时间只在 advance 时前进"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: List[float] = []
+        self._timers: List[Tuple[float, asyncio.Future]] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        future = asyncio.get_running_loop().create_future()
+        self._timers.append((self.now + delay, future))
+        await future
+
+    async def advance(self, seconds: float) -> None:
+        self.now += seconds
+        for deadline, future in list(self._timers):
+            if deadline <= self.now and not future.done():
+                future.set_result(None)
+        self._timers = [(deadline, future) for deadline, future in self._timers if not future.done()]
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(ratelimit, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(ratelimit, "asyncio", types.SimpleNamespace(sleep=clock.sleep, CancelledError=asyncio.CancelledError))
+    return clock
+
+
+async def _pending(coro) -> asyncio.Task:
+    task = asyncio.ensure_future(coro)
+    await asyncio.sleep(0)
+    assert not task.done()
+    return task
+
+
+def test_burst_capacity_then_rate(clock):
+    async def main():
+        bucket = TokenBucket(rate=2, burst=3)
+        assert [await bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+        fourth = await _pending(bucket.acquire())
+        fifth = await _pending(bucket.acquire())
+        assert clock.sleeps == [0.5, 1.0]
+        assert bucket.get_stats()["queue_depth"] == 2
+
+        await clock.advance(0.5)
+        assert fourth.result() == 0.5
+        assert not fifth.done()
+        await clock.advance(0.5)
+        assert fifth.result() == 1.0
+
+        # 空闲足够久后桶重新装满
+        await clock.advance(10)
+        assert [await bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    asyncio.run(main())
+
+
+def test_cancelled_last_waiter_returns_its_reservation(clock):
+    async def main():
+        bucket = TokenBucket(rate=1, burst=1)
+        assert await bucket.acquire() == 0.0
+        waiter = await _pending(bucket.acquire())
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert bucket.get_stats()["queue_depth"] == 0
+
+        # 取消的预约已归还，下一个调用等待 1 秒而不是 2 秒
+        await _pending(bucket.acquire())
+        assert clock.sleeps == [1.0, 1.0]
+
+    asyncio.run(main())
+
+
+def test_cancelled_middle_waiter_keeps_later_reservations(clock):
+    async def main():
+        bucket = TokenBucket(rate=1, burst=1)
+        await bucket.acquire()
+        second = await _pending(bucket.acquire())
+        third = await _pending(bucket.acquire())
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+
+        # second 不是最后一个预约，不归还令牌，否则后来者会插到 third 之前
+        await _pending(bucket.acquire())
+        assert clock.sleeps == [1.0, 2.0, 3.0]
+        await clock.advance(2.0)
+        assert third.result() == 2.0
+
+    asyncio.run(main())
+
+
+def test_hosts_are_limited_independently(clock):
+    async def main():
+        limiter = RateLimiter({"slow.example.com": RateLimit(1, 1)}, default=(10, 2))
+        assert await limiter.acquire("slow.example.com") == 0.0
+        slow = await _pending(limiter.acquire("slow.example.com"))
+
+        # 其他 host 使用各自的令牌桶，不受 slow.example.com 排队影响
+        assert await limiter.acquire("a.example.com") == 0.0
+        assert await limiter.acquire("a.example.com") == 0.0
+        assert await limiter.acquire("b.example.com") == 0.0
+
+        stats = limiter.get_stats()
+        assert set(stats) == {"slow.example.com", "a.example.com", "b.example.com"}
+        assert stats["slow.example.com"]["queue_depth"] == 1
+        assert stats["a.example.com"]["rate"] == 10 and stats["a.example.com"]["acquired"] == 2
+        await clock.advance(1.0)
+        assert slow.result() == 1.0
+
+    asyncio.run(main())
+
+
+def test_hosts_without_limit_are_not_throttled(clock):
+    async def main():
+        limiter = RateLimiter({"slow.example.com": (1, 1)})
+        assert [await limiter.acquire("other.example.com") for _ in range(5)] == [0.0] * 5
+        assert limiter.get_stats() == {}
+        assert clock.sleeps == []
+
+    asyncio.run(main())
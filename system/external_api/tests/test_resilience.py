@@ -0,0 +1,181 @@
+import asyncio
+import email.utils
+import time
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import pytest
+
+from external_api.data_sources import resilience
+from external_api.data_sources.base import BaseAPI
+from external_api.data_sources.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    parse_retry_after,
+)
+from external_api.data_sources.transport import HttpResponse, Transport
+
+
+class _FakeTransport(Transport):
+    """按顺序返回预设的状态码，或抛出预设的异常，并记录每次请求的 timeout"""
+
+    def __init__(self, outcomes: List[Any]):
+        self.outcomes = list(outcomes)
+        self.calls: List[Dict[str, Any]] = []
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        self.calls.append({"method": method, "timeout": kwargs.get("timeout")})
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if isinstance(outcome, HttpResponse):
+            return outcome
+        return HttpResponse(method, url, outcome, "", {}, b"{}")
+
+    async def close(self) -> None:
+        pass
+
+    async def close_current_loop(self) -> None:
+        pass
+
+
+class _Source(BaseAPI):
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        pass
+
+    @property
+    def source_name(self) -> str:
+        return "test"
+
+    def get_api_info(self) -> Dict[str, Any]:
+        return {"name": "test", "description": ""}
+
+
+def _source(outcomes: List[Any], policy: Optional[RetryPolicy], breaker: Optional[CircuitBreaker] = None) -> _Source:
+    source = _Source()
+    source.bind_transport(_FakeTransport(outcomes))
+    source.bind_resilience(policy, breaker)
+    return source
+
+
+NO_DELAY = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0)
+
+
+def test_should_retry_only_idempotent_methods():
+    policy = RetryPolicy()
+    assert policy.should_retry("GET")
+    assert policy.should_retry("get")
+    assert not policy.should_retry("POST")
+    assert not RetryPolicy(max_attempts=1).should_retry("GET")
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("-1") == 0.0
+    retry_at = email.utils.formatdate(time.time() + 10, usegmt=True)
+    assert 8.0 <= parse_retry_after(retry_at) <= 10.0
+    past = email.utils.formatdate(time.time() - 60, usegmt=True)
+    assert parse_retry_after(past) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_circuit_breaker_transitions(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=30.0)
+
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_CLOSED
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    now[0] += 30.0
+    breaker.before_request()
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    # 探测请求进行中时拒绝其他请求
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    # 探测失败重新打开
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+
+    now[0] += 30.0
+    breaker.before_request()
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.get_stats() == {"state": CIRCUIT_CLOSED, "failures": 0, "opened": 2, "rejected": 2}
+
+
+def test_post_is_never_retried():
+    source = _source([503, 200], NO_DELAY)
+    response = asyncio.run(source._request("POST", "http://upstream/", json={"a": 1}))
+    assert response.status == 503
+    assert len(source._transport.calls) == 1
+
+
+def test_get_is_retried_on_errors_and_retry_statuses():
+    source = _source([aiohttp.ClientConnectionError("reset"), 503, 200], NO_DELAY)
+    response = asyncio.run(source._request("GET", "http://upstream/"))
+    assert response.status == 200
+    assert len(source._transport.calls) == 3
+
+
+def test_total_timeout_caps_later_attempts(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    class SlowTransport(_FakeTransport):
+        async def request(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+            now[0] += 4.0  # 每次尝试耗时 4 秒
+            return await super().request(method, url, **kwargs)
+
+    source = _source([], RetryPolicy(max_attempts=5, base_delay=0.0, max_delay=0.0, total_timeout=10.0))
+    source.bind_transport(SlowTransport([503, 503, 503, 503, 200]))
+    response = asyncio.run(source._request("GET", "http://upstream/", timeout=6.0))
+
+    # 第三次尝试结束时已经用完 12 秒 > 10 秒，不再重试
+    assert response.status == 503
+    assert [call["timeout"] for call in source._transport.calls] == [6.0, 6.0, 2.0]
+
+
+def test_total_timeout_skips_retry_when_wait_exceeds_budget():
+    retry_later = HttpResponse("GET", "http://upstream/", 503, "", {"Retry-After": "5"}, b"")
+    source = _source([retry_later, 200], RetryPolicy(max_attempts=3, total_timeout=1.0))
+    response = asyncio.run(source._request("GET", "http://upstream/"))
+    assert response is retry_later
+    assert len(source._transport.calls) == 1
+
+
+def test_breaker_counts_one_failure_per_call():
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=30.0)
+    source = _source([503, 503, 503], NO_DELAY, breaker)
+    assert asyncio.run(source._request("GET", "http://upstream/")).status == 503
+    assert len(source._transport.calls) == 3
+    assert breaker.failures == 1
+    assert breaker.state == CIRCUIT_CLOSED
+
+    source._transport.outcomes = [aiohttp.ClientConnectionError("reset")] * 3
+    with pytest.raises(aiohttp.ClientConnectionError):
+        asyncio.run(source._request("GET", "http://upstream/"))
+    assert breaker.failures == 2
+    assert breaker.state == CIRCUIT_OPEN
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(source._request("GET", "http://upstream/"))
+    assert len(source._transport.calls) == 6
+
+
+def test_breaker_records_success_after_retries():
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=30.0)
+    breaker.record_failure()
+    source = _source([503, 200], NO_DELAY, breaker)
+    assert asyncio.run(source._request("GET", "http://upstream/")).status == 200
+    assert breaker.failures == 0
@@ -0,0 +1,70 @@
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple, Union
+
+from external_api.data_sources.schema import annotation_to_schema, method_to_tool_schema
+
+
+def test_primitive_and_unannotated():
+    assert annotation_to_schema(str) == {"type": "string"}
+    assert annotation_to_schema(bool) == {"type": "boolean"}
+    assert annotation_to_schema(Any) == {}
+
+
+def test_optional_and_union():
+    assert annotation_to_schema(Optional[str]) == {"anyOf": [{"type": "string"}, {"type": "null"}]}
+    assert annotation_to_schema(Optional[List[int]]) == {
+        "anyOf": [{"type": "array", "items": {"type": "integer"}}, {"type": "null"}]
+    }
+    assert annotation_to_schema(Union[int, str]) == {"anyOf": [{"type": "integer"}, {"type": "string"}]}
+
+
+def test_list_tuple_and_dict():
+    assert annotation_to_schema(list) == {"type": "array"}
+    assert annotation_to_schema(List[Dict[str, Any]]) == {"type": "array", "items": {"type": "object"}}
+    assert annotation_to_schema(Tuple[int, ...]) == {"type": "array", "items": {"type": "integer"}}
+    assert annotation_to_schema(Tuple[int, str]) == {
+        "type": "array",
+        "prefixItems": [{"type": "integer"}, {"type": "string"}],
+        "items": False,
+    }
+    assert annotation_to_schema(Dict[str, float]) == {"type": "object", "additionalProperties": {"type": "number"}}
+
+
+def test_literal():
+    assert annotation_to_schema(Literal["records", "models"]) == {"enum": ["records", "models"]}
+    assert annotation_to_schema(Optional[Literal[1, 2]]) == {"anyOf": [{"enum": [1, 2]}, {"type": "null"}]}
+
+
+def test_async_iterator_is_an_array_of_items():
+    assert annotation_to_schema(AsyncIterator[Dict[str, Any]]) == {"type": "array", "items": {"type": "object"}}
+
+
+class _Source:
+    async def iter_items(self, query: str, limit: Optional[int] = None, order: Literal["asc", "desc"] = "asc") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over items.
+
+        Args:
+            query(str): Search keyword
+            limit(Optional[int]): Maximum number of items
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: Items
+        """
+        yield {}
+
+
+def test_async_generator_method_is_a_streaming_tool():
+    tool = method_to_tool_schema("test", "iter_items", _Source.iter_items, _Source.iter_items.__doc__)
+    assert tool["name"] == "test.iter_items"
+    assert tool["description"] == "Iterate over items."
+    assert tool["streaming"] is True
+    assert tool["parameters"] == {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "Search keyword"},
+            "limit": {"anyOf": [{"type": "integer"}, {"type": "null"}], "description": "Maximum number of items", "default": None},
+            "order": {"enum": ["asc", "desc"], "default": "asc"},
+        },
+        "required": ["query"],
+    }
+    assert tool["returns"] == {"type": "array", "items": {"type": "object"}, "description": "Items"}
@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from external_api.data_sources.models import ScholarPaper
+from external_api.data_sources.scholar_source import MAX_PAGE_SIZE, MAX_RESULTS, ScholarSource
+
+CONFIG = {"timeout": 10, "external_api_proxy_url": "http://proxy", "serper_base_url": "serper"}
+
+
+async def _collect(aiter: Any) -> List[Any]:
+    return [item async for item in aiter]
+
+
+def _scholar_source(results: Dict[int, Any], requested: List[int]) -> ScholarSource:
+    source = ScholarSource(CONFIG)
+
+    async def fetch_page(query: str, page_size: int, page: int, **kwargs: Any) -> Dict[str, Any]:
+        requested.append(page)
+        await asyncio.sleep(0)
+        result = results.get(page, page_size)
+        if isinstance(result, int):
+            papers = [ScholarPaper(f"p{page}-{i}", None, None, None, None, None, None) for i in range(result)]
+            return {"success": True, "data": papers}
+        return result
+
+    source._fetch_scholar_page = fetch_page  # type: ignore[method-assign]
+    return source
+
+
+def test_plan_pages_clamps_to_max_results():
+    assert ScholarSource._plan_pages(45) == [(1, 20), (2, 20), (3, 5)]
+    assert ScholarSource._plan_pages(7) == [(1, 7)]
+    assert ScholarSource._plan_pages(0) == []
+
+    pages = ScholarSource._plan_pages(MAX_RESULTS * 3)
+    assert sum(size for _, size in pages) == MAX_RESULTS
+    assert len(pages) == MAX_RESULTS // MAX_PAGE_SIZE
+
+
+def test_iter_scholar_stops_after_short_page():
+    requested: List[int] = []
+    source = _scholar_source({2: 3}, requested)
+    papers = asyncio.run(_collect(source.iter_scholar("ml", num_results=100, max_concurrency=2)))
+
+    assert len(papers) == 23
+    assert papers[0]["title"] == "p1-0" and papers[-1]["title"] == "p2-2"
+    # 同时最多请求 2 页: 第 3 页在第 1 页返回后才排入（第 2 页不满后被取消，可能尚未发出），之后的页面不再请求
+    assert requested[:2] == [1, 2]
+    assert set(requested) <= {1, 2, 3}
+
+
+def test_iter_scholar_raises_on_failed_page_after_earlier_pages():
+    requested: List[int] = []
+    source = _scholar_source({2: {"success": False, "error": "timeout"}}, requested)
+    yielded: List[str] = []
+
+    async def main():
+        async for paper in source.iter_scholar("ml", num_results=60):
+            yielded.append(paper["title"])
+
+    with pytest.raises(RuntimeError, match="Scholar page 2 failed: timeout"):
+        asyncio.run(main())
+    assert len(yielded) == 20
+
+
+def test_search_scholar_returns_partial_results_when_a_page_fails():
+    source = _scholar_source({2: {"success": False, "error": "timeout"}}, [])
+    result = asyncio.run(source.search_scholar("ml", num_results=60))
+    assert result["success"]
+    assert len(result["data"]["papers"]) == 40
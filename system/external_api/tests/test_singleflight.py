@@ -0,0 +1,69 @@
+import asyncio
+
+from external_api.data_sources.singleflight import SingleFlight
+
+
+def _fetch(calls):
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"items": [1, 2, 3]}
+
+    return fn
+
+
+def test_leader_mutation_does_not_leak_to_waiters():
+    async def main():
+        sf = SingleFlight()
+        calls = []
+
+        async def leader():
+            result = await sf.do("key", _fetch(calls))
+            result["items"].clear()
+            return result
+
+        leader_task = asyncio.create_task(leader())
+        await asyncio.sleep(0)
+        follower = await sf.do("key", _fetch(calls))
+        return calls, await leader_task, follower, sf.shared
+
+    calls, leader_result, follower_result, shared = asyncio.run(main())
+    assert len(calls) == 1
+    assert shared == 1
+    assert leader_result == {"items": []}
+    assert follower_result == {"items": [1, 2, 3]}
+
+
+def test_waiter_mutation_does_not_leak_to_leader():
+    async def main():
+        sf = SingleFlight()
+        calls = []
+
+        async def follower():
+            await asyncio.sleep(0)
+            result = await sf.do("key", _fetch(calls))
+            result["items"].append(4)
+            return result
+
+        follower_task = asyncio.create_task(follower())
+        leader = await sf.do("key", _fetch(calls))
+        return leader, await follower_task
+
+    leader_result, follower_result = asyncio.run(main())
+    assert leader_result == {"items": [1, 2, 3]}
+    assert follower_result == {"items": [1, 2, 3, 4]}
+
+
+def test_uncontended_call_returns_result_without_copy():
+    async def main():
+        sf = SingleFlight()
+        value = {"items": []}
+
+        async def fn():
+            return value
+
+        return value, await sf.do("key", fn), sf.in_flight
+
+    value, result, in_flight = asyncio.run(main())
+    assert result is value
+    assert in_flight == 0
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from external_api.benchmarks.mock_proxy import MockProxy
+from external_api.data_sources import client as client_module
+from external_api.data_sources.sync import BackgroundLoop, SyncApiClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    proxy_url, _ = MockProxy().start_in_thread()
+    monkeypatch.setitem(client_module.config, "external_api_proxy_url", proxy_url)
+    # 独立于 get_client() 单例的 ApiClient，不影响其他测试
+    client = object.__new__(client_module.ApiClient)
+    client.__init__()
+    return client
+
+
+def test_sync_close_keeps_other_loops_connections(client):
+    sessions = client._transport.session_pool._sessions
+
+    # 另一个事件循环上的异步调用方
+    async_loop = BackgroundLoop(name="async-caller")
+    try:
+        assert async_loop.run(client.commodities.get_supported_commodities())["success"]
+        session = sessions[async_loop._loop]
+
+        # 文档中的示例
+        price = client.sync.yahoo_finance.get_stock_price("AAPL", "2024-01-01", "2024-02-01")
+        assert price["success"]
+        client.sync.close()
+
+        assert not session.closed
+        assert sessions[async_loop._loop] is session
+        assert async_loop.run(client.commodities.get_supported_commodities())["success"]
+        # close 之后同步调用启动新的后台循环
+        assert client.sync.commodities.get_supported_commodities()["success"]
+    finally:
+        client.sync.close()
+        async_loop.run(client.close())
+        async_loop.stop()
+
+
+class _Numbers:
+    def __init__(self):
+        self.closed = False
+
+    async def count(self, n):
+        try:
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+        finally:
+            self.closed = True
+
+
+class _Client:
+    def __init__(self):
+        self.numbers = _Numbers()
+
+    async def close_current_loop(self):
+        pass
+
+
+def test_async_generator_methods_become_blocking_iterators():
+    fake = _Client()
+    facade = SyncApiClient(fake)
+    try:
+        assert list(facade.numbers.count(3)) == [0, 1, 2]
+        assert fake.numbers.closed
+    finally:
+        facade.close()
+
+
+def test_async_generator_is_closed_when_consumer_stops_early():
+    fake = _Client()
+    facade = SyncApiClient(fake)
+    try:
+        for i in facade.numbers.count(100):
+            if i == 2:
+                break
+        assert fake.numbers.closed
+    finally:
+        facade.close()
@@ -0,0 +1,32 @@
+import json
+import threading
+
+from external_api.data_sources import tracing
+
+
+def test_file_exporter_writes_off_the_calling_thread(tmp_path, monkeypatch):
+    path = tmp_path / "spans.jsonl"
+    exporter = tracing.FileSpanExporter(str(path))
+    writer_threads = []
+    write = exporter._write
+
+    def recording_write(spans):
+        writer_threads.append(threading.current_thread())
+        write(spans)
+
+    monkeypatch.setattr(exporter, "_write", recording_write)
+    tracing.set_exporter(exporter)
+    try:
+        with tracing.span("parent", trace_id="trace-1"):
+            with tracing.span("child") as child:
+                child.add_phase("request", 0.01)
+        exporter.flush()
+    finally:
+        tracing.set_exporter(None)
+
+    assert writer_threads and all(t is not threading.current_thread() for t in writer_threads)
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [s["name"] for s in spans] == ["child", "parent"]
+    assert {s["trace_id"] for s in spans} == {"trace-1"}
+    assert spans[0]["parent_id"] == spans[1]["span_id"]
+    assert spans[0]["phases"] == {"request": 0.01}
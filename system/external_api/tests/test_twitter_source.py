@@ -0,0 +1,77 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from external_api.data_sources.twitter_source import TwitterSource
+
+CONFIG = {"timeout": 10, "external_api_proxy_url": "http://proxy", "twitter_base_url": "twitter"}
+
+
+async def _collect(aiter: Any) -> List[Any]:
+    return [item async for item in aiter]
+
+
+def _tweet_source(pages: Dict[Optional[str], Dict[str, Any]], requested: List[Optional[str]]) -> TwitterSource:
+    source = TwitterSource(CONFIG)
+
+    async def search_tweets(cursor: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
+        requested.append(cursor)
+        await asyncio.sleep(0)
+        return pages[cursor]
+
+    source.search_tweets = search_tweets  # type: ignore[method-assign]
+    return source
+
+
+def _tweets_page(ids: List[str], cursor: Optional[str]) -> Dict[str, Any]:
+    return {"success": True, "data": {"tweets": [{"id": i} for i in ids], "cursor": cursor}}
+
+
+def test_iter_tweets_prefetches_and_skips_duplicates():
+    requested: List[Optional[str]] = []
+    source = _tweet_source(
+        {
+            None: _tweets_page(["1", "2"], "c1"),
+            "c1": _tweets_page(["2", "3"], "c2"),
+            "c2": _tweets_page(["4"], None),
+        },
+        requested,
+    )
+
+    async def main():
+        tweets = source.iter_tweets("python")
+        first = await tweets.__anext__()
+        # 消费第一页时下一页已经在请求
+        await asyncio.sleep(0)
+        assert requested == [None, "c1"]
+        rest = await _collect(tweets)
+        return [first["id"]] + [tweet["id"] for tweet in rest]
+
+    assert asyncio.run(main()) == ["1", "2", "3", "4"]
+    assert requested == [None, "c1", "c2"]
+
+
+def test_iter_tweets_stops_at_max_items_without_extra_requests():
+    requested: List[Optional[str]] = []
+    source = _tweet_source({None: _tweets_page(["1", "2", "3"], "c1")}, requested)
+    tweets = asyncio.run(_collect(source.iter_tweets("python", max_items=2)))
+    assert [tweet["id"] for tweet in tweets] == ["1", "2"]
+    assert requested == [None]
+
+
+def test_iter_tweets_raises_on_failed_page_after_earlier_pages():
+    requested: List[Optional[str]] = []
+    source = _tweet_source(
+        {None: _tweets_page(["1"], "c1"), "c1": {"success": False, "error": "HTTP request error: 503"}},
+        requested,
+    )
+    yielded: List[str] = []
+
+    async def main():
+        async for tweet in source.iter_tweets("python"):
+            yielded.append(tweet["id"])
+
+    with pytest.raises(RuntimeError, match="503"):
+        asyncio.run(main())
+    assert yielded == ["1"]
@@ -0,0 +1,56 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict
+
+import pytest
+
+from external_api.data_sources.transport import HttpResponse, Transport
+from external_api.data_sources.yahoo_source import YahooFinanceSource
+
+# 2024-03-10 美东切换夏令时，三根日线都在当地时间 00:30，UTC 偏移由 -5h 变为 -4h
+DST_TIMESTAMPS = [1709875800, 1710131400, 1710217800]
+DST_DATES = ["2024-03-08", "2024-03-11", "2024-03-12"]
+
+
+class _ChartTransport(Transport):
+    def __init__(self, timestamps):
+        n = len(timestamps)
+        quote = {"open": [1.0] * n, "high": [2.0] * n, "low": [0.5] * n, "close": [1.5] * n, "volume": [100] * n}
+        self.body = json.dumps({"chart": {"result": [{"timestamp": timestamps, "indicators": {"quote": [quote]}}], "error": None}})
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        return HttpResponse(method, url, 200, "OK", {}, self.body.encode())
+
+    async def close(self) -> None:
+        pass
+
+    async def close_current_loop(self) -> None:
+        pass
+
+
+@pytest.fixture
+def new_york_tz(monkeypatch):
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _get_prices(output_format: str) -> Dict[str, Any]:
+    source = YahooFinanceSource({"timeout": 10, "external_api_proxy_url": "http://proxy", "yahoo_base_url": "yahoo"})
+    source.bind_transport(_ChartTransport(DST_TIMESTAMPS))
+    result = asyncio.run(source.get_stock_price("AAPL", "2024-03-01", "2024-03-15", output_format=output_format))
+    assert result["success"], result
+    return result["data"]["prices"]
+
+
+def test_output_formats_agree_on_dates_across_dst(new_york_tz):
+    records = _get_prices("records")
+    columns = _get_prices("numpy")
+    frame = _get_prices("pandas")
+
+    assert [price["date"] for price in records] == DST_DATES
+    assert [str(date) for date in columns["date"]] == DST_DATES
+    assert [date.strftime("%Y-%m-%d") for date in frame.index] == DST_DATES